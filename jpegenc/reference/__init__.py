@@ -0,0 +1,24 @@
+"""Software references of the encoder without the MyHDL dependency"""
+
+from __future__ import absolute_import
+
+from .color import ColorSpace
+from .dct import dct_1d_transformation, dct_2d_transformation
+from .zig_zag import (zig_zag_scan, zig_zag_indices, zig_zag_blocks,
+                      inverse_zig_zag_blocks)
+from .frontend import (frontend_transform, frontend_transform_blocks,
+                       image_to_blocks)
+from .backend import (BitWriter, dc_differences, divider, divider_blocks,
+                      entropy_encode, vli_encode, runlength, runlength_blocks,
+                      pack_bits, stuff_bytes, backend_ref)
+from .tables import get_table, get_table_array
+
+__all__ = [
+    'ColorSpace', 'dct_1d_transformation', 'dct_2d_transformation',
+    'zig_zag_scan', 'zig_zag_indices', 'zig_zag_blocks',
+    'inverse_zig_zag_blocks', 'frontend_transform',
+    'frontend_transform_blocks', 'image_to_blocks', 'BitWriter',
+    'dc_differences', 'divider', 'divider_blocks', 'entropy_encode',
+    'vli_encode', 'runlength', 'runlength_blocks',
+    'pack_bits', 'stuff_bytes', 'backend_ref', 'get_table', 'get_table_array'
+]
@@ -0,0 +1,528 @@
+"""software prototype for backend module"""
+
+import numpy as np
+
+from .tables import get_table, get_table_array, read_csv_table
+
+
+class BitWriter(object):
+    """Bit writer for the entropy coded data
+
+    The variable length codes are accumulated in an integer, the
+    whole bytes are moved to a bytearray and a zero byte is inserted
+    after each 0xFF byte when stuffing is enabled.
+    """
+
+    def __init__(self, stuffing=True):
+        self.data = bytearray()
+        self.stuffing = stuffing
+        # the bits which do not form a whole byte yet
+        self.bits = 0
+        self.pointer = 0
+
+    def write(self, code, size):
+        """Append the size lower bits of code, msb first"""
+        self.bits = (self.bits << size) | (code & ((1 << size) - 1))
+        self.pointer += size
+        while self.pointer >= 8:
+            self.pointer -= 8
+            byte = self.bits >> self.pointer
+            self.bits &= (1 << self.pointer) - 1
+            self.data.append(byte)
+            if byte == 0xFF and self.stuffing:
+                self.data.append(0)
+
+    def write_codes(self, codes, lengths):
+        """Append arrays of codes at once, the vectorized write
+
+        The codes are packed with pack_bits after the bits which do not
+        form a whole byte yet, the bits of the last partial byte are
+        kept for the next write.
+        """
+        codes = np.asarray(codes, dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if self.pointer:
+            codes = np.concatenate(([self.bits], codes))
+            lengths = np.concatenate(([self.pointer], lengths))
+        total = int(lengths.sum())
+        data = pack_bits(codes, lengths, pad_bit=0)
+        self.pointer = total % 8
+        if self.pointer:
+            self.bits = data[-1] >> (8 - self.pointer)
+            data = data[:-1]
+        else:
+            self.bits = 0
+        if self.stuffing:
+            data = stuff_bytes(data)[0]
+        self.data.extend(data)
+
+    def flush(self, pad_bit=1):
+        """Pad the remaining bits to a whole byte"""
+        if self.pointer:
+            pad_size = 8 - self.pointer
+            self.write((1 << pad_size) - 1 if pad_bit else 0, pad_size)
+
+    def take_bytes(self):
+        """Return the whole bytes written so far and remove them from
+        the writer"""
+        output = bytes(self.data)
+        del self.data[:]
+        return output
+
+    def getvalue(self):
+        """Return the whole bytes written so far"""
+        return bytes(self.data)
+
+
+def build_rom_tables(csvfile):
+    """build huffman tables"""
+    return tuple(row[0] for row in read_csv_table(csvfile))
+
+
+def build_huffman_rom_tables(csvfile):
+    """build huffman tables"""
+    rows = read_csv_table(csvfile)
+    code = tuple(row[0] for row in rows)
+    size = tuple(row[1] for row in rows)
+    return code, size
+
+
+def divider_ref(dividend, divisor):
+    """software implementation of divider"""
+    divisor_reciprocal = get_table('reciprocals')[divisor]
+    if dividend < 0:
+        dividend_d1 = -dividend
+    else:
+        dividend_d1 = dividend
+    mult = (dividend_d1 * divisor_reciprocal)
+    mult_s = mult/(2**16)
+    if dividend < 0:
+        mult_s = -mult_s
+    round_ = int((mult/(2**15)) % 2)
+    if round_ == 1:
+        if dividend >= 0:
+            mult_s = mult_s + 1
+        else:
+            mult_s = int(mult_s - 1)
+    return int(mult_s)
+
+
+def divider(block, color_component):
+    """divider reference module"""
+    block_out = [0]*64
+    rom_tables = get_table('quant_tables')
+
+    if color_component <= 1:
+        flag = 0
+    else:
+        flag = 1
+
+    for i in range(64):
+        block_out[i] = divider_ref(block[i], rom_tables[i+flag*64])
+
+    return block_out
+
+
+def divider_blocks(blocks, color_component, rom_tables=None):
+    """vectorized divider reference module
+
+    Quantize the blocks with the reciprocal ROM of the divider module,
+    each block gives the same result as divider.
+
+    Arguments:
+        blocks: integer array of shape (nblocks, 64)
+        color_component: the color component of all the blocks or an
+            array with the color component of each block
+        rom_tables: optional (2, 64) array with the luminance and the
+            chrominance tables (1 - 255), defaults to the quantizer ROM
+
+    Returns:
+        integer array of shape (nblocks, 64)
+    """
+    blocks = np.asarray(blocks, dtype=np.int64)
+    if rom_tables is None:
+        rom_tables = get_table_array('quant_tables')[:128].reshape(2, 64)
+    rom_tables = np.asarray(rom_tables)
+    flag = (np.asarray(color_component) > 1).astype(int)
+    divisors = rom_tables[flag]
+    if divisors.ndim == 2:
+        divisors = divisors.reshape(blocks.shape)
+    mult = np.abs(blocks) * get_table_array('reciprocals')[divisors]
+    quotient = (mult >> 16) + ((mult >> 15) & 1)
+    return np.where(blocks < 0, -quotient, quotient)
+
+
+def entropy_encode(amplitude):
+    """ Model of the entropy encoding
+
+    Arguments:
+        amplitude (int): given an integer generate the encoding
+
+    Returns:
+        amplitude_ref:
+        size_ref:
+    """
+    if amplitude >= 0:
+        amplitude_ref = amplitude
+        size_ref = amplitude.bit_length()
+    else:
+        amplitude_ref = amplitude - 1
+        size_ref = abs(amplitude).bit_length()
+
+    return amplitude_ref, size_ref
+
+
+def runlength(block, color_component, prev_dc_0, prev_dc_1, prev_dc_2):
+    """reference for runlength encoder module"""
+    output = []
+    accumulator = []
+    flag = 0
+    zero_count = 0
+
+    for i in range(64):
+        if i == 0:
+            if (color_component == 1) or (color_component == 0):
+                accumulator.append(block[i] - prev_dc_0)
+                output.append(0)
+                prev_dc_0 = block[i]
+
+            elif color_component == 2:
+                accumulator.append(block[i] - prev_dc_1)
+                output.append(0)
+                prev_dc_1 = block[i]
+
+            elif color_component == 3:
+                accumulator.append(block[i] - prev_dc_2)
+                output.append(0)
+                prev_dc_2 = block[i]
+            else:
+                pass
+        else:
+            if block[i] == 0:
+                zero_count = zero_count + 1
+            else:
+                if zero_count <= 15:
+                    output.append(zero_count)
+                    accumulator.append(block[i])
+                    zero_count = 0
+                else:
+                    accumulator.append(0)
+                    output.append(15)
+                    data = block[i]
+                    zero_count = zero_count - 15
+                    flag = 1
+
+            while flag == 1:
+                if zero_count <= 15:
+                    accumulator.append(data)
+                    output.append(zero_count)
+                    zero_count = 0
+                    flag = 0
+                else:
+                    accumulator.append(0)
+                    output.append(15)
+                    zero_count = zero_count - 15
+
+            if i == 63:
+                if zero_count != 0:
+                    accumulator.append(0)
+                    output.append(0)
+
+    return (output, accumulator, prev_dc_0, prev_dc_1, prev_dc_2)
+
+
+def runlength_blocks(blocks, color_component, prev_dc=(0, 0, 0), zrl_run=15):
+    """vectorized runlength and entropy_encode reference
+
+    The symbols of all the blocks are extracted at once. The DC
+    predictors are selected as in runlength, color components 0 and 1
+    use the first predictor, 2 the second and 3 the third. A ZRL is the
+    symbol (15, 0), by default it stands for 15 zeros as in runlength and
+    the runlength module, zrl_run=16 gives the ZRL of the JPEG standard.
+    EOB (0, 0) ends each block with a zero last coefficient.
+
+    Arguments:
+        blocks: integer array of shape (nblocks, 64)
+        color_component: the color component of all the blocks or an
+            array with the color component of each block
+        prev_dc: the three DC predictors before the first block
+        zrl_run: the zeros of a ZRL symbol, 15 or 16
+
+    Returns:
+        (runs, sizes, amplitudes, block_offsets, prev_dc) the run, the
+        size and the VLI bits of each symbol, the symbols of block i are
+        at block_offsets[i]:block_offsets[i + 1] and prev_dc the updated
+        predictors
+    """
+    blocks = np.asarray(blocks, dtype=np.int64).reshape(-1, 64)
+    nblocks = blocks.shape[0]
+    predictor = np.maximum(np.asarray(color_component) - 1, 0)
+    predictor = np.broadcast_to(predictor, (nblocks,))
+
+    dc_diff, prev_dc = dc_differences(blocks[:, 0], predictor, prev_dc)
+
+    # the zeros before each non-zero AC coefficient
+    nonzero_block, position = np.nonzero(blocks[:, 1:])
+    position += 1
+    prev_position = np.empty_like(position)
+    prev_position[:1] = 0
+    prev_position[1:] = position[:-1]
+    prev_position[np.diff(nonzero_block, prepend=-1) != 0] = 0
+    run = position - prev_position - 1
+    num_zrl = np.maximum((run - 16 + zrl_run) // zrl_run, 0)
+    run -= num_zrl * zrl_run
+
+    # the number of symbols of each block: DC, ZRLs and coefficients, EOB
+    eob = blocks[:, 63] == 0
+    counts = 1 + eob + np.bincount(nonzero_block, weights=num_zrl + 1,
+                                   minlength=nblocks).astype(np.int64)
+    block_offsets = np.zeros(nblocks + 1, dtype=np.int64)
+    np.cumsum(counts, out=block_offsets[1:])
+
+    # the symbols of the coefficients follow their ZRLs, the rest are ZRL
+    symbol_end = np.cumsum(num_zrl + 1)
+    block_start = np.searchsorted(nonzero_block, np.arange(nblocks))
+    block_end = np.concatenate(([0], symbol_end))[block_start]
+    coeff_index = (block_offsets[nonzero_block] + symbol_end -
+                   block_end[nonzero_block])
+
+    total = block_offsets[-1]
+    runs = np.full(total, 15, dtype=np.int64)
+    values = np.zeros(total, dtype=np.int64)
+    runs[block_offsets[:-1]] = 0
+    values[block_offsets[:-1]] = dc_diff
+    runs[coeff_index] = run
+    values[coeff_index] = blocks[nonzero_block, position]
+    runs[block_offsets[1:][eob] - 1] = 0
+
+    sizes, amplitudes = vli_encode(values)
+    return runs, sizes, amplitudes, block_offsets, prev_dc
+
+
+def dc_differences(dc, predictor, prev_dc=(0, 0, 0)):
+    """vectorized DC prediction
+
+    Arguments:
+        dc: the DC coefficient of each block
+        predictor: the DC predictor (0 - 2) of each block
+        prev_dc: the three DC predictors before the first block
+
+    Returns:
+        (dc_diff, prev_dc) the difference with the previous block of
+        the same predictor and the updated predictors
+    """
+    dc = np.asarray(dc, dtype=np.int64)
+    dc_diff = np.empty(len(dc), dtype=np.int64)
+    prev_dc = list(prev_dc)
+    for index in range(3):
+        selected = np.flatnonzero(predictor == index)
+        if selected.size:
+            dc_selected = dc[selected]
+            dc_diff[selected] = np.diff(dc_selected, prepend=prev_dc[index])
+            prev_dc[index] = int(dc_selected[-1])
+    return dc_diff, tuple(prev_dc)
+
+
+def vli_encode(values):
+    """vectorized entropy_encode
+
+    Returns:
+        (sizes, amplitudes) the size and the VLI bits of each value,
+        negative values are coded as value - 1
+    """
+    sizes = np.frexp(np.abs(values))[1].astype(np.int64)
+    amplitudes = np.where(values < 0, values - 1, values) & ((1 << sizes) - 1)
+    return sizes, amplitudes
+
+
+def pack_bits(codes, lengths, pad_bit=1):
+    """vectorized BitWriter
+
+    Pack the codes msb first in bytes without byte stuffing, the last
+    byte is padded with pad_bit.
+
+    Arguments:
+        codes: integer array with the codes
+        lengths: integer array with the number of bits of each code
+
+    Returns:
+        bytes
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    ends = np.cumsum(lengths)
+    total = int(ends[-1]) if ends.size else 0
+    starts = ends - lengths
+    bit_array = np.full(-(-total // 8) * 8, pad_bit, dtype=np.uint8)
+    for k in range(int(lengths.max()) if lengths.size else 0):
+        valid = lengths > k
+        bit_array[starts[valid] + k] = (
+            codes[valid] >> (lengths[valid] - 1 - k)) & 1
+    return np.packbits(bit_array).tobytes()
+
+
+def table_huff_gen(filename, base):
+    """huffman table generator"""
+    code, size = build_huffman_rom_tables(filename)
+    rom_code_size = len(code)
+    rom_code = [0 for _ in range(rom_code_size)]
+    rom_code = [int(code[0], base)] + [int(
+        code[ii+1], base) for ii in range(rom_code_size-1)]
+    rom_code = tuple(rom_code)
+    rom_depth = len(size)
+    rom_size = [0 for _ in range(rom_depth)]
+    rom_size = [int(size[0])] + [int(size[ii+1]) for ii in range(rom_depth-1)]
+    rom_size = tuple(rom_size)
+    return rom_size, rom_code
+
+
+def huffman_ref(
+        runlength_block, amplitude_block, size_block,
+        color_component, register, pointer):
+    """reference model for huffman encoder
+
+    The register is either a string of bits or a BitWriter, the codes
+    are written in the BitWriter and its pointer is returned.
+    """
+
+    size_ac, code_ac = get_table('ac_rom')
+    size_ac_cr, code_ac_cr = get_table('ac_cr_rom')
+    size_dc, code_dc = get_table('dc_rom')
+    size_dc_cr, code_dc_cr = get_table('dc_cr_rom')
+
+    for i in range(len(runlength_block)):
+
+        temp1 = format(runlength_block[i], '04b')
+        temp2 = format(size_block[i], '04b')
+        temp = temp1 + temp2
+        temp_int = int(temp, 2)
+
+        if i == 0:
+            if color_component < 2:
+                vlc_size_ref = size_dc[temp_int]
+                vlc_ref = code_dc[temp_int]
+            else:
+                vlc_size_ref = size_dc_cr[temp_int]
+                vlc_ref = code_dc_cr[temp_int]
+
+        else:
+            if color_component < 2:
+                vlc_size_ref = size_ac[temp_int]
+                vlc_ref = code_ac[temp_int]
+            else:
+                vlc_size_ref = size_ac_cr[temp_int]
+                vlc_ref = code_ac_cr[temp_int]
+
+        if isinstance(register, BitWriter):
+            register.write(vlc_ref, vlc_size_ref)
+            if size_block[i] != 0:
+                register.write(amplitude_block[i], size_block[i])
+            continue
+
+        vlc_size_ref_s = str(0) + str(vlc_size_ref) + 'b'
+        vlc_ref_s = format(vlc_ref, vlc_size_ref_s)
+
+        register = register + vlc_ref_s
+        pointer = pointer + int(vlc_size_ref)
+
+        size_s = str(0) + str(size_block[i]) + 'b'
+        if size_block[i] != 0:
+            vli = format(amplitude_block[i], size_s)
+            register = register + vli
+            pointer = pointer + int(size_block[i])
+
+    if isinstance(register, BitWriter):
+        pointer = register.pointer
+    return register, pointer
+
+
+def huffman_final(register, pointer):
+    """divide huffman code into bytes"""
+    output_huff = []
+    num_data_writes = int(pointer/8)
+    pointer = pointer - num_data_writes*8
+    k = 0
+    while num_data_writes > 0:
+        output_huff.append(register[k:k+8])
+        register = register[k+8:]
+        num_data_writes = num_data_writes - 1
+
+    return output_huff, register, pointer
+
+
+def bytestuffer(block):
+    """bytestuffer reference module"""
+    output = []
+    for byte in block:
+        output.append(byte)
+        if int(byte, 2) == 255:
+            output.append(str('0b0'))
+    return output
+
+
+def stuff_bytes(data, out=None):
+    """Insert a zero byte after each 0xFF byte of the data
+
+    Arguments:
+        data: bytes, bytearray or memoryview with the entropy coded data
+        out: optional preallocated bytearray, the stuffed data is
+            written at its start without an intermediate copy
+
+    Returns:
+        (buffer, num_stuffed) the stuffed data (or out) and the number
+        of the inserted zero bytes
+    """
+    if out is None:
+        data = bytes(data)
+        return data.replace(b'\xff', b'\xff\x00'), data.count(b'\xff')
+
+    source = np.frombuffer(data, np.uint8)
+    target = np.frombuffer(out, np.uint8)
+    # the end of each run of bytes which is followed by a zero byte
+    ends = np.flatnonzero(source == 0xFF) + 1
+    num_stuffed = len(ends)
+    if len(target) < len(source) + num_stuffed:
+        raise ValueError("output buffer of {} bytes is smaller than {} "
+                         "bytes".format(len(target),
+                                        len(source) + num_stuffed))
+    start = 0
+    for shift, end in enumerate(ends.tolist()):
+        target[start+shift:end+shift] = source[start:end]
+        target[end+shift] = 0
+        start = end
+    target[start+num_stuffed:len(source)+num_stuffed] = source[start:]
+    return out, num_stuffed
+
+
+def backend_ref(
+        block, prev_dc_0, prev_dc_1, prev_dc_2,
+        register, color_component, pointer):
+    """backend reference module
+
+    When the register is a BitWriter the stuffed bytes of the block are
+    returned as bytes, otherwise the register is a string of bits and
+    the output is a list of strings of bits.
+    """
+    accumulator = []
+    output = []
+    block_rle_in = [0]*64
+    block_rle_in = divider(block, color_component)
+    output, accumulator, prev_dc_0, prev_dc_1, prev_dc_2 = runlength(
+        block_rle_in, 1, prev_dc_0, prev_dc_1, prev_dc_2)
+    amplitude = []
+    size = []
+    for i in range(len(accumulator)):
+        amplitude_temp, size_temp = entropy_encode(accumulator[i])
+        amplitude.append(amplitude_temp)
+        size.append(size_temp)
+
+    output_huff = []
+    output_final = []
+    register, pointer = huffman_ref(
+        output, amplitude, size, color_component, register, pointer)
+    if isinstance(register, BitWriter):
+        output_final = register.take_bytes()
+        return prev_dc_0, prev_dc_1, prev_dc_2, register, pointer, output_final
+    output_huff, register, pointer = huffman_final(register, pointer)
+    output_final = bytestuffer(output_huff)
+    return prev_dc_0, prev_dc_1, prev_dc_2, register, pointer, output_final
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Software reference of the color space conversion"""
+
+import numpy as np
+
+
+class ColorSpace(object):
+
+    """Color Space Conversion Class
+
+    It is used to derive the integer coefficients
+    and as a software reference for the conversion
+    """
+
+    # coefficients used by the array conversion, see _get_jfif_coefs_array
+    _jfif_coefs_array = None
+
+    def __init__(self, red=0, green=0, blue=0):
+        """Instance variables"""
+        self.red = red
+        self.green = green
+        self.blue = blue
+        # setup the constant coefficients for YCbCr
+        self._set_jfif_coefs()
+
+    def _set_jfif_coefs(self):
+        """The YCbCr special constants
+
+        The JFIF YCbCr conversion requires "special" constants defined
+        by the standard.  The constants are describe in a Wikipedia page:
+        https://en.wikipedia.org/wiki/YCbCr
+        """
+        self.ycbcr_coef_mat = np.array([
+            [0.2999, 0.5870, 0.1140],     # Y coefficients
+            [-0.1687, -0.3313, 0.5000],   # Cb coefficients
+            [0.5000, -0.4187, -0.0813],   # Cr coefficients
+        ])
+        self.offset = np.array([0, 128, 128])
+
+    def get_jfif_ycbcr(self):
+        """RGB to YCbCr Conversion. Used as software reference."""
+        rgb = np.array([self.red, self.green, self.blue])
+        rgb = rgb[np.newaxis, :].transpose()
+        offset = self.offset[np.newaxis, :].transpose()
+        cmat = self.ycbcr_coef_mat
+        ycbcr = np.dot(cmat, rgb) + offset
+        ycbcr = np.rint(ycbcr)
+        return ycbcr.astype(int)
+
+    def get_jfif_ycbcr_int_coef(self, precision_factor=0):
+        """Generate the integer (fixed-point) coefficients"""
+        cmat = self.ycbcr_coef_mat
+        cmat_ab = np.absolute(cmat)
+        int_coef = cmat_ab * (2**precision_factor)
+        int_coef = np.rint(int_coef)
+        int_coef = int_coef.astype(int)
+        int_offset = np.rint(self.offset * (2**precision_factor))
+        int_offset = int_offset.astype(int)
+        return int_coef.tolist(), int_offset.tolist()
+
+    @classmethod
+    def _get_jfif_coefs_array(cls):
+        """The transposed coefficient matrix and the offset, built once"""
+        if cls._jfif_coefs_array is None:
+            color_space = cls()
+            cmat_t = color_space.ycbcr_coef_mat.T.copy()
+            offset = color_space.offset.astype(float)
+            cmat_t.flags.writeable = False
+            offset.flags.writeable = False
+            cls._jfif_coefs_array = cmat_t, offset
+        return cls._jfif_coefs_array
+
+    @classmethod
+    def _convert_pixels(cls, pixels, ycbcr):
+        """Convert (n, 3) pixels in the float (n, 3) array ycbcr"""
+        cmat_t, offset = cls._get_jfif_coefs_array()
+        np.dot(pixels, cmat_t, out=ycbcr)
+        ycbcr += offset
+        ties = np.abs(ycbcr - np.floor(ycbcr) - 0.5) < 1e-6
+        ties = np.nonzero(ties.any(axis=1))[0]
+        np.rint(ycbcr, out=ycbcr)
+        if len(ties) > 0:
+            colors, index = np.unique(pixels[ties], axis=0,
+                                      return_inverse=True)
+            exact = [cls(*color).get_jfif_ycbcr()[:, 0]
+                     for color in colors.tolist()]
+            ycbcr[ties] = np.array(exact)[index.reshape(-1)]
+
+    @classmethod
+    def get_jfif_ycbcr_array(cls, rgb, out=None, chunk_size=4096):
+        """RGB to YCbCr Conversion of a whole (..., 3) array
+
+        All the pixels are converted with one matrix product and the
+        result is rounded as get_jfif_ycbcr does. The few values which
+        lie exactly on a .5 boundary round differently depending on the
+        order the products are summed, those pixels are converted again
+        with get_jfif_ycbcr.
+
+        Arguments:
+            rgb: array of shape (..., 3) with the red, green and blue
+                values, e.g. a uint8 HxWx3 frame
+            out: optional contiguous integer array with the shape of
+                `rgb` where the Y, Cb and Cr values are written, the
+                pixels are then converted in chunks of chunk_size
+                pixels and no array of the size of the frame is
+                allocated
+
+        Returns:
+            The YCbCr array, `out` when it is given
+        """
+        rgb = np.asarray(rgb)
+        if rgb.shape[-1:] != (3,):
+            raise ValueError("expected an (..., 3) array, got shape {}".format(
+                rgb.shape))
+        pixels = rgb.reshape(-1, 3)
+        if out is None:
+            ycbcr = np.empty(pixels.shape)
+            cls._convert_pixels(pixels, ycbcr)
+            return ycbcr.astype(int).reshape(rgb.shape)
+
+        if out.shape != rgb.shape:
+            raise ValueError("out has shape {}, expected {}".format(
+                out.shape, rgb.shape))
+        if not out.flags.c_contiguous:
+            raise ValueError("out is not a contiguous array")
+        out_pixels = out.reshape(-1, 3)
+        scratch = np.empty((min(chunk_size, len(pixels)), 3))
+        for start in range(0, len(pixels), chunk_size):
+            stop = min(start + chunk_size, len(pixels))
+            ycbcr = scratch[:stop - start]
+            cls._convert_pixels(pixels[start:stop], ycbcr)
+            np.copyto(out_pixels[start:stop], ycbcr, casting='unsafe')
+        return out
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Software references of the 1D-DCT and the 2D-DCT"""
+
+from math import sqrt, pi, cos
+
+import numpy as np
+
+
+class dct_1d_transformation(object):
+
+    """1D-DCT Transformation Class
+
+    It is used to derive the integer coefficient matrix
+    and as a software reference for the 1D-DCT Transformation.
+    """
+
+    def __init__(self, N):
+        """Initialize the DCT coefficient matrix"""
+        self.coeff_matrix = self.build_matrix(N)
+
+    def build_matrix(self, N):
+        """Create the coefficient NxN matrix"""
+        const = sqrt(2.0 / 8)
+        a0 = sqrt(1.0 / 2.0)
+        ak  = 1
+        coeff_matrix = []
+        for i in range(N):
+            row = []
+            for j in range(N):
+                if i == 0:
+                    coeff = const * a0 * cos(((2 * j + 1) * pi * i) / (2 * N))
+                else:
+                    coeff = const * ak * cos(((2 * j + 1) * pi * i) / (2 * N))
+                row.append(coeff)
+            coeff_matrix.append(row)
+        return coeff_matrix
+
+    def dct_1d_transformation(self, vector):
+        """1D-DCT software reference"""
+        vector_t = np.transpose(vector)
+        dct_result = np.dot(self.coeff_matrix, vector_t)
+        dct_result = np.rint(dct_result)
+        dct_result = dct_result.astype(int)
+        dct_result = dct_result.tolist()
+        return dct_result
+
+    def dct_int_coeffs(self, precision_factor):
+        """Transform coeff matrix to integer coefficients"""
+        coeff_matrix = np.asarray(self.coeff_matrix)
+        coeff_matrix = coeff_matrix * (2**precision_factor)
+        coeff_matrix = np.rint(coeff_matrix)
+        coeff_matrix = coeff_matrix.astype(int)
+        coeff_matrix = coeff_matrix.tolist()
+        return coeff_matrix
+
+    def dct_1d_fixed_point(self, vectors, num_fractional_bits=14,
+                           out_precision=10):
+        """Bit-exact software model of the dct_1d module
+
+        The model uses the integer coefficients and the rounding of
+        the dct_1d module, the outputs are the values of the out_sigs
+        of the module.
+
+        Arguments:
+            vectors: integer array of shape (..., N), any number of
+                input vectors are transformed in one call
+            num_fractional_bits, out_precision: the parameters of the
+                dct_1d module
+
+        Returns:
+            integer array of shape (..., N)
+        """
+        coeff_matrix = np.array(self.dct_int_coeffs(num_fractional_bits),
+                                dtype=np.int64)
+        vectors = np.asarray(vectors, dtype=np.int64)
+        products_sum = np.matmul(vectors, coeff_matrix.T)
+        return fixed_point_round(products_sum, num_fractional_bits,
+                                 out_precision)
+
+
+def fixed_point_round(value, fract_bits, out_precision):
+    """Rounding of the dct_1d accumulators to the output precision
+
+    The dct_1d module keeps the bits [fract_bits + out_precision + 1:
+    fract_bits] of the accumulator as a signed number and adds the
+    bit fract_bits - 1 to round it.
+
+    Arguments:
+        value: integer array with the accumulator values
+        fract_bits: the fractional bits of the coefficients
+        out_precision: the output precision of the module
+    """
+    out_range = 1 << out_precision
+    result = (value >> fract_bits) & (2 * out_range - 1)
+    result = np.where(result >= out_range, result - 2 * out_range, result)
+    return result + ((value >> (fract_bits - 1)) & 1)
+
+
+class dct_2d_transformation(object):
+
+    """2D-DCT Transformation Class
+
+    It is used as a software reference for the 2D-DCT
+    Transformation
+    """
+
+    def __init__(self, N):
+        """Initialize the DCT coefficient matrix"""
+        self.N = N
+        self.coeff_matrix = self.build_matrix(N)
+        self.coeff_array = np.array(self.coeff_matrix)
+        self.coeff_array.flags.writeable = False
+
+    def build_matrix(self, N):
+        """Create the NxN coefficient matrix"""
+        const = sqrt(2.0 / 8)
+        a0 = sqrt(1.0 / 2.0)
+        ak = 1
+        coeff_matrix = []
+        for i in range(N):
+            row = []
+            for j in range(N):
+                if i == 0:
+                    coeff = const * a0 * cos(((2 * j + 1) * pi * i) / (2 * N))
+                else:
+                    coeff = const * ak * cos(((2 * j + 1) * pi * i) / (2 * N))
+                row.append(coeff)
+            coeff_matrix.append(row)
+        return coeff_matrix
+
+    def dct_2d_transformation(self, block):
+        """2D-DCT software reference"""
+        dct_result = self.dct_2d_transformation_blocks(np.asarray(block)[None])
+        return dct_result[0].tolist()
+
+    def dct_2d_transformation_blocks(self, blocks, dtype=np.float64):
+        """Batched 2D-DCT software reference
+
+        All the blocks are transformed at once, the result of each block
+        is the same as the result of dct_2d_transformation.
+
+        Arguments:
+            blocks: array of shape (nblocks, N, N) with the input pixels
+                (0 - 255)
+            dtype: the floating point type of the computations, with
+                float32 the results may differ by one from the reference
+                when the intermediate values are close to .5
+
+        Returns:
+            integer array of shape (nblocks, N, N)
+        """
+        coeff_matrix = self.coeff_array.astype(dtype, copy=False)
+        blocks = np.asarray(blocks, dtype=dtype) - 128
+        # first 1d-dct with rows
+        dct_result = np.rint(np.einsum('ij,nkj->nik', coeff_matrix, blocks))
+        # second 1d-dct with columns
+        dct_result = np.rint(np.einsum('ij,nkj->nik', coeff_matrix,
+                                       dct_result))
+        return dct_result.astype(int)
+
+    def dct_2d_fixed_point(self, blocks, num_fractional_bits=14,
+                           stage_1_prec=10, out_prec=10):
+        """Bit-exact software model of the dct_2d module
+
+        The 1st stage 1d-dct transforms the rows of each block and the
+        2nd stage the columns, with the integer arithmetic of the
+        dct_1d module. The 1st stage rounds the accumulators to
+        stage_1_prec fractional bits and the 2nd stage to out_prec
+        fractional bits, as the dct_1d instances of the dct_2d module.
+
+        Arguments:
+            blocks: integer array of shape (nblocks, N, N) or (N, N)
+                with the input pixels (0 - 255)
+            num_fractional_bits, stage_1_prec, out_prec: the
+                parameters of the dct_2d module
+
+        Returns:
+            integer array with the shape of blocks, element [k][i] of
+            a block is the out_sigs[k * N + i] signal of the module
+        """
+        dct_obj = dct_1d_transformation(self.N)
+        blocks = np.asarray(blocks, dtype=np.int64) - 128
+        # 1st stage 1d-dct of the rows
+        dct_result = dct_obj.dct_1d_fixed_point(blocks, num_fractional_bits,
+                                                stage_1_prec)
+        # 2nd stage 1d-dct of the columns
+        dct_result = dct_obj.dct_1d_fixed_point(
+            np.swapaxes(dct_result, -1, -2), num_fractional_bits,
+            out_prec)
+        return np.swapaxes(dct_result, -1, -2)
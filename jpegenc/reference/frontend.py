@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Software reference of the frontend"""
+
+from itertools import chain
+
+import numpy as np
+
+from .color import ColorSpace
+from .dct import dct_2d_transformation
+from .zig_zag import zig_zag_scan, zig_zag_blocks
+
+
+def frontend_transform(blockr, blockg, blockb, N=8):
+    """Software implementation of the frontend part"""
+    ycbcr_blocks = [[[] for _ in range(N)] for _ in range(3)]
+    dct_blocks, dct_blocks_linear, zig_zag_blocks = [[] for _ in range(3)]
+
+    """Color space conversion"""
+    for i in range(N):
+        for j in range(N):
+            red = blockr[i][j]
+            green = blockg[i][j]
+            blue = blockb[i][j]
+            color_convert_obj = ColorSpace(red, green, blue)
+            ycbcr = color_convert_obj.get_jfif_ycbcr()
+            ycbcr = ycbcr.tolist()
+            for k in range(3):
+                ycbcr_blocks[k][i].append(ycbcr[k][0])
+
+    for i in range(3):
+        """dct-2d transformation"""
+        dct_blocks.append(dct_2d_transformation(N).dct_2d_transformation(ycbcr_blocks[i]))
+        """dct blocks to linear lists"""
+        dct_blocks_linear.append(list(chain.from_iterable(dct_blocks[i])))
+        """zig zag scan"""
+        zig_zag_blocks.append(zig_zag_scan(N).zig_zag(dct_blocks_linear[i]))
+
+    return zig_zag_blocks
+
+
+def image_to_blocks(image, N=8):
+    """Split an HxWx3 image in a (nblocks, N, N, 3) stack of blocks
+
+    The blocks are ordered row by row and from left to right, the
+    order the blocks are streamed into the frontend. The height and
+    the width of the image must be multiples of N.
+    """
+    image = np.asarray(image)
+    if image.ndim != 3 or image.shape[2] != 3:
+        raise ValueError("expected an HxWx3 image, got shape {}".format(
+            image.shape))
+    height, width = image.shape[:2]
+    if height % N or width % N:
+        raise ValueError("image size {}x{} is not a multiple of {}".format(
+            width, height, N))
+    blocks = image.reshape(height // N, N, width // N, N, 3)
+    blocks = blocks.transpose(0, 2, 1, 3, 4)
+    return blocks.reshape(-1, N, N, 3)
+
+
+def frontend_transform_blocks(blocks, N=8):
+    """Vectorized software implementation of the frontend part
+
+    All the blocks are processed at once with array operations, the
+    result is identical to calling frontend_transform for each block.
+
+    Arguments:
+        blocks: an HxWx3 image or a (nblocks, N, N, 3) stack of RGB
+            blocks
+
+    Returns:
+        (nblocks, 3, N**2) integer array with the zig-zag scanned Y,
+        Cb and Cr coefficients of each block
+    """
+    blocks = np.asarray(blocks)
+    if blocks.ndim == 3:
+        blocks = image_to_blocks(blocks, N)
+    if blocks.ndim != 4 or blocks.shape[1:] != (N, N, 3):
+        raise ValueError("expected an (nblocks, {0}, {0}, 3) array, "
+                         "got shape {1}".format(N, blocks.shape))
+    nblocks = blocks.shape[0]
+
+    """Color space conversion"""
+    ycbcr = ColorSpace.get_jfif_ycbcr_array(blocks)
+    # one NxN block for each color component
+    ycbcr = ycbcr.transpose(0, 3, 1, 2).reshape(-1, N, N)
+
+    """dct-2d transformation"""
+    dct_obj = dct_2d_transformation(N)
+    dct_result = dct_obj.dct_2d_transformation_blocks(ycbcr)
+    dct_result = dct_result.reshape(-1, N**2)
+
+    """zig zag scan"""
+    zig_zag_result = zig_zag_blocks(dct_result, N)
+
+    return zig_zag_result.reshape(nblocks, 3, N**2)
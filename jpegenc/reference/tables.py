@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Cached ROM tables of the encoder
+
+The csv files of the huffman and quantizer tables are package resources
+of jpegenc, they are parsed once per process and the tables are shared
+by the ROM modules and the software references, from any working
+directory. The tables are returned as tuples, which are used as ROMs in
+the MyHDL modules, or as read-only ndarrays.
+"""
+
+import csv
+import io
+import os
+import pkgutil
+
+import numpy as np
+
+_csv_tables = {}
+_csv_resources = {}
+_tables = {}
+_table_arrays = {}
+
+
+def read_csv_table(csvfile):
+    """Read a csv file once and return its rows as tuples of strings
+
+    The file is read again when its modification time or its size
+    changes.
+    """
+    csvfile = os.path.abspath(csvfile)
+    stat = os.stat(csvfile)
+    key = (csvfile, stat.st_mtime, stat.st_size)
+    if key not in _csv_tables:
+        with open(csvfile, 'r') as csvfp:
+            csvreader = csv.reader(csvfp, delimiter=',')
+            _csv_tables[key] = tuple(tuple(row) for row in csvreader)
+    return _csv_tables[key]
+
+
+def read_csv_resource(resource):
+    """Read a csv file of the jpegenc package once and return its rows
+    as tuples of strings
+
+    Arguments:
+        resource: '/' separated path relative to the jpegenc package,
+            e.g. 'subblocks/huffman/ac_rom.csv'
+    """
+    if resource not in _csv_resources:
+        data = pkgutil.get_data('jpegenc', resource)
+        if data is None:
+            raise IOError("resource {} not found".format(resource))
+        csvreader = csv.reader(io.StringIO(data.decode('ascii')),
+                               delimiter=',')
+        _csv_resources[resource] = tuple(tuple(row) for row in csvreader)
+    return _csv_resources[resource]
+
+
+def reciprocal_rom(rom_size=2**8):
+    """Build the reciprocal ROM of the divider"""
+    rom = [0] + [int(round(((2**16)-1)/float(ii)))
+                 for ii in range(1, rom_size)]
+    return tuple(rom)
+
+
+def _huffman_table(filename, base):
+    """Return the sizes and the codes of a huffman table"""
+    rows = read_csv_resource('subblocks/huffman/' + filename)
+    rom_size = tuple(int(row[1]) for row in rows)
+    rom_code = tuple(int(row[0], base) for row in rows)
+    return rom_size, rom_code
+
+
+def _quant_tables():
+    """Return the luminance and the chrominance quantization tables"""
+    rows = read_csv_resource('subblocks/quantizer/quant_tables.csv')
+    return tuple(int(row[0]) for row in rows)
+
+
+_table_builders = {
+    'ac_rom': lambda: _huffman_table('ac_rom.csv', 2),
+    'ac_cr_rom': lambda: _huffman_table('ac_cr_rom.csv', 2),
+    'dc_rom': lambda: _huffman_table('dc_rom.csv', 10),
+    'dc_cr_rom': lambda: _huffman_table('dc_cr_rom.csv', 2),
+    'quant_tables': _quant_tables,
+    'reciprocals': reciprocal_rom,
+}
+
+
+def get_table(name):
+    """Return the table with the given name
+
+    The huffman tables ('ac_rom', 'ac_cr_rom', 'dc_rom', 'dc_cr_rom')
+    are (sizes, codes) pairs of tuples, 'quant_tables' and
+    'reciprocals' are tuples.
+    """
+    if name not in _tables:
+        if name not in _table_builders:
+            raise KeyError("unknown table {}".format(name))
+        _tables[name] = _table_builders[name]()
+    return _tables[name]
+
+
+def get_table_array(name):
+    """Return the table with the given name as a read-only ndarray"""
+    if name not in _table_arrays:
+        table_array = np.array(get_table(name))
+        table_array.flags.writeable = False
+        _table_arrays[name] = table_array
+    return _table_arrays[name]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Software reference of the zig-zag scan"""
+
+import numpy as np
+
+
+_zig_zag_indices = {}
+
+
+def zig_zag_indices(N=8):
+    """Return the cached zig-zag permutation arrays of a NxN block
+
+    The arrays are built once for each N and are read-only.
+
+    Returns:
+        (zig_zag_matrix, inverse) where zig_zag_matrix[i] is the
+        position in the zig-zag order of the i-th element of the block
+        in row-major order and inverse is the inverse permutation
+    """
+    if N not in _zig_zag_indices:
+        zig_zag_matrix = np.array(zig_zag_scan.build_zig_zag_matrix(N))
+        inverse = np.argsort(zig_zag_matrix)
+        zig_zag_matrix.flags.writeable = False
+        inverse.flags.writeable = False
+        _zig_zag_indices[N] = (zig_zag_matrix, inverse)
+    return _zig_zag_indices[N]
+
+
+def zig_zag_blocks(blocks, N=8):
+    """Batched zig-zag scan of an (nblocks, N*N) array
+
+    Each row of the result is the same as the result of
+    zig_zag_scan(N).zig_zag for the corresponding row of blocks.
+    """
+    return np.asarray(blocks)[..., zig_zag_indices(N)[1]]
+
+
+def inverse_zig_zag_blocks(blocks, N=8):
+    """Reorder an (nblocks, N*N) array of zig-zag scanned blocks back
+    to the row-major order"""
+    return np.asarray(blocks)[..., zig_zag_indices(N)[0]]
+
+
+class zig_zag_scan(object):
+
+    """Zig-Zag Scan Class
+
+    It is used to produce the zig-zag matrix and as a software
+    reference for the zig-zag scan.
+    """
+
+    def __init__(self, N):
+        """Initialize the zig-zag matrix"""
+        self.N = N
+        self.zig_zag_matrix = zig_zag_indices(N)[0].tolist()
+
+    @staticmethod
+    def build_zig_zag_matrix(N):
+        """Build the zig-zag matrix"""
+        """Code taken from http://paddy3118.blogspot.gr/2008/08/zig-zag.html"""
+        def zigzag(n):
+            indexorder = sorted(((x, y) for x in range(n) for y in range(n)),
+                                 key=lambda p: (p[0]+p[1], -p[1] if (p[0]+p[1]) % 2 else p[1]))
+            return dict((index, n) for n, index in enumerate(indexorder))
+
+        def zig_zag_list(myarray):
+            a = []
+            n = int(len(myarray) ** 0.5 + 0.5)
+            for x in range(n):
+                for y in range(n):
+                    a.append(myarray[(x, y)])
+            return a
+
+        return zig_zag_list(zigzag(N))
+
+    def zig_zag(self, signal_list):
+        """Zig-zag scan function"""
+        zig_zag_result = [None for i in range(self.N**2)]
+        for i in range(self.N**2):
+            a = self.zig_zag_matrix[i]
+            zig_zag_result[a] = signal_list[i]
+
+        return zig_zag_result
@@ -0,0 +1,18 @@
+from __future__ import absolute_import
+
+from .cache import BlockCache
+from .encoder import (JPEGEncoder, encode, encode_stream, encode_to_file,
+                      encoder_from_config)
+from .mjpeg import read_raw_frames, encode_frames, write_mjpeg, write_avi
+from .optimize import (SymbolStatistics, optimal_huffman_table,
+                       optimize_huffman_tables, write_huffman_csv)
+from .tables import HuffmanTable, VLCTable, amplitude_tables, quant_tables
+
+__all__ = [
+    'BlockCache', 'JPEGEncoder', 'encode', 'encode_stream', 'encode_to_file',
+    'encoder_from_config',
+    'read_raw_frames', 'encode_frames', 'write_mjpeg', 'write_avi',
+    'SymbolStatistics', 'optimal_huffman_table', 'optimize_huffman_tables',
+    'write_huffman_csv', 'HuffmanTable', 'VLCTable', 'amplitude_tables',
+    'quant_tables'
+]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Cache of the entropy codes of the MCUs
+
+Screenshots and synthetic frames have many identical MCUs (flat fills,
+repeated glyphs). The JPEGEncoder keys the cache with the RGB bytes of
+an MCU and reuses the quantized DC coefficients and the packed AC codes
+of its blocks, only the DC differences are coded again.
+"""
+
+from collections import OrderedDict
+
+
+class BlockCache(object):
+
+    """Least Recently Used MCU Cache Class
+
+    Arguments:
+        maxsize: the maximum number of cached MCUs, the least recently
+            used MCU is removed when the cache is full
+    """
+
+    def __init__(self, maxsize=4096):
+        if maxsize < 1:
+            raise ValueError("maxsize {} is less than 1".format(maxsize))
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Return the value of the key or None and count the hit or the
+        miss"""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Add the value of the key and remove the least recently used
+        entry when the cache is full"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all the entries and reset the counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Command line interface of the software encoder
+
+The images of the files, directories and glob patterns are encoded
+with the JPEGEncoder, in a process pool with --jobs. The throughput in
+megapixels per second, the bits per pixel and the time of each stage
+of the encoder are reported::
+
+    jpegenc --jobs 4 --quality 75 --output-dir out 'test_images/*.png'
+"""
+
+from __future__ import print_function
+
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from timeit import default_timer
+
+from PIL import Image
+
+from .encoder import JPEGEncoder, STAGES, SUBSAMPLING, to_rgb_array
+
+IMAGE_EXTENSIONS = ('.bmp', '.gif', '.jpeg', '.jpg', '.png', '.ppm', '.tif',
+                    '.tiff')
+
+
+def find_images(paths):
+    """The image files of the files, directories and glob patterns"""
+    filenames = []
+    for path in paths:
+        if os.path.isdir(path):
+            filenames.extend(
+                os.path.join(path, filename)
+                for filename in sorted(os.listdir(path))
+                if filename.lower().endswith(IMAGE_EXTENSIONS))
+        elif os.path.isfile(path):
+            filenames.append(path)
+        else:
+            matches = sorted(glob.glob(path))
+            if not matches:
+                raise ValueError("no images match {}".format(path))
+            filenames.extend(match for match in matches
+                             if os.path.isfile(match))
+    return filenames
+
+
+def encode_file(filename, encoder, output_dir=None):
+    """Encode an image file
+
+    Returns:
+        (width, height, size, seconds, stage_times) the size of the
+        image, the size of the JFIF file in bytes, the encoding time
+        and the time of each stage
+    """
+    image = to_rgb_array(Image.open(filename))
+    encoder.stage_times = dict.fromkeys(STAGES, 0.0)
+    start = default_timer()
+    jpeg = encoder.encode(image)
+    seconds = default_timer() - start
+    if output_dir is not None:
+        name = os.path.splitext(os.path.basename(filename))[0] + '.jpg'
+        with open(os.path.join(output_dir, name), 'wb') as jpeg_file:
+            jpeg_file.write(jpeg)
+    height, width = image.shape[:2]
+    return width, height, len(jpeg), seconds, encoder.stage_times
+
+
+def _encode_file(args):
+    """Process pool task of encode_files"""
+    return encode_file(*args)
+
+
+def encode_files(filenames, encoder, jobs=1, output_dir=None):
+    """Encode the image files in jobs processes
+
+    Returns:
+        (results, seconds) the encode_file result of each file and the
+        elapsed time
+    """
+    tasks = [(filename, encoder, output_dir) for filename in filenames]
+    start = default_timer()
+    if jobs == 1:
+        results = [_encode_file(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(jobs) as executor:
+            results = list(executor.map(_encode_file, tasks))
+    return results, default_timer() - start
+
+
+def report(filenames, results, seconds, stream=None):
+    """Print the bits per pixel of each file and the throughput"""
+    if stream is None:
+        stream = sys.stdout
+    total_pixels = total_size = 0
+    stage_times = dict.fromkeys(STAGES, 0.0)
+    for filename, result in zip(filenames, results):
+        width, height, size, file_seconds, times = result
+        pixels = width * height
+        print("{}: {}x{} pixels, {} bytes, {:.3f} bpp, {:.3f} s".format(
+            filename, width, height, size, 8.0 * size / pixels,
+            file_seconds), file=stream)
+        total_pixels += pixels
+        total_size += size
+        for stage in STAGES:
+            stage_times[stage] += times[stage]
+
+    print("{} images, {:.2f} megapixels in {:.3f} s: {:.2f} megapixels/s, "
+          "{:.3f} bpp".format(len(results), total_pixels / 1e6, seconds,
+                              total_pixels / 1e6 / seconds,
+                              8.0 * total_size / total_pixels), file=stream)
+    total_time = sum(stage_times.values()) or 1.0
+    for stage in STAGES:
+        print("  {:<13} {:8.3f} s {:5.1f} %".format(
+            stage, stage_times[stage],
+            100 * stage_times[stage] / total_time), file=stream)
+
+
+def main(argv=None):
+    """Entry point of the jpegenc command"""
+    parser = argparse.ArgumentParser(
+        description="Encode images with the software JPEG encoder")
+    parser.add_argument('paths', nargs='+',
+                        help="image files, directories or glob patterns")
+    parser.add_argument('--quality', type=int, default=50,
+                        help="quality of the quantization tables (1 - 100), "
+                             "50 uses the tables of the quantizer ROM")
+    parser.add_argument('--subsampling', choices=sorted(SUBSAMPLING),
+                        default='4:4:4', help="chroma subsampling")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="number of processes")
+    parser.add_argument('--output-dir',
+                        help="write the JFIF files in this directory")
+    args = parser.parse_args(argv)
+
+    try:
+        filenames = find_images(args.paths)
+        encoder = JPEGEncoder(args.quality, args.subsampling)
+    except ValueError as err:
+        parser.error(str(err))
+    if not filenames:
+        parser.error("no images found")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.output_dir is not None and not os.path.isdir(args.output_dir):
+        os.makedirs(args.output_dir)
+
+    results, seconds = encode_files(filenames, encoder, args.jobs,
+                                    args.output_dir)
+    report(filenames, results, seconds)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,666 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Software JPEG encoder
+
+The encoder follows the MyHDL pipeline: the color space conversion,
+the 2D-DCT, the zig-zag scan and the quantizer are the software
+references of the subblocks, applied to all the blocks of the image
+at once. The quantized blocks are entropy coded with the huffman
+tables of jpegenc.soft.tables and written in a baseline JFIF file.
+"""
+
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from timeit import default_timer
+
+import numpy as np
+
+from jpegenc.reference.color import ColorSpace
+from jpegenc.reference.dct import dct_2d_transformation
+from jpegenc.reference.zig_zag import zig_zag_blocks
+from jpegenc.reference.backend import (BitWriter, dc_differences,
+                                       divider_blocks, runlength_blocks,
+                                       stuff_bytes, vli_encode)
+
+from . import markers
+from .cache import BlockCache
+from .tables import (HuffmanTable, dc_luminance_table, dc_chrominance_table,
+                     ac_luminance_table, ac_chrominance_table, quant_tables,
+                     VLCTable)
+
+# the stages of the encoder in the order of the pipeline
+STAGES = ('color', 'dct', 'quantization', 'rle', 'huffman', 'stuffing')
+
+# the encoders of encoder_from_config
+_encoders = {}
+
+# entropy codes of MCUs without the codes of the DC differences: the
+# packed codes and their lengths of the AC symbols, the AC symbols of
+# block i are at block_offsets[i]:block_offsets[i + 1], and the DC
+# coefficient of each block
+MCUCodes = namedtuple('MCUCodes', ['codes', 'lengths', 'block_offsets', 'dc'])
+
+# horizontal and vertical sampling factors of the luminance
+SUBSAMPLING = {
+    '4:4:4': (1, 1),
+    '4:2:2': (2, 1),
+    '4:2:0': (2, 2),
+}
+
+
+def to_rgb_array(image):
+    """Return a PIL image or an HxWx3 array as an HxWx3 uint8 array"""
+    if hasattr(image, 'convert'):
+        image = image.convert('RGB')
+    image = np.asarray(image)
+    if image.ndim != 3 or image.shape[2] != 3:
+        raise ValueError("expected an HxWx3 image, got shape {}".format(
+            image.shape))
+    return image.astype(np.uint8, copy=False)
+
+
+def pad_image(image, height, width):
+    """Pad an HxWx3 image with black pixels to a multiple of the
+    height and the width"""
+    pad_height = -image.shape[0] % height
+    pad_width = -image.shape[1] % width
+    if pad_height or pad_width:
+        image = np.pad(image, ((0, pad_height), (0, pad_width), (0, 0)),
+                       'constant')
+    return image
+
+
+def downsample(plane, hsamp, vsamp):
+    """Average each vsamp x hsamp area of a color component"""
+    if hsamp == 1 and vsamp == 1:
+        return plane
+    height, width = plane.shape
+    plane = plane.reshape(height // vsamp, vsamp, width // hsamp, hsamp)
+    count = hsamp * vsamp
+    return (plane.sum(axis=(1, 3)) + count // 2) // count
+
+
+def plane_to_blocks(plane, N=8):
+    """Split a color component in a (block rows, block columns, N, N)
+    array of blocks"""
+    height, width = plane.shape
+    blocks = plane.reshape(height // N, N, width // N, N)
+    return blocks.transpose(0, 2, 1, 3)
+
+
+class JPEGEncoder(object):
+
+    """Software JPEG Encoder Class
+
+    It encodes RGB images to baseline JFIF files.
+
+    Arguments:
+        quality: 1 - 100, 50 uses the tables of the quantizer ROM
+        subsampling: '4:4:4' (the MyHDL frontend), '4:2:2' or '4:2:0'
+        fixed_point: use the bit-exact model of the dct_2d module in
+            place of the floating point 2D-DCT reference
+        restart_interval: the number of MCUs of each restart interval,
+            0 for no restart markers
+        huffman_tables: the (luminance DC, luminance AC, chrominance
+            DC, chrominance AC) HuffmanTables, defaults to the typical
+            tables of the standard
+        cache_size: the number of MCUs of the BlockCache, 0 for no
+            cache. The cache is used by encode_stream and by encode
+            in this process.
+
+    The time of each stage of transform and write_mcu_codes is added to
+    stage_times when it is a dict with the STAGES keys.
+    """
+
+    def __init__(self, quality=50, subsampling='4:4:4', fixed_point=False,
+                 restart_interval=0, huffman_tables=None, cache_size=0):
+        if subsampling not in SUBSAMPLING:
+            raise ValueError("unsupported subsampling {}".format(
+                subsampling))
+        self.quality = quality
+        self.subsampling = subsampling
+        self.fixed_point = fixed_point
+        self.restart_interval = restart_interval
+        if huffman_tables is None:
+            huffman_tables = (dc_luminance_table, ac_luminance_table,
+                              dc_chrominance_table, ac_chrominance_table)
+        self.huffman_tables = tuple(huffman_tables)
+        self.vlc_tables = tuple(VLCTable(table) for table in huffman_tables)
+        self._vlc_codes = np.stack([table.code for table in self.vlc_tables])
+        self._vlc_lengths = np.stack([table.length
+                                      for table in self.vlc_tables])
+        self.quant_tables = quant_tables(quality)
+        self.hsamp, self.vsamp = SUBSAMPLING[subsampling]
+        self.dct_obj = dct_2d_transformation(8)
+        self._headers = {}
+        self.block_cache = BlockCache(cache_size) if cache_size else None
+        self.stage_times = None
+
+    @property
+    def config(self):
+        """The arguments of the encoder without the cache size
+
+        The config is a small picklable dict for the process pool
+        tasks, see encoder_from_config.
+        """
+        return dict(quality=self.quality, subsampling=self.subsampling,
+                    fixed_point=self.fixed_point,
+                    restart_interval=self.restart_interval,
+                    huffman_tables=tuple((table.bits, table.huffval)
+                                         for table in self.huffman_tables))
+
+    @property
+    def mcu_size(self):
+        """(height, width) of an MCU in pixels"""
+        return 8 * self.vsamp, 8 * self.hsamp
+
+    @contextmanager
+    def timed(self, stage):
+        """Add the time of the with block to the time of the stage"""
+        if self.stage_times is None:
+            yield
+            return
+        start = default_timer()
+        yield
+        self.stage_times[stage] += default_timer() - start
+
+    def components(self):
+        """(horizontal, vertical) sampling factors of Y, Cb and Cr"""
+        return [(self.hsamp, self.vsamp), (1, 1), (1, 1)]
+
+    def transform(self, image):
+        """Quantized zig-zag scanned blocks of the color components
+
+        Arguments:
+            image: an HxWx3 RGB array, the size is a multiple of the
+                MCU size
+
+        Returns:
+            list with a (block rows, block columns, 64) array for each
+            color component
+        """
+        with self.timed('color'):
+            ycbcr = ColorSpace.get_jfif_ycbcr_array(image)
+        result = []
+        for index, (hsamp, vsamp) in enumerate(self.components()):
+            with self.timed('color'):
+                plane = downsample(ycbcr[..., index], self.hsamp // hsamp,
+                                   self.vsamp // vsamp)
+            blocks = plane_to_blocks(plane)
+            block_rows, block_cols = blocks.shape[:2]
+            blocks = blocks.reshape(-1, 8, 8)
+            with self.timed('dct'):
+                if self.fixed_point:
+                    dct_result = self.dct_obj.dct_2d_fixed_point(blocks)
+                else:
+                    dct_result = self.dct_obj.dct_2d_transformation_blocks(
+                        blocks)
+                zig_zag_result = zig_zag_blocks(dct_result.reshape(-1, 64))
+            with self.timed('quantization'):
+                quantized = divider_blocks(zig_zag_result, 2 * index,
+                                           self.quant_tables)
+            result.append(quantized.reshape(block_rows, block_cols, 64))
+        return result
+
+    def mcu_count(self, components):
+        """(MCU rows, MCU columns) of the transformed components"""
+        return (components[0].shape[0] // self.vsamp,
+                components[0].shape[1] // self.hsamp)
+
+    def block_indices(self):
+        """The color component of each block of an MCU"""
+        return np.repeat(np.arange(3), [hsamp * vsamp for hsamp, vsamp
+                                        in self.components()])
+
+    def mcu_blocks(self, components):
+        """Blocks of each MCU in the scan order
+
+        Arguments:
+            components: the output of transform
+
+        Returns:
+            (MCUs, blocks per MCU, 64) array, the color components of
+            the blocks of an MCU are given by block_indices
+        """
+        mcu_rows, mcu_cols = self.mcu_count(components)
+        mcus = []
+        for blocks, (hsamp, vsamp) in zip(components, self.components()):
+            blocks = blocks.reshape(mcu_rows, vsamp, mcu_cols, hsamp, 64)
+            mcus.append(blocks.transpose(0, 2, 1, 3, 4).reshape(
+                mcu_rows * mcu_cols, vsamp * hsamp, 64))
+        return np.concatenate(mcus, axis=1)
+
+    def mcu_codes(self, mcus):
+        """Entropy codes of the AC coefficients of the MCUs
+
+        The DC coefficients are kept, the codes of the DC differences
+        depend on the previous blocks and are added by write_mcu_codes.
+
+        Arguments:
+            mcus: array of mcu_blocks
+
+        Returns:
+            MCUCodes
+        """
+        blocks = mcus.reshape(-1, 64)
+        indices = np.tile(self.block_indices(), len(mcus))
+        table_index, symbols, sizes, amplitudes, block_offsets, _ = \
+            self.symbols(blocks, indices)
+        ac_symbols = np.ones(len(symbols), dtype=bool)
+        ac_symbols[block_offsets[:-1]] = False
+        codes, lengths = self.symbol_codes(
+            table_index[ac_symbols], symbols[ac_symbols], sizes[ac_symbols],
+            amplitudes[ac_symbols])
+        return MCUCodes(codes, lengths,
+                        block_offsets - np.arange(len(block_offsets)),
+                        blocks[:, 0].copy())
+
+    def image_codes(self, image):
+        """mcu_codes of an image, through the block cache when the
+        encoder has one
+
+        Arguments:
+            image: an HxWx3 RGB array, the size is a multiple of the
+                MCU size
+        """
+        if self.block_cache is None:
+            return self.mcu_codes(self.mcu_blocks(self.transform(image)))
+        return self.cached_image_codes(image)
+
+    def cached_image_codes(self, image):
+        """mcu_codes of an image with the block cache
+
+        The MCUs which are not in the block cache are transformed and
+        coded together and added to the cache, the AC codes of the
+        cached MCUs are not computed again.
+        """
+        mcu_height, mcu_width = self.mcu_size
+        height, width = image.shape[:2]
+        tiles = image.reshape(height // mcu_height, mcu_height,
+                              width // mcu_width, mcu_width, 3)
+        tiles = tiles.transpose(0, 2, 1, 3, 4).reshape(
+            -1, mcu_height, mcu_width, 3)
+        cache = self.block_cache
+        keys = [tile.tobytes() for tile in tiles]
+        # each distinct MCU of the image is looked up and coded once
+        found = {}
+        missed = {}
+        for position, key in enumerate(keys):
+            if key in found:
+                continue
+            found[key] = cache.get(key)
+            if found[key] is None:
+                missed[key] = position
+        if missed:
+            positions = sorted(missed.values())
+            coded = self.mcu_codes(self.mcu_blocks(self.transform(
+                np.concatenate(tiles[positions], axis=1))))
+            for index, position in enumerate(positions):
+                mcu = self.mcu_range(coded, index, index + 1)
+                found[keys[position]] = mcu
+                # the entries do not keep the arrays of all the MCUs
+                cache.put(keys[position],
+                          MCUCodes(*[array.copy() for array in mcu]))
+        return join_mcu_codes([found[key] for key in keys])
+
+    def mcu_range(self, coded, start, stop):
+        """The MCUCodes of the MCUs start:stop of coded"""
+        blocks_per_mcu = len(self.block_indices())
+        first_block = start * blocks_per_mcu
+        last_block = stop * blocks_per_mcu
+        block_offsets = coded.block_offsets[first_block:last_block + 1]
+        first, last = block_offsets[0], block_offsets[-1]
+        return MCUCodes(coded.codes[first:last], coded.lengths[first:last],
+                        block_offsets - first,
+                        coded.dc[first_block:last_block])
+
+    def symbols(self, blocks, indices, prev_dc=(0, 0, 0)):
+        """Huffman symbols of the blocks
+
+        Arguments:
+            blocks: (nblocks, 64) array of quantized blocks in scan order
+            indices: the color component (0 - 2) of each block
+            prev_dc: the DC predictors of the color components
+
+        Returns:
+            (table_index, symbols, sizes, amplitudes, block_offsets,
+            prev_dc) the huffman table (in the order of
+            huffman_tables), the (run << 4 | size) symbol, the size and
+            the VLI bits of the amplitude of each symbol, the symbols of
+            block i are at block_offsets[i]:block_offsets[i + 1], and
+            the updated DC predictors
+        """
+        # the color components 1, 2 and 3 of runlength_blocks have their
+        # own DC predictors
+        with self.timed('rle'):
+            runs, sizes, amplitudes, block_offsets, prev_dc = \
+                runlength_blocks(blocks, indices + 1, prev_dc, zrl_run=16)
+
+        with self.timed('huffman'):
+            # the DC symbols are coded with the DC tables of each
+            # component
+            table_index = np.repeat(np.where(indices > 0, 3, 1),
+                                    np.diff(block_offsets))
+            table_index[block_offsets[:-1]] -= 1
+        return (table_index, (runs << 4) | sizes, sizes, amplitudes,
+                block_offsets, prev_dc)
+
+    def symbol_codes(self, table_index, symbols, sizes, amplitudes):
+        """Packed codes of the symbols
+
+        The arguments are outputs of symbols, a ValueError is raised
+        when a symbol has no code in its huffman table.
+
+        Returns:
+            (codes, lengths) the huffman code and the amplitude bits of
+            each symbol
+        """
+        with self.timed('huffman'):
+            codes = self._vlc_codes[table_index, symbols]
+            lengths = self._vlc_lengths[table_index, symbols]
+            missing = np.flatnonzero(lengths == 0)
+        if missing.size:
+            # a symbol without a code would be dropped from the scan
+            raise ValueError("symbol 0x{:02x} has no code in huffman "
+                             "table {}".format(symbols[missing[0]],
+                                               table_index[missing[0]]))
+        return (codes << sizes) | amplitudes, lengths + sizes
+
+    def dc_codes(self, dc, indices, prev_dc=(0, 0, 0)):
+        """Packed codes of the DC differences
+
+        Arguments:
+            dc: the DC coefficient of each block
+            indices: the color component (0 - 2) of each block
+            prev_dc: the DC predictors of the color components
+
+        Returns:
+            (codes, lengths, prev_dc) the code of each block and the
+            updated DC predictors
+        """
+        with self.timed('huffman'):
+            differences, prev_dc = dc_differences(dc, indices, prev_dc)
+            sizes, amplitudes = vli_encode(differences)
+        codes, lengths = self.symbol_codes(np.where(indices > 0, 2, 0),
+                                           sizes, sizes, amplitudes)
+        return codes, lengths, prev_dc
+
+    def write_mcu_codes(self, writer, coded, prev_dc=(0, 0, 0)):
+        """Write the entropy codes of the MCUs
+
+        This is the entropy coder of all the encode methods, the codes
+        of the DC differences are inserted before the AC codes of each
+        block and all the codes are written at once.
+
+        Arguments:
+            writer: the BitWriter, without byte stuffing
+            coded: the MCUCodes of the MCUs
+            prev_dc: the DC predictors before the first MCU
+
+        Returns:
+            the DC predictors after the last MCU
+        """
+        if not len(coded.dc):
+            return prev_dc
+        indices = np.tile(self.block_indices(),
+                          len(coded.dc) // len(self.block_indices()))
+        dc_codes, dc_lengths, prev_dc = self.dc_codes(coded.dc, indices,
+                                                      prev_dc)
+        with self.timed('huffman'):
+            block_starts = coded.block_offsets[:-1]
+            writer.write_codes(
+                np.insert(coded.codes, block_starts, dc_codes),
+                np.insert(coded.lengths, block_starts, dc_lengths))
+        return prev_dc
+
+    def stuffed_bytes(self, writer):
+        """Take the whole bytes of the writer and insert a zero byte
+        after each 0xFF byte"""
+        with self.timed('stuffing'):
+            return stuff_bytes(writer.take_bytes())[0]
+
+    def intervals(self, num_mcus):
+        """(start, stop) MCU ranges of the restart intervals"""
+        interval = self.restart_interval or num_mcus
+        return [(start, min(start + interval, num_mcus))
+                for start in range(0, num_mcus, interval)]
+
+    def encode_intervals(self, coded):
+        """Entropy coded data of each restart interval of the MCUCodes"""
+        segments = []
+        num_mcus = len(coded.dc) // len(self.block_indices())
+        for start, stop in self.intervals(num_mcus):
+            writer = BitWriter(stuffing=False)
+            self.write_mcu_codes(writer, self.mcu_range(coded, start, stop))
+            writer.flush()
+            segments.append(self.stuffed_bytes(writer))
+        return segments
+
+    def encode_scan_parallel(self, image, workers=None):
+        """Encode the restart intervals in a process pool
+
+        The intervals are split in chunks, each process gets the config
+        of the encoder and only the pixel rows of the MCU rows of its
+        chunk, the color conversion, the 2D-DCT, the quantization and
+        the entropy coding run in the processes.
+
+        Arguments:
+            image: an HxWx3 RGB array, the size is a multiple of the
+                MCU size
+
+        Returns:
+            the entropy coded data of each restart interval
+        """
+        mcu_height, mcu_width = self.mcu_size
+        mcu_cols = image.shape[1] // mcu_width
+        intervals = self.intervals(image.shape[0] // mcu_height * mcu_cols)
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        chunk_size = -(-len(intervals) // (4 * workers))
+        config = self.config
+        with ProcessPoolExecutor(workers) as executor:
+            futures = []
+            for first in range(0, len(intervals), chunk_size):
+                start = intervals[first][0]
+                stop = intervals[min(first + chunk_size, len(intervals)) -
+                                 1][1]
+                first_row = start // mcu_cols
+                last_row = (stop - 1) // mcu_cols + 1
+                offset = first_row * mcu_cols
+                futures.append(executor.submit(
+                    _encode_intervals, config,
+                    image[first_row * mcu_height:last_row * mcu_height],
+                    start - offset, stop - offset))
+            return [segment for future in futures
+                    for segment in future.result()]
+
+    def headers(self, height, width):
+        """The marker segments from SOI to SOS
+
+        The headers of each image size are built once.
+        """
+        if (height, width) in self._headers:
+            return self._headers[height, width]
+        segments = [
+            markers.SOI,
+            markers.app0(),
+            markers.dqt(self.quant_tables),
+            markers.sof0(height, width, [
+                (index + 1, hsamp, vsamp, min(index, 1))
+                for index, (hsamp, vsamp) in enumerate(self.components())]),
+            markers.dht([(index % 2, index // 2, table)
+                         for index, table in enumerate(self.huffman_tables)]),
+        ]
+        if self.restart_interval:
+            segments.append(markers.dri(self.restart_interval))
+        segments.append(markers.sos([(index + 1, min(index, 1), min(index, 1))
+                                     for index in range(3)]))
+        self._headers[height, width] = b''.join(segments)
+        return self._headers[height, width]
+
+    def encode(self, image, workers=1):
+        """Encode a PIL image or an HxWx3 array and return the JFIF file
+        as bytes
+
+        Arguments:
+            workers: the number of processes which encode the restart
+                intervals, None for one process per CPU. The output
+                does not depend on the number of processes. An image
+                without restart intervals is a single interval and is
+                always encoded in this process.
+        """
+        image = to_rgb_array(image)
+        height, width = image.shape[:2]
+        image = pad_image(image, *self.mcu_size)
+        if workers != 1 and self.restart_interval:
+            segments = self.encode_scan_parallel(image, workers)
+        else:
+            segments = self.encode_intervals(self.image_codes(image))
+        return self._join(height, width, segments)
+
+    def _join(self, height, width, segments):
+        """The JFIF file of the entropy coded restart intervals"""
+        scan = [segments[0]]
+        for index, segment in enumerate(segments[1:]):
+            scan.append(markers.rst(index % 8))
+            scan.append(segment)
+        return b''.join([self.headers(height, width)] + scan +
+                        [markers.EOI])
+
+    def encode_stream(self, scanlines, width, height):
+        """Encode an image given as an iterator of scanlines
+
+        Only one MCU row of the image is kept in memory, the encoded
+        data is yielded after each MCU row. The output is the same as
+        the output of encode.
+
+        Arguments:
+            scanlines: iterable of the height rows of the image, each
+                row is a (width, 3) array or width*3 bytes of RGB
+                pixels
+            width, height: the size of the image
+
+        Yields:
+            bytes of the JFIF file
+        """
+        yield self.headers(height, width)
+        writer = BitWriter(stuffing=False)
+        prev_dc = (0, 0, 0)
+        mcu_index = 0
+        for mcu_row in mcu_rows(scanlines, width, height, *self.mcu_size):
+            coded = self.image_codes(mcu_row)
+            num_mcus = len(coded.dc) // len(self.block_indices())
+            output = []
+            start = 0
+            while start < num_mcus:
+                stop = num_mcus
+                if self.restart_interval:
+                    if mcu_index and mcu_index % self.restart_interval == 0:
+                        writer.flush()
+                        output.append(self.stuffed_bytes(writer))
+                        restart_index = mcu_index // self.restart_interval
+                        output.append(markers.rst((restart_index - 1) % 8))
+                        prev_dc = (0, 0, 0)
+                    stop = min(stop, start + self.restart_interval -
+                               mcu_index % self.restart_interval)
+                prev_dc = self.write_mcu_codes(
+                    writer, self.mcu_range(coded, start, stop), prev_dc)
+                mcu_index += stop - start
+                start = stop
+            output.append(self.stuffed_bytes(writer))
+            yield b''.join(output)
+        writer.flush()
+        yield self.stuffed_bytes(writer) + markers.EOI
+
+
+def join_mcu_codes(parts):
+    """Concatenate the MCUCodes of consecutive MCUs"""
+    if len(parts) == 1:
+        return parts[0]
+    sizes = [len(part.codes) for part in parts]
+    shifts = np.cumsum([0] + sizes)
+    block_offsets = [part.block_offsets[:-1] + shift
+                     for part, shift in zip(parts, shifts)]
+    block_offsets.append(shifts[-1:])
+    return MCUCodes(np.concatenate([part.codes for part in parts]),
+                    np.concatenate([part.lengths for part in parts]),
+                    np.concatenate(block_offsets),
+                    np.concatenate([part.dc for part in parts]))
+
+
+def mcu_rows(scanlines, width, height, mcu_height, mcu_width):
+    """Group the scanlines of an image in MCU rows
+
+    The MCU rows are padded with black pixels to the MCU size, the same
+    line buffer is reused for all the MCU rows.
+
+    Yields:
+        (mcu_height, padded width, 3) uint8 arrays
+    """
+    line_buffer = np.zeros((mcu_height, width + (-width % mcu_width), 3),
+                           dtype=np.uint8)
+    row = 0
+    for scanline in scanlines:
+        if row >= height:
+            raise ValueError("more than {} scanlines".format(height))
+        if isinstance(scanline, (bytes, bytearray)):
+            scanline = np.frombuffer(scanline, dtype=np.uint8)
+        line_buffer[row % mcu_height, :width] = np.reshape(scanline,
+                                                           (width, 3))
+        row += 1
+        if row % mcu_height == 0:
+            yield line_buffer
+    if row != height:
+        raise ValueError("expected {} scanlines, got {}".format(height, row))
+    if row % mcu_height:
+        line_buffer[row % mcu_height:] = 0
+        yield line_buffer
+
+
+def encoder_from_config(config):
+    """The JPEGEncoder of a JPEGEncoder.config
+
+    The encoder of each config is built once in each process.
+    """
+    key = tuple(sorted(config.items()))
+    if key not in _encoders:
+        huffman_tables = [HuffmanTable(bits, huffval)
+                          for bits, huffval in config['huffman_tables']]
+        _encoders[key] = JPEGEncoder(**dict(config,
+                                            huffman_tables=huffman_tables))
+    return _encoders[key]
+
+
+def _encode_intervals(config, image, start, stop):
+    """Process pool task of JPEGEncoder.encode_scan_parallel, the
+    intervals of the MCUs start:stop of the image rows"""
+    encoder = encoder_from_config(config)
+    coded = encoder.image_codes(image)
+    return encoder.encode_intervals(encoder.mcu_range(coded, start, stop))
+
+
+def encode(image, quality=50, subsampling='4:4:4', fixed_point=False,
+           restart_interval=0, workers=1):
+    """Encode a PIL image or an HxWx3 array and return the JFIF file
+    as bytes"""
+    encoder = JPEGEncoder(quality, subsampling, fixed_point,
+                          restart_interval)
+    return encoder.encode(image, workers)
+
+
+def encode_stream(scanlines, width, height, quality=50, subsampling='4:4:4',
+                  fixed_point=False, restart_interval=0):
+    """Encode an image given as an iterator of scanlines and yield the
+    bytes of the JFIF file"""
+    encoder = JPEGEncoder(quality, subsampling, fixed_point,
+                          restart_interval)
+    return encoder.encode_stream(scanlines, width, height)
+
+
+def encode_to_file(image, filename, **kwargs):
+    """Encode a PIL image or an HxWx3 array to a JFIF file"""
+    with open(filename, 'wb') as jpeg_file:
+        jpeg_file.write(encode(image, **kwargs))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""JFIF marker segments of the software encoder"""
+
+import struct
+
+SOI = b'\xff\xd8'
+EOI = b'\xff\xd9'
+
+
+def segment(marker, payload):
+    """Return a marker segment with the length field"""
+    return struct.pack('>BBH', 0xff, marker, len(payload) + 2) + payload
+
+
+def app0():
+    """JFIF APP0 segment, version 1.01 without thumbnail"""
+    return segment(0xe0, b'JFIF\x00' + struct.pack('>BBBHHBB',
+                                                    1, 1, 0, 1, 1, 0, 0))
+
+
+def dqt(tables):
+    """DQT segment with 8-bit tables, table i has the id i"""
+    payload = b''
+    for table_id, table in enumerate(tables):
+        payload += struct.pack('>B', table_id)
+        payload += bytes(bytearray(int(value) for value in table))
+    return segment(0xdb, payload)
+
+
+def sof0(height, width, components):
+    """Baseline SOF0 segment
+
+    Arguments:
+        components: list of (component id, horizontal sampling factor,
+            vertical sampling factor, quantization table id)
+    """
+    payload = struct.pack('>BHHB', 8, height, width, len(components))
+    for component_id, hsamp, vsamp, table_id in components:
+        payload += struct.pack('>BBB', component_id, (hsamp << 4) | vsamp,
+                               table_id)
+    return segment(0xc0, payload)
+
+
+def dht(tables):
+    """DHT segment
+
+    Arguments:
+        tables: list of (table class, table id, HuffmanTable), the
+            class is 0 for DC and 1 for AC tables
+    """
+    payload = b''
+    for table_class, table_id, table in tables:
+        payload += struct.pack('>B', (table_class << 4) | table_id)
+        payload += bytes(bytearray(table.bits))
+        payload += bytes(bytearray(table.huffval))
+    return segment(0xc4, payload)
+
+
+def dri(interval):
+    """DRI segment with the restart interval in MCUs"""
+    return segment(0xdd, struct.pack('>H', interval))
+
+
+def rst(index):
+    """RSTn marker, n = 0 - 7"""
+    return struct.pack('>BB', 0xff, 0xd0 + index)
+
+
+def sos(components):
+    """SOS segment of a sequential scan
+
+    Arguments:
+        components: list of (component id, DC table id, AC table id)
+    """
+    payload = struct.pack('>B', len(components))
+    for component_id, dc_id, ac_id in components:
+        payload += struct.pack('>BB', component_id, (dc_id << 4) | ac_id)
+    payload += struct.pack('>BBB', 0, 63, 0)
+    return segment(0xda, payload)
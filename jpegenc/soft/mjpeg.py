@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Motion-JPEG encoding of raw RGB24 frames
+
+The frames of a raw capture file are mapped with np.memmap and each
+frame is a view of the file, the encoder and its headers are shared
+by all the frames. The encoded frames are written as a concatenated
+JPEG stream or in an AVI container.
+"""
+
+import struct
+from timeit import default_timer
+
+import numpy as np
+
+from .encoder import JPEGEncoder
+
+
+def read_raw_frames(filename, width, height):
+    """Map a raw RGB24 file as a (frames, height, width, 3) array"""
+    raw = np.memmap(filename, dtype=np.uint8, mode='r')
+    frame_size = width * height * 3
+    if raw.size % frame_size:
+        raise ValueError("file size {} is not a multiple of the frame size "
+                         "{}".format(raw.size, frame_size))
+    return raw.reshape(-1, height, width, 3)
+
+
+def encode_frames(frames, encoder=None):
+    """Encode each frame
+
+    Arguments:
+        frames: iterable of HxWx3 RGB frames, e.g. read_raw_frames
+        encoder: the JPEGEncoder of all the frames
+
+    Yields:
+        (jpeg, seconds) the JFIF file and the encoding time of a frame
+    """
+    if encoder is None:
+        encoder = JPEGEncoder()
+    for frame in frames:
+        start = default_timer()
+        jpeg = encoder.encode(frame)
+        yield jpeg, default_timer() - start
+
+
+def write_mjpeg(frames, filename, encoder=None):
+    """Write the frames as a concatenated JPEG stream
+
+    Returns:
+        the encoding time of each frame in seconds
+    """
+    timings = []
+    with open(filename, 'wb') as mjpeg_file:
+        for jpeg, seconds in encode_frames(frames, encoder):
+            mjpeg_file.write(jpeg)
+            timings.append(seconds)
+    return timings
+
+
+def _chunk(fourcc, data):
+    """RIFF chunk padded to an even size"""
+    return fourcc + struct.pack('<I', len(data)) + data + b'\x00' * (
+        len(data) % 2)
+
+
+def _list(list_type, data):
+    """RIFF list"""
+    return _chunk(b'LIST', list_type + data)
+
+
+def write_avi(frames, filename, fps=25, encoder=None):
+    """Write the frames in an AVI-MJPEG file
+
+    The frames are written as they are encoded, the headers are written
+    at the end when the number of frames is known.
+
+    Returns:
+        the encoding time of each frame in seconds
+    """
+    if encoder is None:
+        encoder = JPEGEncoder()
+    timings = []
+    index = []
+    max_size = 0
+    height = width = 0
+    with open(filename, 'wb') as avi_file:
+        # placeholder of RIFF, hdrl and the movi list header
+        hdrl_size = 8 + 4 + 64 + 12 + 64 + 48
+        avi_file.write(b'\x00' * (12 + hdrl_size + 12))
+        # offsets in idx1 are relative to the movi fourcc
+        offset = 4
+        for frame in frames:
+            start = default_timer()
+            jpeg = encoder.encode(frame)
+            timings.append(default_timer() - start)
+            height, width = np.shape(frame)[:2]
+            chunk = _chunk(b'00dc', jpeg)
+            avi_file.write(chunk)
+            index.append(struct.pack('<4sIII', b'00dc', 0x10, offset,
+                                     len(jpeg)))
+            offset += len(chunk)
+            max_size = max(max_size, len(jpeg))
+        movi_size = offset
+        avi_file.write(_chunk(b'idx1', b''.join(index)))
+        riff_size = avi_file.tell() - 8
+
+        num_frames = len(index)
+        avih = struct.pack('<14I', int(round(1e6 / fps)),
+                           int(max_size * fps), 0, 0x10, num_frames, 0, 1,
+                           max_size, width, height, 0, 0, 0, 0)
+        strh = struct.pack('<4s4sIHHIIIIIIIIhhhh', b'vids', b'MJPG', 0, 0,
+                           0, 0, 1000, int(round(fps * 1000)), 0, num_frames,
+                           max_size, 0xffffffff, 0, 0, 0, width, height)
+        strf = struct.pack('<IiiHH4sIiiII', 40, width, height, 1, 24,
+                           b'MJPG', width * height * 3, 0, 0, 0, 0)
+        hdrl = _list(b'hdrl', _chunk(b'avih', avih) + _list(
+            b'strl', _chunk(b'strh', strh) + _chunk(b'strf', strf)))
+        avi_file.seek(0)
+        avi_file.write(b'RIFF' + struct.pack('<I', riff_size) + b'AVI ')
+        avi_file.write(hdrl)
+        avi_file.write(b'LIST' + struct.pack('<I', movi_size) + b'movi')
+    return timings
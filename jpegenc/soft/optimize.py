@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Optimal huffman tables from symbol statistics
+
+The symbols of the encoded images are counted in a first pass, the
+optimal length-limited huffman tables are built with the procedure of
+the JPEG standard (ITU T.81, Annex K.2) and can be used by the
+JPEGEncoder in a second pass or written in the csv format of the
+huffman ROMs.
+"""
+
+import numpy as np
+
+from jpegenc.reference.backend import entropy_encode
+
+from .encoder import JPEGEncoder, to_rgb_array, pad_image
+from .tables import HuffmanTable
+
+
+class SymbolStatistics(object):
+
+    """Symbol Statistics Class
+
+    It counts the symbols of the luminance DC, luminance AC,
+    chrominance DC and chrominance AC huffman tables, the order of the
+    JPEGEncoder huffman tables.
+    """
+
+    def __init__(self):
+        self.frequencies = [[0] * 256 for _ in range(4)]
+
+    def add_symbols(self, table_index, symbols):
+        """Count the symbols of JPEGEncoder.symbols
+
+        Arguments:
+            table_index: the huffman table of each symbol
+            symbols: the (run << 4 | size) symbols
+        """
+        counts = np.bincount(np.asarray(table_index) * 256 + symbols,
+                             minlength=4 * 256).reshape(4, 256)
+        for frequencies, table_counts in zip(self.frequencies,
+                                             counts.tolist()):
+            for symbol, count in enumerate(table_counts):
+                frequencies[symbol] += count
+
+    def add_runlength(self, runlength_block, accumulator, color_component):
+        """Count the symbols of the runlength reference output
+
+        As in huffman_ref the luminance tables are used when the color
+        component is less than 2.
+        """
+        table_index = 0 if color_component < 2 else 2
+        for i in range(len(runlength_block)):
+            size = entropy_encode(accumulator[i])[1]
+            if i == 0:
+                self.frequencies[table_index][size] += 1
+            else:
+                symbol = (runlength_block[i] << 4) | size
+                self.frequencies[table_index + 1][symbol] += 1
+
+    def add_image(self, image, encoder=None):
+        """Count the symbols of an image encoded with the encoder"""
+        if encoder is None:
+            encoder = JPEGEncoder()
+        image = to_rgb_array(image)
+        mcus = encoder.mcu_blocks(encoder.transform(
+            pad_image(image, *encoder.mcu_size)))
+        for start, stop in encoder.intervals(len(mcus)):
+            blocks = mcus[start:stop]
+            indices = np.tile(encoder.block_indices(), len(blocks))
+            table_index, symbols = encoder.symbols(blocks.reshape(-1, 64),
+                                                   indices)[:2]
+            self.add_symbols(table_index, symbols)
+
+    def huffman_tables(self):
+        """The optimal huffman tables of the counted symbols"""
+        return tuple(optimal_huffman_table(frequencies)
+                     for frequencies in self.frequencies)
+
+
+def optimal_huffman_table(frequencies, max_length=16):
+    """Build the optimal huffman table of the symbol frequencies
+
+    The code lengths are limited to max_length bits and no code
+    consists of only 1 bits (ITU T.81, Annex K.2).
+
+    Arguments:
+        frequencies: the frequency of each symbol (0 - 255), a list or
+            a dict of the symbols and their frequencies
+
+    Returns:
+        HuffmanTable, without codes when no symbol has a frequency
+    """
+    if hasattr(frequencies, 'items'):
+        freq = [0] * 256
+        for symbol, frequency in frequencies.items():
+            freq[symbol] = frequency
+    else:
+        freq = list(frequencies) + [0] * (256 - len(frequencies))
+    if not any(freq):
+        return HuffmanTable([0] * 16, [])
+    # a reserved symbol with the least frequency takes the all 1s code
+    freq.append(1)
+    codesize = [0] * 257
+    others = [-1] * 257
+    while True:
+        c1 = c2 = -1
+        for i in range(257):
+            if freq[i] and (c1 < 0 or freq[i] <= freq[c1]):
+                c1 = i
+        for i in range(257):
+            if freq[i] and i != c1 and (c2 < 0 or freq[i] <= freq[c2]):
+                c2 = i
+        if c2 < 0:
+            break
+        freq[c1] += freq[c2]
+        freq[c2] = 0
+        codesize[c1] += 1
+        while others[c1] >= 0:
+            c1 = others[c1]
+            codesize[c1] += 1
+        others[c1] = c2
+        codesize[c2] += 1
+        while others[c2] >= 0:
+            c2 = others[c2]
+            codesize[c2] += 1
+
+    max_size = max(max(codesize), max_length)
+    bits = [0] * (max_size + 1)
+    for size in codesize:
+        if size:
+            bits[size] += 1
+    # move the codes which are longer than max_length
+    for i in range(max_size, max_length, -1):
+        while bits[i] > 0:
+            j = i - 2
+            while bits[j] == 0:
+                j -= 1
+            bits[i] -= 2
+            bits[i - 1] += 1
+            bits[j + 1] += 2
+            bits[j] -= 1
+    # remove the reserved symbol from the longest codes
+    i = max_length
+    while bits[i] == 0:
+        i -= 1
+    bits[i] -= 1
+
+    huffval = [symbol for size in range(1, max_size + 1)
+               for symbol in range(256) if codesize[symbol] == size]
+    return HuffmanTable(bits[1:max_length + 1], huffval)
+
+
+def optimize_huffman_tables(images, encoder=None):
+    """Optimal huffman tables of the images encoded with the encoder"""
+    statistics = SymbolStatistics()
+    for image in images:
+        statistics.add_image(image, encoder)
+    return statistics.huffman_tables()
+
+
+# the rows of the DC and the AC huffman ROM csv files
+_rom_rows = (13, 253)
+
+
+def write_huffman_csv(table, csvfile, base=2, rows=None, table_class=1):
+    """Write a huffman table in the csv format of the huffman ROMs
+
+    Each row is the code and the size of the symbol of the row, the
+    codes are binary ('0b...') when base is 2 and decimal when base is
+    10, as in dc_rom.csv.
+
+    Arguments:
+        table_class: 0 for DC and 1 for AC tables, as in the DHT marker
+        rows: the rows of the csv, by default the rows of the huffman
+            ROMs of the table class, 13 for DC and 253 for AC tables
+    """
+    if rows is None:
+        rows = _rom_rows[table_class]
+    with open(csvfile, 'w') as csvfp:
+        for symbol in range(rows):
+            if base == 2:
+                code = bin(table.code[symbol])
+            else:
+                code = str(table.code[symbol])
+            csvfp.write("{},{}\n".format(code, table.size[symbol]))
@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Local asyncio encoding service
+
+The server accepts raw RGB24 or PNG images on a TCP or a UNIX socket
+and streams the JFIF files back. The requests are batched and each
+batch is encoded in a process pool, so the event loop never blocks on
+the encoder. The encoder is the JPEGEncoder, which is built on the
+software references of the subblocks.
+
+Each request and each response starts with a header, the connection
+can carry any number of requests::
+
+    request:  kind (4 bytes), width, height, payload length (>III)
+    response: status (4 bytes), payload length (>I)
+
+The request kinds are RAW_RGB (width x height x 3 bytes), PNG (any
+image file PIL can read, width and height are ignored) and STATS, the
+response status is JPEG, STATS (the JSON of EncoderServer.stats) or
+ERROR (the error message).
+
+Backpressure: at most max_queue requests wait for the pool, the
+connections are not read while the queue is full. At most
+max_concurrency batches are encoded at once.
+"""
+
+from __future__ import print_function
+
+import argparse
+import asyncio
+import collections
+import io
+import json
+import multiprocessing
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from timeit import default_timer
+
+import numpy as np
+from PIL import Image
+
+from .encoder import JPEGEncoder, encoder_from_config
+
+REQUEST = struct.Struct('>4sIII')
+RESPONSE = struct.Struct('>4sI')
+
+RAW_RGB = b'RGB '
+PNG = b'PNG '
+STATS = b'STAT'
+JPEG = b'JPEG'
+ERROR = b'ERR '
+
+
+def encode_payload(encoder, kind, width, height, payload):
+    """Encode the payload of a request and return the JFIF file"""
+    if kind == RAW_RGB:
+        image = np.frombuffer(payload, dtype=np.uint8).reshape(height, width,
+                                                               3)
+    else:
+        image = Image.open(io.BytesIO(payload))
+    return encoder.encode(image)
+
+
+def _running_loop():
+    """The running event loop, get_running_loop of Python 3.7"""
+    get_loop = (getattr(asyncio, 'get_running_loop', None) or
+                asyncio.get_event_loop)
+    return get_loop()
+
+
+def _current_task():
+    """The running task, current_task of Python 3.7"""
+    current_task = (getattr(asyncio, 'current_task', None) or
+                    asyncio.Task.current_task)
+    return current_task()
+
+
+def _encode_batch(config, requests):
+    """Process pool task of EncoderServer, the encoder is built from
+    its config, the errors of a request are returned as its response"""
+    encoder = encoder_from_config(config)
+    responses = []
+    for request in requests:
+        try:
+            responses.append((JPEG, encode_payload(encoder, *request)))
+        except Exception as err:
+            responses.append((ERROR, str(err).encode()))
+    return responses
+
+
+class EncoderServer(object):
+
+    """Encoding Server Class
+
+    Arguments:
+        encoder: the JPEGEncoder of all the requests, the processes
+            build their encoders from its config
+        workers: the number of processes, None for one per CPU
+        max_concurrency: the number of batches which are encoded at
+            once, defaults to workers
+        max_queue: the number of requests which wait for the pool
+        batch_size: the maximum number of requests of a batch
+        batch_timeout: the time in seconds to wait for the requests of
+            a batch
+        max_payload: the maximum payload length in bytes
+        chunk_size: the JFIF files are sent in chunks of this size
+    """
+
+    def __init__(self, encoder=None, workers=None, max_concurrency=None,
+                 max_queue=64, batch_size=8, batch_timeout=0.002,
+                 max_payload=64 * 2**20, chunk_size=2**16):
+        self.encoder = encoder if encoder is not None else JPEGEncoder()
+        self.workers = workers or multiprocessing.cpu_count()
+        self.max_concurrency = max_concurrency or self.workers
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.max_payload = max_payload
+        self.chunk_size = chunk_size
+        self.latencies = collections.deque(maxlen=10000)
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.in_flight = 0
+        self.server = None
+        self._queue = None
+        self._semaphore = None
+        self._executor = None
+        self._batcher = None
+        self._handlers = set()
+        self._batch_tasks = set()
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """Start the server on a TCP port or on the UNIX socket path
+
+        Returns:
+            the asyncio server
+        """
+        self._queue = asyncio.Queue(self.max_queue)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._executor = ProcessPoolExecutor(self.workers)
+        self._batcher = asyncio.ensure_future(self._batch_requests())
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path)
+        else:
+            self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    async def close(self):
+        """Stop the server, the open connections and the process pool"""
+        self.server.close()
+        # the pool is shut down after the last task which uses it
+        tasks = list(self._handlers) + [self._batcher] + list(
+            self._batch_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.server.wait_closed()
+        self._executor.shutdown()
+
+    def stats(self):
+        """The request counters and the latency percentiles in ms"""
+        latencies = np.array(self.latencies) * 1000
+        if latencies.size:
+            percentiles = np.percentile(latencies, [50, 90, 99])
+            latency = dict(p50=percentiles[0], p90=percentiles[1],
+                           p99=percentiles[2], max=latencies.max())
+        else:
+            latency = {}
+        return dict(requests=self.requests, errors=self.errors,
+                    batches=self.batches, queued=self._queue.qsize(),
+                    in_flight=self.in_flight,
+                    connections=len(self._handlers), latency_ms=latency)
+
+    async def handle(self, reader, writer):
+        """Serve the requests of a connection"""
+        loop = _running_loop()
+        handler = _current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                header = await reader.readexactly(REQUEST.size)
+                start = default_timer()
+                kind, width, height, length = REQUEST.unpack(header)
+                if length > self.max_payload:
+                    await self._respond(writer, ERROR, "payload of {} bytes "
+                                        "is too large".format(length).encode())
+                    break
+                payload = await reader.readexactly(length)
+                if kind == STATS:
+                    await self._respond(
+                        writer, STATS, json.dumps(self.stats()).encode())
+                    continue
+                if kind == RAW_RGB and length != width * height * 3:
+                    status, data = ERROR, "expected {} bytes of RGB24".format(
+                        width * height * 3).encode()
+                elif kind not in (RAW_RGB, PNG):
+                    status, data = ERROR, "unknown request {!r}".format(
+                        kind).encode()
+                else:
+                    response = loop.create_future()
+                    # waits while the queue is full
+                    await self._queue.put(
+                        ((kind, width, height, payload), response))
+                    status, data = await response
+                await self._respond(writer, status, data)
+                self.requests += 1
+                self.errors += status == ERROR
+                self.latencies.append(default_timer() - start)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            # the client closed the connection, between two requests or
+            # in the middle of one
+            pass
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+    async def _respond(self, writer, status, data):
+        """Send a response in chunks, waiting for the client to read"""
+        writer.write(RESPONSE.pack(status, len(data)))
+        for start in range(0, len(data), self.chunk_size):
+            writer.write(data[start:start + self.chunk_size])
+            await writer.drain()
+        await writer.drain()
+
+    async def _batch_requests(self):
+        """Group the queued requests in batches for the process pool"""
+        while True:
+            batch = [await self._queue.get()]
+            if self.batch_size > 1 and self.batch_timeout:
+                await asyncio.sleep(self.batch_timeout)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._semaphore.acquire()
+            task = asyncio.ensure_future(self._encode_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _encode_batch(self, batch):
+        """Encode a batch in the process pool and answer its requests"""
+        self.in_flight += 1
+        self.batches += 1
+        loop = _running_loop()
+        try:
+            # the encoder is sent to the processes as its small config
+            responses = await loop.run_in_executor(
+                self._executor, _encode_batch, self.encoder.config,
+                [request for request, _ in batch])
+        except Exception as err:
+            responses = [(ERROR, str(err).encode())] * len(batch)
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+        for (_, response), result in zip(batch, responses):
+            if not response.cancelled():
+                response.set_result(result)
+
+
+async def request(reader, writer, kind, payload=b'', width=0, height=0):
+    """Send a request to the server and return the (status, data) of
+    the response"""
+    writer.write(REQUEST.pack(kind, width, height, len(payload)))
+    writer.write(payload)
+    await writer.drain()
+    status, length = RESPONSE.unpack(await reader.readexactly(RESPONSE.size))
+    data = await reader.readexactly(length)
+    return status, data
+
+
+def main(argv=None):
+    """Run the encoding server"""
+    parser = argparse.ArgumentParser(description="JPEG encoding server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="listen on this UNIX socket path")
+    parser.add_argument('--workers', type=int, help="number of processes")
+    parser.add_argument('--max-concurrency', type=int,
+                        help="number of batches which are encoded at once")
+    parser.add_argument('--max-queue', type=int, default=64,
+                        help="number of requests which wait for the pool")
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--quality', type=int, default=50)
+    parser.add_argument('--subsampling', default='4:4:4')
+    args = parser.parse_args(argv)
+
+    encoder_server = EncoderServer(
+        JPEGEncoder(args.quality, args.subsampling), args.workers,
+        args.max_concurrency, args.max_queue, args.batch_size)
+    loop = asyncio.get_event_loop()
+    server = loop.run_until_complete(encoder_server.start(
+        args.host, args.port, args.unix))
+    print("serving on {}".format(server.sockets[0].getsockname()))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(encoder_server.close())
+    return 0
+
+
+if __name__ == '__main__':
+    main()
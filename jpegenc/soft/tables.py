@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Huffman and quantization tables of the software encoder
+
+The huffman tables are the typical tables of the JPEG standard
+(ITU T.81, Annex K.3), given as the BITS and HUFFVAL lists of the DHT
+marker. The quantization tables are the tables of the quantizer ROM
+scaled to the requested quality.
+"""
+
+import numpy as np
+
+from jpegenc.reference.tables import get_table_array
+
+
+class HuffmanTable(object):
+
+    """Huffman Table Class
+
+    It holds the BITS and HUFFVAL lists of a huffman table and the
+    code and the size of each symbol.
+    """
+
+    def __init__(self, bits, huffval):
+        """Build the codes of the table (ITU T.81, Annex C)"""
+        if len(bits) != 16 or sum(bits) != len(huffval):
+            raise ValueError("invalid huffman table")
+        self.bits = tuple(bits)
+        self.huffval = tuple(huffval)
+        self.code = [0] * 256
+        self.size = [0] * 256
+        code = 0
+        k = 0
+        for length in range(1, 17):
+            for _ in range(bits[length - 1]):
+                self.code[huffval[k]] = code
+                self.size[huffval[k]] = length
+                code += 1
+                k += 1
+            code <<= 1
+
+    def lookup(self, symbol):
+        """(code, size) of a symbol, ValueError when the symbol has no
+        code in the table"""
+        if not self.size[symbol]:
+            raise ValueError("symbol 0x{:02x} has no huffman code".format(
+                symbol))
+        return self.code[symbol], self.size[symbol]
+
+
+dc_luminance_table = HuffmanTable(
+    (0, 1, 5, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0),
+    tuple(range(12)))
+
+dc_chrominance_table = HuffmanTable(
+    (0, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0),
+    tuple(range(12)))
+
+ac_luminance_table = HuffmanTable(
+    (0, 2, 1, 3, 3, 2, 4, 3, 5, 5, 4, 4, 0, 0, 1, 0x7d),
+    (0x01, 0x02, 0x03, 0x00, 0x04, 0x11, 0x05, 0x12,
+     0x21, 0x31, 0x41, 0x06, 0x13, 0x51, 0x61, 0x07,
+     0x22, 0x71, 0x14, 0x32, 0x81, 0x91, 0xa1, 0x08,
+     0x23, 0x42, 0xb1, 0xc1, 0x15, 0x52, 0xd1, 0xf0,
+     0x24, 0x33, 0x62, 0x72, 0x82, 0x09, 0x0a, 0x16,
+     0x17, 0x18, 0x19, 0x1a, 0x25, 0x26, 0x27, 0x28,
+     0x29, 0x2a, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39,
+     0x3a, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49,
+     0x4a, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59,
+     0x5a, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69,
+     0x6a, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79,
+     0x7a, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89,
+     0x8a, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98,
+     0x99, 0x9a, 0xa2, 0xa3, 0xa4, 0xa5, 0xa6, 0xa7,
+     0xa8, 0xa9, 0xaa, 0xb2, 0xb3, 0xb4, 0xb5, 0xb6,
+     0xb7, 0xb8, 0xb9, 0xba, 0xc2, 0xc3, 0xc4, 0xc5,
+     0xc6, 0xc7, 0xc8, 0xc9, 0xca, 0xd2, 0xd3, 0xd4,
+     0xd5, 0xd6, 0xd7, 0xd8, 0xd9, 0xda, 0xe1, 0xe2,
+     0xe3, 0xe4, 0xe5, 0xe6, 0xe7, 0xe8, 0xe9, 0xea,
+     0xf1, 0xf2, 0xf3, 0xf4, 0xf5, 0xf6, 0xf7, 0xf8,
+     0xf9, 0xfa))
+
+ac_chrominance_table = HuffmanTable(
+    (0, 2, 1, 2, 4, 4, 3, 4, 7, 5, 4, 4, 0, 1, 2, 0x77),
+    (0x00, 0x01, 0x02, 0x03, 0x11, 0x04, 0x05, 0x21,
+     0x31, 0x06, 0x12, 0x41, 0x51, 0x07, 0x61, 0x71,
+     0x13, 0x22, 0x32, 0x81, 0x08, 0x14, 0x42, 0x91,
+     0xa1, 0xb1, 0xc1, 0x09, 0x23, 0x33, 0x52, 0xf0,
+     0x15, 0x62, 0x72, 0xd1, 0x0a, 0x16, 0x24, 0x34,
+     0xe1, 0x25, 0xf1, 0x17, 0x18, 0x19, 0x1a, 0x26,
+     0x27, 0x28, 0x29, 0x2a, 0x35, 0x36, 0x37, 0x38,
+     0x39, 0x3a, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48,
+     0x49, 0x4a, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58,
+     0x59, 0x5a, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68,
+     0x69, 0x6a, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78,
+     0x79, 0x7a, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87,
+     0x88, 0x89, 0x8a, 0x92, 0x93, 0x94, 0x95, 0x96,
+     0x97, 0x98, 0x99, 0x9a, 0xa2, 0xa3, 0xa4, 0xa5,
+     0xa6, 0xa7, 0xa8, 0xa9, 0xaa, 0xb2, 0xb3, 0xb4,
+     0xb5, 0xb6, 0xb7, 0xb8, 0xb9, 0xba, 0xc2, 0xc3,
+     0xc4, 0xc5, 0xc6, 0xc7, 0xc8, 0xc9, 0xca, 0xd2,
+     0xd3, 0xd4, 0xd5, 0xd6, 0xd7, 0xd8, 0xd9, 0xda,
+     0xe2, 0xe3, 0xe4, 0xe5, 0xe6, 0xe7, 0xe8, 0xe9,
+     0xea, 0xf2, 0xf3, 0xf4, 0xf5, 0xf6, 0xf7, 0xf8,
+     0xf9, 0xfa))
+
+
+# the amplitude tables cover the coefficients -2047 - 2047
+AMPLITUDE_OFFSET = 2047
+
+_amplitude_tables = []
+
+
+def amplitude_tables():
+    """Size and VLI bits of each coefficient
+
+    Returns:
+        (sizes, bits) read-only arrays, the entries of a coefficient
+        are at the index coefficient + AMPLITUDE_OFFSET
+    """
+    if not _amplitude_tables:
+        coeffs = np.arange(-AMPLITUDE_OFFSET, AMPLITUDE_OFFSET + 1)
+        sizes = np.zeros(coeffs.shape, dtype=np.int64)
+        magnitude = np.abs(coeffs)
+        while magnitude.any():
+            sizes += magnitude > 0
+            magnitude >>= 1
+        # the negative amplitudes are coded as coeff - 1
+        bits = np.where(coeffs < 0, coeffs - 1, coeffs) & ((1 << sizes) - 1)
+        sizes.flags.writeable = False
+        bits.flags.writeable = False
+        _amplitude_tables.extend([sizes, bits])
+    return tuple(_amplitude_tables)
+
+
+class VLCTable(object):
+
+    """Variable Length Code Lookup Table Class
+
+    It holds the code and the length of each (run << 4 | size) symbol
+    of a huffman table as arrays. The code of a symbol and the VLI bits
+    of the amplitude are packed in one (bits, nbits) pair with one
+    load from each table.
+    """
+
+    def __init__(self, huffman_table):
+        self.code = np.array(huffman_table.code, dtype=np.int64)
+        self.length = np.array(huffman_table.size, dtype=np.int64)
+        self.code.flags.writeable = False
+        self.length.flags.writeable = False
+
+    def packed(self, run, coeff):
+        """(bits, nbits) of the symbol and the amplitude of a
+        coefficient after a run of zeros"""
+        sizes, amplitude_bits = amplitude_tables()
+        size = sizes[coeff + AMPLITUDE_OFFSET]
+        symbol = (run << 4) | size
+        if not self.length[symbol]:
+            raise ValueError("symbol 0x{:02x} has no huffman code".format(
+                symbol))
+        return ((self.code[symbol] << size) |
+                amplitude_bits[coeff + AMPLITUDE_OFFSET],
+                self.length[symbol] + size)
+
+    def rom(self, rows=256):
+        """(sizes, codes) tuples in the format of the huffman ROM
+        tables of get_table"""
+        return (tuple(self.length[:rows].tolist()),
+                tuple(self.code[:rows].tolist()))
+
+
+def quant_tables(quality=50):
+    """Return the (2, 64) luminance and chrominance quantization tables
+
+    The tables of the quantizer ROM are the tables for quality 50, the
+    other qualities (1 - 100) are scaled as in the IJG library. The
+    quantizer applies the tables to the zig-zag scanned coefficients,
+    so the tables are in the order of the DQT marker.
+    """
+    if not 1 <= quality <= 100:
+        raise ValueError("quality {} is not in 1 - 100".format(quality))
+    if quality < 50:
+        scale = 5000 // quality
+    else:
+        scale = 200 - 2 * quality
+    tables = get_table_array('quant_tables')[:128].reshape(2, 64)
+    tables = (tables * scale + 50) // 100
+    return np.clip(tables, 1, 255)
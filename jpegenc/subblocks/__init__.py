@@ -1,17 +1,61 @@
 
 from __future__ import absolute_import
 
-from .color_converters import rgb2ycbcr
-from .dct import dct_2d
-from .rle import rlencoder
-from .zig_zag import zig_zag
-from .quantizer import quantizer
-from .bytestuffer import bytestuffer
-from .huffman import huffman
-from .backend import backend
-from .frontend import frontend_v2
+import importlib
+import sys
+import types
+
+# the hardware blocks are imported on first use, the software references
+# of the blocks are in jpegenc.reference and do not need MyHDL
+_blocks = {
+    'rgb2ycbcr': '.color_converters',
+    'dct_2d': '.dct',
+    'rlencoder': '.rle',
+    'zig_zag': '.zig_zag',
+    'quantizer': '.quantizer',
+    'bytestuffer': '.bytestuffer',
+    'huffman': '.huffman',
+    'backend': '.backend',
+    'frontend_v2': '.frontend',
+}
 
 __all__ = [
     'rgb2ycbcr', 'dct_2d', 'rlencoder', 'zig_zag', 'frontend_v2', 'quantizer',
     'bytestuffer', 'huffman', 'backend'
 ]
+
+
+def __getattr__(name):
+    """Import a hardware block on first use"""
+    if name not in _blocks:
+        raise AttributeError("module {} has no attribute {}".format(
+            __name__, name))
+    package = importlib.import_module(_blocks[name], __name__)
+    if hasattr(package, name):
+        value = getattr(package, name)
+    else:
+        value = importlib.import_module('.' + name, package.__name__)
+    globals()[name] = value
+    return value
+
+
+class _Subblocks(types.ModuleType):
+
+    """The package module, the hardware blocks shadow the subpackages
+    with the same name"""
+
+    def __setattr__(self, name, value):
+        # importing a subpackage binds it to the package, the block is
+        # bound instead or from-imports of the block get the subpackage
+        if (name in _blocks and isinstance(value, types.ModuleType) and
+                value.__name__ == __name__ + _blocks[name]):
+            value = __getattr__(name)
+        super(_Subblocks, self).__setattr__(name, value)
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ needs python 3.7
+    for _name in __all__:
+        __getattr__(_name)
+else:
+    sys.modules[__name__].__class__ = _Subblocks
@@ -0,0 +1,135 @@
+"""Transaction level model of the Backend Module
+
+The backend_tlm block has the ports of the backend block and computes
+the bytes of each block with the vectorized software references, so a
+system level simulation does not pay for the cycle accurate quantizer,
+rle, huffman and bytestuffer modules. The block is not convertible.
+"""
+
+import numpy as np
+from myhdl import always, always_seq, block
+
+from jpegenc.reference.backend import (BitWriter, divider_blocks,
+                                       runlength_blocks)
+from jpegenc.reference.tables import get_table_array
+
+
+@block
+def backend_tlm(clock, reset, start, data_in, write_addr,
+                write_enable, data_out, ready, addr, num_enc_bytes,
+                cycles=64, color_components=None):
+
+    """
+    The pipeline of the backend is kept: a start pulse quantizes the
+    block of the input buffer, the previous blocks move to the rle, the
+    huffman and the bytestuffer stages, so the bytes of a block are
+    written after the third start pulse which follows it. The bytes are
+    written one per clock cycle on data_out and addr and ready is
+    asserted one cycle when the cycle budget is spent and all the bytes
+    are written.
+
+    Arguments:
+        cycles: the clock cycles from a start pulse to ready
+        color_components: the color component of each block, the
+            sequence is repeated, by default the first block uses the
+            luminance tables and the rest the chrominance tables as
+            the control of the backend
+
+    """
+    width_addr = len(write_addr)
+    half = 2**(width_addr-1)
+
+    ac_rom = get_table_array('ac_rom')
+    ac_cr_rom = get_table_array('ac_cr_rom')
+    dc_rom = get_table_array('dc_rom')
+    dc_cr_rom = get_table_array('dc_cr_rom')
+
+    # input buffer and the state of the pipeline
+    memory = [0]*(2*half)
+    state = {}
+
+    def reset_state():
+        state.update(
+            buffer_sel=1, num_blocks=0, prev_dc=(0, 0, 0),
+            writer=BitWriter(), quant=None, rle=None, huffman=b'',
+            output=bytearray(), num_bytes=0, counter=0, busy=False)
+
+    reset_state()
+
+    def color_component(index):
+        """the color component of the index-th block"""
+        if color_components is not None:
+            return color_components[index % len(color_components)]
+        return 1 if index == 0 else 2
+
+    def quantize(block_in, component):
+        """quantizer stage"""
+        return divider_blocks([block_in], component)[0], component
+
+    def run_length(quant):
+        """rle stage, all the blocks share the first DC predictor"""
+        block_quant, component = quant
+        runs, sizes, amplitudes, _, state['prev_dc'] = runlength_blocks(
+            block_quant, 1, state['prev_dc'])
+        return runs, sizes, amplitudes, component
+
+    def huffman(rle):
+        """huffman stage, returns the stuffed whole bytes"""
+        runs, sizes, amplitudes, component = rle
+        if component < 2:
+            dc_table, ac_table = dc_rom, ac_rom
+        else:
+            dc_table, ac_table = dc_cr_rom, ac_cr_rom
+        symbols = (runs << 4) | sizes
+        vlc_sizes = ac_table[0][symbols]
+        vlc_codes = ac_table[1][symbols]
+        vlc_sizes[0] = dc_table[0][symbols[0]]
+        vlc_codes[0] = dc_table[1][symbols[0]]
+        writer = state['writer']
+        for vlc_code, vlc_size, amplitude, size in zip(
+                vlc_codes.tolist(), vlc_sizes.tolist(), amplitudes.tolist(),
+                sizes.tolist()):
+            writer.write(vlc_code, vlc_size)
+            writer.write(amplitude, size)
+        return writer.take_bytes()
+
+    @always(reset)
+    def reset_model():
+        """the reset of the state of the software model"""
+        if reset == reset.active:
+            reset_state()
+
+    @always_seq(clock.posedge, reset=reset)
+    def transaction():
+        """the stages of a start pulse and the output of the bytes"""
+        if write_enable:
+            memory[int(write_addr)] = int(data_in.val.signed())
+
+        ready.next = False
+        if start:
+            state['output'] += state['huffman']
+            if state['rle'] is not None:
+                state['huffman'] = huffman(state['rle'])
+            if state['quant'] is not None:
+                state['rle'] = run_length(state['quant'])
+            offset = state['buffer_sel']*half
+            state['quant'] = quantize(memory[offset:offset+half],
+                                      color_component(state['num_blocks']))
+            state['buffer_sel'] ^= 1
+            state['num_blocks'] += 1
+            state['counter'] = cycles
+            state['busy'] = True
+
+        elif state['busy']:
+            state['counter'] -= 1
+            if state['output']:
+                data_out.next = state['output'].pop(0)
+                addr.next = state['num_bytes']
+                state['num_bytes'] += 1
+                num_enc_bytes.next = state['num_bytes'] + 2
+            elif state['counter'] <= 0:
+                # the last byte is on the outputs before ready
+                ready.next = True
+                state['busy'] = False
+
+    return reset_model, transaction
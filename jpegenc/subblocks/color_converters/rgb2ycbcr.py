@@ -8,63 +8,11 @@
 """
 
 
-import numpy as np
-
 import myhdl
 from myhdl import Signal, ResetSignal, intbv, always_comb, always_seq
 from myhdl.conversion import analyze
 
-
-class ColorSpace(object):
-
-    """Color Space Conversion Class
-
-    It is used to derive the integer coefficients
-    and as a software reference for the conversion
-    """
-
-    def __init__(self, red=0, green=0, blue=0):
-        """Instance variables"""
-        self.red = red
-        self.green = green
-        self.blue = blue
-        # setup the constant coefficients for YCbCr
-        self._set_jfif_coefs()
-
-    def _set_jfif_coefs(self):
-        """The YCbCr special constants
-
-        The JFIF YCbCr conversion requires "special" constants defined
-        by the standard.  The constants are describe in a Wikipedia page:
-        https://en.wikipedia.org/wiki/YCbCr
-        """
-        self.ycbcr_coef_mat = np.array([
-            [0.2999, 0.5870, 0.1140],     # Y coefficients
-            [-0.1687, -0.3313, 0.5000],   # Cb coefficients
-            [0.5000, -0.4187, -0.0813],   # Cr coefficients
-        ])
-        self.offset = np.array([0, 128, 128])
-
-    def get_jfif_ycbcr(self):
-        """RGB to YCbCr Conversion. Used as software reference."""
-        rgb = np.array([self.red, self.green, self.blue])
-        rgb = rgb[np.newaxis, :].transpose()
-        offset = self.offset[np.newaxis, :].transpose()
-        cmat = self.ycbcr_coef_mat
-        ycbcr = np.dot(cmat, rgb) + offset
-        ycbcr = np.rint(ycbcr)
-        return ycbcr.astype(int)
-
-    def get_jfif_ycbcr_int_coef(self, precision_factor=0):
-        """Generate the integer (fixed-point) coefficients"""
-        cmat = self.ycbcr_coef_mat
-        cmat_ab = np.absolute(cmat)
-        int_coef = cmat_ab * (2**precision_factor)
-        int_coef = np.rint(int_coef)
-        int_coef = int_coef.astype(int)
-        int_offset = np.rint(self.offset * (2**precision_factor))
-        int_offset = int_offset.astype(int)
-        return int_coef.tolist(), int_offset.tolist()
+from jpegenc.reference.color import ColorSpace
 
 
 def build_coeffs(fract_bits):
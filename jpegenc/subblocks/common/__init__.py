@@ -15,9 +15,11 @@ from .interfaces import triple_buffer_in
 from .interfaces import triple_buffer_out
 from .reusable_blocks import assign_array
 from .reusable_blocks import assign
+from jpegenc.reference.tables import get_table, get_table_array
 
 __all__ = ["outputs_2d", "input_interface", "input_1d_1st_stage",
            "output_interface", "RGB", "YCbCr", "assign_array", "assign",
            "inputs_frontend_new", "outputs_frontend_new", "YCbCr_v2",
            "ram_in", "ram_out", "block_buffer_in", "block_buffer_out",
-           "triple_buffer_in", "triple_buffer_out"]
+           "triple_buffer_in", "triple_buffer_out", "get_table",
+           "get_table_array"]
@@ -1,59 +1,10 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-import numpy as np
-from math import sqrt, pi, cos
 import myhdl
 from myhdl import Signal, intbv, always_comb, always_seq
 from jpegenc.subblocks.common import assign_array
-
-class dct_1d_transformation(object):
-
-    """1D-DCT Transformation Class
-
-    It is used to derive the integer coefficient matrix
-    and as a software reference for the 1D-DCT Transformation.
-    """
-
-    def __init__(self, N):
-        """Initialize the DCT coefficient matrix"""
-        self.coeff_matrix = self.build_matrix(N)
-
-    def build_matrix(self, N):
-        """Create the coefficient NxN matrix"""
-        const = sqrt(2.0 / 8)
-        a0 = sqrt(1.0 / 2.0)
-        ak  = 1
-        coeff_matrix = []
-        for i in range(N):
-            row = []
-            for j in range(N):
-                if i == 0:
-                    coeff = const * a0 * cos(((2 * j + 1) * pi * i) / (2 * N))
-                else:
-                    coeff = const * ak * cos(((2 * j + 1) * pi * i) / (2 * N))
-                row.append(coeff)
-            coeff_matrix.append(row)
-        return coeff_matrix
-
-    def dct_1d_transformation(self, vector):
-        """1D-DCT software reference"""
-        vector_t = np.transpose(vector)
-        dct_result = np.dot(self.coeff_matrix, vector_t)
-        dct_result = np.rint(dct_result)
-        dct_result = dct_result.astype(int)
-        dct_result = dct_result.tolist()
-        return dct_result
-
-    def dct_int_coeffs(self, precision_factor):
-        """Transform coeff matrix to integer coefficients"""
-        coeff_matrix = np.asarray(self.coeff_matrix)
-        coeff_matrix = coeff_matrix * (2**precision_factor)
-        coeff_matrix = np.rint(coeff_matrix)
-        coeff_matrix = coeff_matrix.astype(int)
-        coeff_matrix = coeff_matrix.tolist()
-        return coeff_matrix
-
+from jpegenc.reference.dct import dct_1d_transformation, fixed_point_round
 
 def tuple_construct(matrix):
     """Construct a tuple from list to use it as a rom"""
@@ -1,56 +1,12 @@
-import numpy as np
-from math import sqrt, pi, cos
 import myhdl
 from myhdl import Signal, intbv, always_comb, always_seq, block
 
 from jpegenc.subblocks.common import (input_1d_1st_stage, output_interface,
                                       outputs_2d, assign, assign_array)
 
-from .dct_1d import dct_1d
+from jpegenc.reference.dct import dct_2d_transformation
 
-
-class dct_2d_transformation(object):
-
-    """2D-DCT Transformation Class
-
-    It is used as a software reference for the 2D-DCT
-    Transformation
-    """
-
-    def __init__(self, N):
-        """Initialize the DCT coefficient matrix"""
-        self.coeff_matrix = self.build_matrix(N)
-
-    def build_matrix(self, N):
-        """Create the NxN coefficient matrix"""
-        const = sqrt(2.0 / 8)
-        a0 = sqrt(1.0 / 2.0)
-        ak = 1
-        coeff_matrix = []
-        for i in range(N):
-            row = []
-            for j in range(N):
-                if i == 0:
-                    coeff = const * a0 * cos(((2 * j + 1) * pi * i) / (2 * N))
-                else:
-                    coeff = const * ak * cos(((2 * j + 1) * pi * i) / (2 * N))
-                row.append(coeff)
-            coeff_matrix.append(row)
-        return coeff_matrix
-
-    def dct_2d_transformation(self, block):
-        """2D-DCT software reference"""
-        coeff_matrix = np.asarray(self.coeff_matrix)
-        block = np.asarray(block)
-        block = block - 128
-        # first 1d-dct with rows
-        dct_result = np.dot(coeff_matrix, np.transpose(block))
-        # second 1d-dct with columns
-        dct_result = np.rint(dct_result)
-        dct_result = np.dot(coeff_matrix, np.transpose(dct_result))
-        dct_result = np.rint(dct_result).astype(int)
-        dct_result = dct_result.tolist()
-        return dct_result
+from .dct_1d import dct_1d, dct_1d_transformation
 
 
 @myhdl.block
@@ -103,7 +59,7 @@ def dct_2d(inputs, outputs, clock, reset, num_fractional_bits=14,
     stage_2_insts = []
     for i in range(N):
         stage_2_insts += [dct_1d(inputs_2nd_stage[i], outputs_2nd_stage[i], clock,
-                                reset, num_fractional_bits, stage_1_prec, N)]
+                                reset, num_fractional_bits, out_prec, N)]
 
         stage_2_insts += [assign(inputs_2nd_stage[i].data_in, first_1d_output.out_sigs[i])]
         stage_2_insts += [assign(inputs_2nd_stage[i].data_valid, first_1d_output.data_valid)]
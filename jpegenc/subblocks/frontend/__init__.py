@@ -1,4 +1,7 @@
 from .frontend_v2 import frontend_transform
+from .frontend_v2 import frontend_transform_blocks
+from .frontend_v2 import image_to_blocks
 from .frontend_v2 import frontend_top_level_v2
 
-__all__ = ["frontend_transform", "frontend_top_level_v2"]
+__all__ = ["frontend_transform", "frontend_transform_blocks",
+           "image_to_blocks", "frontend_top_level_v2"]
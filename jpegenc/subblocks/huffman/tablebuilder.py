@@ -1,18 +1,11 @@
 """Used to build Huffman Tables"""
 
-import csv
+from jpegenc.reference.tables import read_csv_table
 
 
 def build_huffman_rom_tables(csvfile):
     """build huffman tables"""
-    code = []
-    size = []
-    with open(csvfile, 'r') as csvfp:
-        csvreader = csv.reader(csvfp, delimiter=',')
-        for row in csvreader:
-            code.append(row[0])
-            size.append(row[1])
-
-    code = tuple(code)
-    size = tuple(size)
+    rows = read_csv_table(csvfile)
+    code = tuple(row[0] for row in rows)
+    size = tuple(row[1] for row in rows)
     return code, size
@@ -2,17 +2,13 @@
     divider used for Quantiser"""
 
 from myhdl import always_seq, block, intbv, always_comb, Signal
+from jpegenc.reference.tables import get_table
 from .romr import romr
 
 
 def divider_ref(dividend, divisor):
     """software implementation of divider"""
-    rom_size = 2**8
-    rom = [0 for _ in range(rom_size)]
-    rom = [0] + [int(round(((2**16)-1)/float(ii)))
-                 for ii in range(1, rom_size)]
-    rom = tuple(rom)
-    divisor_reciprocal = rom[divisor]
+    divisor_reciprocal = get_table('reciprocals')[divisor]
     if dividend < 0:
         dividend_d1 = -dividend
     else:
@@ -1,34 +1,16 @@
 """MyHDL implementation of Quantiser ROM"""
 
-import csv
 from myhdl import Signal, always
 from myhdl import block, always_comb
 
-
-def build_huffman_rom_tables(csvfile):
-    """build huffman tables"""
-    tables_quant = []
-    with open(csvfile, 'r') as csvfp:
-        csvreader = csv.reader(csvfp, delimiter=',')
-        for row in csvreader:
-            tables_quant.append(row[0])
-    tables_quant = tuple(tables_quant)
-    return tables_quant
+from jpegenc.reference.tables import get_table
 
 
 @block
 def quant_rom(clock, address, data_out):
     """Build Chrominance ROM for Huffman Tables"""
 
-    tables = build_huffman_rom_tables(
-        '../jpegenc/subblocks/quantizer/quant_tables.csv')
-
-    tables_len = len(tables)
-    rom_tables = [0 for _ in range(tables_len)]
-    rom_tables = [int(tables[0])] + [int(
-        tables[ii+1]) for ii in range(tables_len-1)]
-
-    rom_tables = tuple(rom_tables)
+    rom_tables = get_table('quant_tables')
 
     raddr = Signal(address.val)
 
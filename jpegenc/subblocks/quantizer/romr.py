@@ -3,6 +3,8 @@
 import myhdl
 from myhdl import Signal, always, always_comb
 
+from jpegenc.reference.tables import get_table, reciprocal_rom
+
 
 @myhdl.block
 def romr(addr, clk, datao):
@@ -10,10 +12,10 @@ def romr(addr, clk, datao):
 
     # build the ROM table
     rom_size = 2**len(addr)
-    rom = [0 for _ in range(rom_size)]
-    rom = [0] + [int(round(((2**16)-1)/float(ii)))
-                 for ii in range(1, rom_size)]
-    rom = tuple(rom)
+    if rom_size == 2**8:
+        rom = get_table('reciprocals')
+    else:
+        rom = reciprocal_rom(rom_size)
     raddr = Signal(addr.val)
     # raddr = Signal(intbv(0)[len(addr):])
 
@@ -1,4 +1,6 @@
 from .zig_zag import zig_zag_scan
 from .zig_zag import zig_zag
+from .zig_zag import zig_zag_indices, zig_zag_blocks, inverse_zig_zag_blocks
 
-__all__ = ["zig_zag_scan", "zig_zag"]
+__all__ = ["zig_zag_scan", "zig_zag", "zig_zag_indices", "zig_zag_blocks",
+           "inverse_zig_zag_blocks"]
@@ -5,47 +5,8 @@ import myhdl
 from myhdl import Signal, intbv, always_comb, always_seq, block
 
 from jpegenc.subblocks.common import outputs_2d, assign_array
-
-
-class zig_zag_scan(object):
-
-    """Zig-Zag Scan Class
-
-    It is used to produce the zig-zag matrix and as a software
-    reference for the zig-zag scan.
-    """
-
-    def __init__(self, N):
-        """Initialize the zig-zag matrix"""
-        self.N = N
-        self.zig_zag_matrix = self.build_zig_zag_matrix(N)
-
-    def build_zig_zag_matrix(self, N):
-        """Build the zig-zag matrix"""
-        """Code taken from http://paddy3118.blogspot.gr/2008/08/zig-zag.html"""
-        def zigzag(n):
-            indexorder = sorted(((x, y) for x in range(n) for y in range(n)),
-                                 key=lambda p: (p[0]+p[1], -p[1] if (p[0]+p[1]) % 2 else p[1]))
-            return dict((index, n) for n, index in enumerate(indexorder))
-
-        def zig_zag_list(myarray):
-            a = []
-            n = int(len(myarray) ** 0.5 + 0.5)
-            for x in range(n):
-                for y in range(n):
-                    a.append(myarray[(x, y)])
-            return a
-
-        return zig_zag_list(zigzag(N))
-
-    def zig_zag(self, signal_list):
-        """Zig-zag scan function"""
-        zig_zag_result = [None for i in range(self.N**2)]
-        for i in range(self.N**2):
-            a = self.zig_zag_matrix[i]
-            zig_zag_result[a] = signal_list[i]
-
-        return zig_zag_result
+from jpegenc.reference.zig_zag import (zig_zag_indices, zig_zag_blocks,
+                                       inverse_zig_zag_blocks, zig_zag_scan)
 
 
 @block
@@ -4,6 +4,9 @@ from __future__ import absolute_import
 from .testing import sim_available
 from .testing import skip_ref_test
 from .testing import run_testbench
+from .trace import TraceConfig, hierarchy_signals
+from .runner import (BenchResult, run_bench, run_benches,
+                     format_results)
 
 from .testbenches import clock_driver
 from .testbenches import reset_on_start
@@ -11,6 +14,8 @@ from .testbenches import pulse_reset
 from .testbenches import toggle_signal
 
 __all__ = [
-    'sim_available', 'skip_ref_test', 'run_testbench',
+    'sim_available', 'skip_ref_test', 'run_testbench', 'BenchResult',
+    'run_bench', 'run_benches', 'format_results', 'TraceConfig',
+    'hierarchy_signals',
     'clock_driver', 'reset_on_start', 'pulse_reset', 'toggle_signal'
 ]
@@ -0,0 +1,135 @@
+"""Parallel testbench runner
+
+The benches are run in a process pool, each bench writes its traces in
+its own scratch directory, so the traces of the different workers do
+not clobber each other and the working directory is never changed. A
+bench is given as a factory and its parameters, factory(**params)
+returns the bench block function. The factories must be module level
+functions, they are pickled to the workers::
+
+    results = run_benches([(bench_counter, dict(seed=seed))
+                           for seed in range(100)], workers=8)
+    print(format_results(results))
+"""
+
+import os
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from timeit import default_timer
+
+import myhdl
+
+from .testing import run_testbench
+
+BenchResult = namedtuple('BenchResult', [
+    'name', 'params', 'passed', 'seconds', 'sim_time', 'cycles', 'error',
+    'directory'])
+
+
+def bench_name(factory, params, index=None):
+    """The name of the scratch directory of a bench"""
+    name = getattr(factory, '__name__', 'bench')
+    if params:
+        name += '_' + '_'.join('{}-{}'.format(key, params[key])
+                               for key in sorted(params))
+    if index is not None:
+        name = '{:04d}_{}'.format(index, name)
+    return ''.join(c if c.isalnum() or c in '-_.' else '-' for c in name)
+
+
+def run_bench(factory, params=None, directory='output/benches', trace=False,
+              period=10, name=None):
+    """Run the bench of factory(**params) in its own directory
+
+    Arguments:
+        factory: returns the bench block function
+        params (dict): the keyword arguments of the factory
+        directory (str): the scratch directory of the bench is created
+            in this directory
+        trace (bool): write the VCD trace in the scratch directory
+        period (int): the clock period, the simulated cycles are the
+            simulated time rounded to whole periods
+        name (str): the name of the scratch directory
+
+    Returns:
+        the BenchResult, error is the traceback of a failed bench
+    """
+    params = dict(params or {})
+    if name is None:
+        name = bench_name(factory, params)
+    workdir = os.path.abspath(os.path.join(directory, name))
+    if not os.path.isdir(workdir):
+        os.makedirs(workdir)
+
+    start = default_timer()
+    error = None
+    try:
+        sim_time = run_testbench(factory(**params), trace=trace,
+                                 bench_id=name, directory=workdir)
+    except Exception:
+        sim_time = myhdl.now()
+        error = traceback.format_exc()
+    seconds = default_timer() - start
+
+    # a bench which stops at a falling edge ran the cycle of the edge
+    cycles = (sim_time + period // 2) // period
+    return BenchResult(name, params, error is None, seconds, sim_time,
+                       cycles, error, workdir)
+
+
+def _run_bench(args):
+    """Process pool task of run_benches"""
+    return run_bench(*args)
+
+
+def run_benches(entries, workers=None, directory='output/benches',
+                trace=False, period=10):
+    """Run the benches in a process pool
+
+    Arguments:
+        entries: the (factory, params) of each bench, a factory without
+            parameters can be given alone
+        workers (int): the number of processes, None for one per CPU,
+            1 runs the benches in this process
+
+    The rest of the arguments are passed to run_bench, the scratch
+    directories are numbered in the order of the entries.
+
+    Returns:
+        the BenchResult of each entry
+    """
+    tasks = []
+    for index, entry in enumerate(entries):
+        if callable(entry):
+            factory, params = entry, {}
+        else:
+            factory, params = entry
+        tasks.append((factory, params, directory, trace, period,
+                      bench_name(factory, params, index)))
+
+    if workers == 1:
+        return [_run_bench(task) for task in tasks]
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(_run_bench, tasks))
+
+
+def format_results(results):
+    """The table of the results and the summary line"""
+    width = max([len(result.name) for result in results] + [5])
+    lines = ['{:<{}}  {:<6} {:>9} {:>10}'.format('bench', width, 'result',
+                                                 'seconds', 'cycles')]
+    for result in results:
+        lines.append('{:<{}}  {:<6} {:>9.3f} {:>10}'.format(
+            result.name, width, 'pass' if result.passed else 'FAIL',
+            result.seconds, result.cycles))
+    failed = [result for result in results if not result.passed]
+    lines.append('{} passed, {} failed, {} cycles in {:.3f} s'.format(
+        len(results) - len(failed), len(failed),
+        sum(result.cycles for result in results),
+        sum(result.seconds for result in results)))
+    for result in failed:
+        lines.append('')
+        lines.append('{}:'.format(result.name))
+        lines.append(result.error.rstrip())
+    return '\n'.join(lines)
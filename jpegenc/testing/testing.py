@@ -5,6 +5,8 @@ import subprocess
 import pytest
 import myhdl
 
+from .trace import TraceConfig, trace_monitor
+
 
 skip_ref_test = pytest.mark.skipif(reason="skip reference cosimulation")
 if hasattr(sys, '_called_from_test'):
@@ -24,18 +26,23 @@ def sim_available(sim='ghdl'):
     return ok
 
 
-def run_testbench(bench, trace=True, bench_id=None):
+def run_testbench(bench, trace=True, bench_id=None, directory='output'):
     """A small wrapper to set common configuration
 
     Arguments:
         bench (myhdl.Block): the test
-        trace (bool): enable tracing
+        trace (bool): enable tracing, a TraceConfig traces the selected
+            signals in its window
         bench_id (str): extra string to append to filenames
+        directory (str): the traces are written in its vcd directory
+
+    Returns:
+        the simulated time
     """
     name = bench.__name__
     inst = bench()
     if trace:
-        vcdpath = 'output/vcd'
+        vcdpath = os.path.join(directory, 'vcd')
         if not os.path.isdir(vcdpath):
             os.makedirs(vcdpath)
 
@@ -49,6 +56,13 @@ def run_testbench(bench, trace=True, bench_id=None):
             os.remove(path)
         nm = name[:-4]
 
+        if isinstance(trace, TraceConfig):
+            with open(path, 'w') as vcdfile:
+                monitor = trace_monitor(inst, trace, vcdfile)
+                myhdl.Simulation(inst, monitor).run()
+            del inst
+            return myhdl.now()
+
         myhdl.traceSignals.name = nm
         myhdl.traceSignals.directory = vcdpath
         myhdl.traceSignals.timescale = '1ns'
@@ -56,6 +70,7 @@ def run_testbench(bench, trace=True, bench_id=None):
 
     inst.run_sim()
     del inst
+    return myhdl.now()
 
 
 def convert_testbench(bench):
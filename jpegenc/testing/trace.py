@@ -0,0 +1,227 @@
+"""Selective and windowed signal tracing
+
+traceSignals traces every signal of the hierarchy for the whole
+simulation. A TraceConfig selects the signals with patterns of their
+hierarchical names and traces them in a time window or while a trigger
+signal is active, the values are written in a VCD file by a monitor
+which runs with the bench::
+
+    trace = TraceConfig(['bench_dct_2d.dct_2d0.dct_1d3.*'],
+                        trigger='bench_dct_2d.dct_2d0.dct_1d3.'
+                                'output_interface_data_valid')
+    run_testbench(bench_dct_2d, trace=trace)
+
+With a scope the patterns and the trigger are relative to a block
+instance and only the signals of its hierarchy are traced::
+
+    trace = TraceConfig('*', trigger='output_interface_data_valid',
+                        scope='bench_dct_2d.dct_2d0.dct_1d3')
+"""
+
+from __future__ import print_function
+
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+
+import myhdl
+from myhdl import SignalType, delay
+
+
+class TraceConfig(object):
+
+    """Selective Tracing Class
+
+    Arguments:
+        signals: fnmatch patterns of the hierarchical signal names, the
+            names are the instance names of the hierarchy and the
+            signal name joined with dots, None traces all the signals
+        start: the simulated time of the first traced values
+        stop: the simulated time of the end of the trace
+        trigger: a Signal or the hierarchical name of a signal, the
+            values are traced only while it equals trigger_level
+        trigger_level: the value of the trigger
+        timescale: the timescale of the VCD file
+        scope: the hierarchical name of a block instance, the names of
+            the signals and of the trigger are relative to the instance
+            and only the signals of its hierarchy are traced
+    """
+
+    def __init__(self, signals=None, start=None, stop=None, trigger=None,
+                 trigger_level=True, timescale='1ns', scope=None):
+        if isinstance(signals, str):
+            signals = [signals]
+        if start is not None and stop is not None and stop <= start:
+            raise ValueError("stop time {} is not after start time {}".format(
+                stop, start))
+        self.signals = signals
+        self.start = start
+        self.stop = stop
+        self.trigger = trigger
+        self.trigger_level = trigger_level
+        self.timescale = timescale
+        self.scope = scope
+
+    def select(self, names):
+        """The hierarchical names which match the patterns"""
+        if self.signals is None:
+            return list(names)
+        return [name for name in names
+                if any(fnmatchcase(name, pattern) for pattern in self.signals)]
+
+
+def hierarchy_signals(inst):
+    """The signals of the hierarchy of a block instance
+
+    The instances are named with their block and are numbered in
+    their parent, bench.dct_2d0.dct_1d3 is the fourth dct_1d of the
+    dct_2d, unlike the names of MyHDL the names do not depend on the
+    blocks elaborated before.
+
+    Returns:
+        OrderedDict of the hierarchical names and the signals, the
+        elements of the lists of signals are named name[i]
+    """
+    signals = OrderedDict()
+
+    def add_signals(block_inst, path):
+        for name in sorted(block_inst.sigdict):
+            signals[path + '.' + name] = block_inst.sigdict[name]
+        for name in sorted(block_inst.memdict):
+            memory = block_inst.memdict[name]
+            for index, sig in enumerate(getattr(memory, 'mem', memory)):
+                if isinstance(sig, SignalType):
+                    signals['{}.{}[{}]'.format(path, name, index)] = sig
+        numbers = {}
+        for sub in block_inst.subs:
+            # the block instances, not the generators
+            if hasattr(sub, 'subs') and hasattr(sub, 'sigdict'):
+                name = sub.func.__name__
+                numbers[name] = numbers.get(name, -1) + 1
+                add_signals(sub, '{}.{}{}'.format(path, name, numbers[name]))
+
+    add_signals(inst, inst.func.__name__)
+    return signals
+
+
+def _var_width(sig):
+    """The VCD width of a signal, 0 for the values which are not
+    traced"""
+    if isinstance(sig.val, bool):
+        return 1
+    if isinstance(sig.val, (int, myhdl.intbv)):
+        return len(sig) or 32
+    return 0
+
+
+def _var_value(sig, width):
+    """The VCD value of a signal"""
+    if width == 1:
+        return '1' if sig.val else '0'
+    return 'b{:b} '.format(int(sig.val) & ((1 << width) - 1))
+
+
+def _var_code(index):
+    """The identifier code of the index-th VCD variable"""
+    code = ''
+    while True:
+        index, rest = divmod(index, 94)
+        code = chr(33 + rest) + code
+        if not index:
+            return code
+        index -= 1
+
+
+def trace_monitor(inst, config, vcdfile):
+    """Write the VCD header of the selected signals of inst and return
+    the monitor generator which writes their values
+
+    Arguments:
+        inst: the block instance of the bench
+        config: the TraceConfig
+        vcdfile: the VCD file object
+    """
+    signals = hierarchy_signals(inst)
+    prefix = ''
+    if config.scope is not None:
+        prefix = config.scope + '.'
+        signals = OrderedDict((name[len(prefix):], sig)
+                              for name, sig in signals.items()
+                              if name.startswith(prefix))
+        if not signals:
+            raise ValueError("no block instance {}".format(config.scope))
+    names = [name for name in config.select(signals)
+             if _var_width(signals[name])]
+    if not names:
+        raise ValueError("no signals match {}".format(config.signals))
+
+    trigger = config.trigger
+    if trigger is not None and not isinstance(trigger, SignalType):
+        if trigger not in signals:
+            raise ValueError("no trigger signal {}".format(trigger))
+        trigger = signals[trigger]
+
+    # the same signal has the same code in all the scopes
+    codes = OrderedDict()
+    variables = []
+    for name in names:
+        sig = signals[name]
+        if id(sig) not in codes:
+            codes[id(sig)] = (_var_code(len(codes)), sig, _var_width(sig))
+        variables.append(((prefix + name).split('.'), codes[id(sig)]))
+
+    print("$date\n    {}\n$end".format(time.asctime()), file=vcdfile)
+    print("$version\n    MyHDL {}\n$end".format(myhdl.__version__),
+          file=vcdfile)
+    print("$timescale\n    {}\n$end\n".format(config.timescale),
+          file=vcdfile)
+    scope = []
+    for path, (code, sig, width) in variables:
+        common = 0
+        while (common < len(scope) and common < len(path) - 1 and
+               scope[common] == path[common]):
+            common += 1
+        for _ in scope[common:]:
+            print("$upscope $end", file=vcdfile)
+        for name in path[common:-1]:
+            print("$scope module {} $end".format(name), file=vcdfile)
+        scope = path[:-1]
+        print("$var {} {} {} {} $end".format(
+            'wire' if width == 1 else 'reg', width, code, path[-1]),
+            file=vcdfile)
+    for _ in scope:
+        print("$upscope $end", file=vcdfile)
+    print("\n$enddefinitions $end", file=vcdfile)
+
+    events = [sig for _, sig, _ in codes.values()]
+    if trigger is not None and id(trigger) not in codes:
+        events.append(trigger)
+
+    def monitor():
+        """write the changed values while the trace is active"""
+        values = {}
+        written_time = None
+        if config.start:
+            yield delay(config.start)
+        while True:
+            now = myhdl.now()
+            if config.stop is not None and now >= config.stop:
+                return
+            if trigger is None or trigger.val == config.trigger_level:
+                for code, sig, width in codes.values():
+                    value = _var_value(sig, width)
+                    if values.get(code) != value:
+                        if written_time != now:
+                            print("#{}".format(now), file=vcdfile)
+                            written_time = now
+                        print(value + code, file=vcdfile)
+                        values[code] = value
+            else:
+                # all the values are written when the trigger is active
+                values.clear()
+            if config.stop is not None:
+                yield tuple(events) + (delay(config.stop - now),)
+            else:
+                yield tuple(events)
+
+    return monitor()
@@ -12,7 +12,13 @@ setup(
     author_email='merkourioskatsimpris@gmail.com',
     url='https://github.com/cfelton/test_jpeg',
     packages=find_packages(),
+    package_data={'jpegenc': ['subblocks/huffman/*.csv',
+                              'subblocks/quantizer/*.csv']},
     install_requires = ['myhdl >= 1.0.dev', 'Pillow >= 3.0.0'],
+    entry_points={
+        'console_scripts': ['jpegenc = jpegenc.soft.cli:main',
+                            'jpegenc-server = jpegenc.soft.server:main'],
+    },
     classifiers=[
             'License :: OSI Approved :: BSD License',
             'Programming Language :: Python',
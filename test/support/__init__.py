@@ -2,6 +2,7 @@
 from __future__ import absolute_import
 
 from .jpeg_prep_cosim import prep_cosim
+from .jpeg_build import build_verilog, BuildError
 from .jpeg_v1_intf import JPEGEncV1
 from .jpeg_v2_intf import JPEGEncV2
 
@@ -0,0 +1,93 @@
+from __future__ import print_function, division, absolute_import
+
+import os
+import shutil
+import hashlib
+import subprocess
+from timeit import default_timer
+
+
+class BuildError(Exception):
+    pass
+
+
+_compiler_versions = {}
+
+
+def compiler_version(compiler='iverilog'):
+    """The version line of the compiler, `iverilog -V`"""
+    if compiler not in _compiler_versions:
+        try:
+            proc = subprocess.Popen([compiler, '-V'], stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT)
+            output, _ = proc.communicate()
+        except (OSError, IOError) as err:
+            raise BuildError("%s is not available: %s" % (compiler, err,))
+        lines = output.decode('utf-8', 'replace').splitlines()
+        _compiler_versions[compiler] = lines[0] if lines else ''
+    return _compiler_versions[compiler]
+
+
+def build_hash(filelist, defines=(), compiler='iverilog'):
+    """The hash of the compiler version, the defines and the names and
+    the contents of the files
+    """
+    sha = hashlib.sha1()
+    sha.update(compiler_version(compiler).encode())
+    for define in defines:
+        sha.update(b'-D' + str(define).encode() + b'\0')
+    for fn in filelist:
+        if not os.path.isfile(fn):
+            raise BuildError("missing source file %s" % (fn,))
+        sha.update(fn.encode() + b'\0')
+        with open(fn, 'rb') as source:
+            sha.update(hashlib.sha1(source.read()).digest())
+    return sha.hexdigest()
+
+
+def build_verilog(target, filelist, defines=(), cache_dir='build_cache',
+                  compiler='iverilog'):
+    """Compile the Verilog files to target unless the same build is in
+    the cache
+
+    The builds are saved in cache_dir with the hash of the build and
+    the compiler output is saved in a log next to them.
+
+    Arguments:
+        target: the compiled output, e.g. `jpegenc` for vvp
+        filelist: the Verilog files
+        defines: the define flags, e.g. ['VTRACE', 'VTRACE_LEVEL=0']
+
+    Returns:
+        (cached, seconds) True when the build was in the cache and the
+        build time
+    """
+    start = default_timer()
+    filelist = [fn.strip() for fn in filelist]
+    key = build_hash(filelist, defines, compiler)
+    name = os.path.basename(target)
+    output = os.path.join(cache_dir, "%s-%s" % (name, key,))
+    cached = os.path.isfile(output)
+
+    if not cached:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        cmd = [compiler, '-g2001', '-o', output + '.tmp']
+        for define in defines:
+            cmd += ['-D', str(define)]
+        cmd += filelist
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+        log, _ = proc.communicate()
+        log = log.decode('utf-8', 'replace')
+        logfn = output + '.log'
+        with open(logfn, 'w') as logfile:
+            logfile.write(" ".join(cmd) + "\n" + log)
+        if proc.returncode != 0 or not os.path.isfile(output + '.tmp'):
+            raise BuildError("%s failed with return code %d, see %s\n%s" %
+                             (name, proc.returncode, logfn, log,))
+        # a failed or an interrupted build is never in the cache
+        os.rename(output + '.tmp', output)
+
+    shutil.copyfile(output, target)
+    return cached, default_timer() - start
@@ -6,6 +6,7 @@ from argparse import Namespace
 from myhdl import *
 from .jpeg_filelist import filelist_v1
 from .jpeg_filelist import filelist_v2
+from .jpeg_build import build_verilog
 
 
 def prep_cosim(clock, reset, jpgv1, jpgv2, args=None):
@@ -13,37 +14,31 @@ def prep_cosim(clock, reset, jpgv1, jpgv2, args=None):
     """
     global filelist_v1, filelist_v2
 
-    # build the first JPEG encoder
-    # @note: this encoder is still being converted to 
-    #    Verilog, for now just build
+    # build the JPEG encoders and the testbench, the builds are
+    # cached, a build is skipped when the files, the defines and the
+    # compiler did not change
+    builds = []
     if not args.build_skip_v1:
-        # @todo: save std* and create log
-        cmd = "iverilog -g2001 -o jpegenc_v1 %s" % (" ".join(filelist_v1))
-        print("compiling v1 ...")
-        os.system(cmd)
-
-        # @todo: remove the following for good
-        # cmd = "iverilog -g2001 -t vhdl -o jpegenc_v1.vhd %s" % (" ".join(filelist_v1))
-        # os.system(cmd)
-
-    # build the second JPEG encoder
-    # @todo: use subprocess, check the return and the "log"
-    #   to verify it build correctly.
-    cmd = "iverilog -g2001 -o jpegenc_v2 %s " % (" ".join(filelist_v2))
-    print("compiling v2 ...")
-    os.system(cmd)
+        # @note: this encoder is still being converted to
+        #    Verilog, for now just build
+        builds.append(('v1', 'jpegenc_v1', filelist_v1, []))
+    builds.append(('v2', 'jpegenc_v2', filelist_v2, []))
 
     files = ['tb_jpegenc.v']
-    vstr = "-D VTRACE" if args.vtrace else ""
-    dstr = "%s -D VTRACE_LEVEL=%d -D VTRACE_MODULE=%s " % \
-           (vstr, args.vtrace_level, args.vtrace_module)
-    cmd = "iverilog -g2001 -o jpegenc %s %s %s %s" % \
-          (dstr,
-           " ".join(filelist_v1), 
-           " ".join(filelist_v2),
-           " ".join(files), )
-    print("compiling testbench ...")
-    os.system(cmd)
+    defines = ["VTRACE_LEVEL=%d" % (args.vtrace_level,),
+               "VTRACE_MODULE=%s" % (args.vtrace_module,)]
+    if args.vtrace:
+        defines.insert(0, "VTRACE")
+    builds.append(('testbench', 'jpegenc',
+                   filelist_v1 + filelist_v2 + files, defines))
+
+    args.build_time = 0
+    for name, target, filelist, defines in builds:
+        cached, seconds = build_verilog(target, filelist, defines)
+        print("compiling %s ... %s in %.3f s" %
+              (name, "cached" if cached else "built", seconds,))
+        args.build_time += seconds
+    print("build time %.3f s" % (args.build_time,))
 
     if not os.path.exists('vcd'):
         os.makedirs('vcd')
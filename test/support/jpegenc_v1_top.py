@@ -65,7 +65,7 @@ def jpegenc_top(
 
 jpegenc_top.portmap = dict(
     clock=Signal(bool(0)),
-    reset=ResetSignal(0, active=1, async=True),
+    reset=ResetSignal(0, active=1, isasync=True),
     datain=Signal(intbv(0)[8:0]),
     datain_valid=Signal(bool(0)),
     dataout=Signal(intbv(0)[8:0]),
@@ -1,11 +1,19 @@
 """This module tests the functionality and conversion of Entropy Coder"""
 
+import numpy as np
+import pytest
+
 from myhdl import block, instance, modbv
 from myhdl import intbv, ResetSignal, Signal, StopSimulation
 from myhdl.conversion import verify
 
 from jpegenc.subblocks.backend.backend import backend
-from jpegenc.subblocks.backend.backend_soft import backend_ref
+from jpegenc.subblocks.backend.backend_tlm import backend_tlm
+from jpegenc.subblocks.backend.backend_soft import backend_ref, BitWriter
+from jpegenc.subblocks.backend.backend_soft import divider, divider_blocks
+from jpegenc.subblocks.backend.backend_soft import bytestuffer, stuff_bytes
+from jpegenc.subblocks.backend.backend_soft import runlength, entropy_encode
+from jpegenc.subblocks.backend.backend_soft import runlength_blocks, pack_bits
 
 from jpegenc.testing import run_testbench
 from jpegenc.testing import (clock_driver, reset_on_start,
@@ -91,6 +99,131 @@ def backend_soft():
     return outputs_fin
 
 
+def test_bit_writer():
+    """The BitWriter must give the same bytes as the string register"""
+    blocks = [block_1, block_2, block_3, block_4, block_5, block_6]
+    color_components = [1, 2, 2, 3, 4, 5]
+    output_ref = [int(byte, 2) for byte in backend_soft()]
+
+    prev_dc_0, prev_dc_1, prev_dc_2, pointer = 0, 0, 0, 0
+    register = BitWriter()
+    outputs_fin = b''
+    for block, color_component in zip(blocks, color_components):
+        prev_dc_0, prev_dc_1, prev_dc_2, register, pointer, outputs = \
+            backend_ref(block, prev_dc_0, prev_dc_1, prev_dc_2, register,
+                        color_component, pointer)
+        outputs_fin += outputs
+    assert bytearray(outputs_fin) == bytearray(output_ref)
+
+    # stuffing of 0xFF bytes and padding of the last byte
+    writer = BitWriter()
+    writer.write(0x1FF, 9)
+    writer.write(0x7F, 7)
+    writer.write(0x2, 2)
+    writer.flush()
+    assert writer.getvalue() == b'\xff\x00\xff\x00\xbf'
+    assert writer.pointer == 0
+
+
+def test_divider_blocks():
+    """The vectorized divider must give the same outputs as divider"""
+    samples = 30
+    blocks = np.random.randint(-2048, 2048, size=(samples, 64))
+    color_components = np.random.randint(0, 4, size=samples)
+    outputs = divider_blocks(blocks, color_components)
+    for block, color_component, output in zip(blocks, color_components,
+                                              outputs):
+        assert output.tolist() == divider(block.tolist(), color_component)
+    assert np.array_equal(divider_blocks(blocks, 2),
+                          divider_blocks(blocks, [2]*samples))
+
+
+def test_runlength_blocks():
+    """The vectorized runlength must give the symbols of runlength"""
+    samples = 40
+    blocks = np.random.randint(-1024, 1024, size=(samples, 64))
+    blocks[np.random.rand(samples, 64) < 0.8] = 0
+    # long runs of zeros, ZRLs before the last coefficient and EOBs
+    blocks[:4, 1:] = 0
+    blocks[1, 63] = 5
+    blocks[2, [16, 47]] = [-3, 1]
+    blocks[3, 32] = 2
+    color_components = np.random.randint(0, 4, size=samples)
+    runs, sizes, amplitudes, block_offsets, prev_dc = runlength_blocks(
+        blocks, color_components, (7, -5, 3))
+    prev_dc_ref = [7, -5, 3]
+    for i in range(samples):
+        output, accumulator, prev_dc_ref[0], prev_dc_ref[1], prev_dc_ref[2] = \
+            runlength(blocks[i].tolist(), color_components[i], *prev_dc_ref)
+        symbols = slice(block_offsets[i], block_offsets[i + 1])
+        assert runs[symbols].tolist() == output
+        for value, size, amplitude in zip(accumulator, sizes[symbols],
+                                          amplitudes[symbols]):
+            amplitude_ref, size_ref = entropy_encode(value)
+            assert size == size_ref
+            assert amplitude == amplitude_ref & ((1 << size_ref) - 1)
+    assert prev_dc == tuple(prev_dc_ref)
+
+    # a ZRL of the JPEG standard is a run of 16 zeros
+    runs, sizes, _, block_offsets, _ = runlength_blocks(blocks[2:4], 1,
+                                                        zrl_run=16)
+    assert runs.tolist() == [0, 15, 15, 14, 0, 0, 15, 15, 0]
+    assert block_offsets.tolist() == [0, 5, 9]
+
+
+def test_pack_bits():
+    """pack_bits must give the bytes of the BitWriter"""
+    lengths = np.random.randint(0, 28, size=200)
+    codes = np.random.randint(0, 2**27, size=200) & ((1 << lengths) - 1)
+    writer = BitWriter(stuffing=False)
+    for code, length in zip(codes.tolist(), lengths.tolist()):
+        writer.write(code, length)
+    writer.flush()
+    assert pack_bits(codes, lengths) == writer.getvalue()
+    assert pack_bits([0b101], [3], pad_bit=0) == b'\xa0'
+    assert pack_bits([], []) == b''
+
+    # the vectorized writes in chunks with the byte stuffing
+    codes[::7] = (1 << lengths[::7]) - 1
+    writer = BitWriter()
+    for code, length in zip(codes.tolist(), lengths.tolist()):
+        writer.write(code, length)
+    writer.flush()
+    chunk_writer = BitWriter()
+    bounds = [0, 3, 50, 50, 131, 200]
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        chunk_writer.write_codes(codes[start:stop], lengths[start:stop])
+    chunk_writer.flush()
+    assert chunk_writer.getvalue() == writer.getvalue()
+
+
+def test_stuff_bytes():
+    """Byte stuffing of bytes and of lists of bit strings"""
+    data = b'\x12\xff\xff\x34\xff'
+    assert stuff_bytes(data) == (b'\x12\xff\x00\xff\x00\x34\xff\x00', 3)
+    assert stuff_bytes(memoryview(bytearray(data)))[0] == stuff_bytes(data)[0]
+
+    out = bytearray(10)
+    buffer, num_stuffed = stuff_bytes(data, out)
+    assert buffer is out and num_stuffed == 3
+    assert out[:len(data) + num_stuffed] == stuff_bytes(data)[0]
+    with pytest.raises(ValueError):
+        stuff_bytes(data, bytearray(4))
+
+    # the bytes of out after the stuffed data are not written
+    for data in (b'', b'\x12\x34', b'\xff', b'\xff\x01\xff\xff\x02'):
+        out = bytearray(b'\xaa'*12)
+        stuffed, num_stuffed = stuff_bytes(data)
+        assert stuff_bytes(memoryview(data), memoryview(out))[1] == \
+            num_stuffed
+        assert out == stuffed + b'\xaa'*(12 - len(stuffed))
+
+    block = ['00010010', '11111111', '11111111']
+    assert bytestuffer(block) == ['00010010', '11111111', '0b0',
+                                  '11111111', '0b0']
+    assert len(block) == 3
+
+
 def test_backend():
     """
     We will test the functionality of entropy coder in this block
@@ -109,7 +242,7 @@ def test_backend():
 
     # clock and reset signals
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # declaration of input signal
     data_in = Signal(intbv(0)[width_data:])
@@ -269,6 +402,77 @@ def test_backend():
     run_testbench(bench_backend)
 
 
+def test_backend_tlm():
+    """The transaction level backend must give the bytes of the reference"""
+    blocks = [block_1, block_2, block_3, block_4, block_5, block_6]
+    # signed coefficients and the tables of all the color components
+    blocks += np.random.randint(-300, 300, size=(4, 64)).tolist()
+    color_components = [1, 2, 3, 1, 2, 3, 1, 2, 3, 1]
+    output_ref = b''
+    prev_dc_0, prev_dc_1, prev_dc_2, pointer = 0, 0, 0, 0
+    register = BitWriter()
+    for block_in, color_component in zip(blocks, color_components):
+        prev_dc_0, prev_dc_1, prev_dc_2, register, pointer, outputs = \
+            backend_ref(block_in, prev_dc_0, prev_dc_1, prev_dc_2, register,
+                        color_component, pointer)
+        output_ref += outputs
+
+    width_data = 12
+    clock = Signal(bool(0))
+    reset = ResetSignal(0, active=True, isasync=True)
+    data_in = Signal(intbv(0)[width_data:])
+    write_addr = Signal(modbv(0)[7:])
+    ready = Signal(bool(0))
+    data_out = Signal(intbv(0)[width_data:])
+    valid_data = Signal(bool(0))
+    start_block = Signal(bool(0))
+    addr = Signal(intbv(0)[24:])
+    num_enc_bytes = Signal(intbv(0)[24:])
+
+    @block
+    def bench_backend_tlm():
+        """The blocks are written and started as in test_backend"""
+        inst = backend_tlm(clock, reset, start_block, data_in,
+                           write_addr, valid_data, data_out,
+                           ready, addr, num_enc_bytes, cycles=80,
+                           color_components=color_components)
+        inst_clock = clock_driver(clock)
+
+        @instance
+        def tbstim():
+            output_model = {}
+            yield pulse_reset(reset, clock)
+            write_addr.next = 64
+            for block_in in blocks + [None]*3:
+                if block_in is not None:
+                    valid_data.next = True
+                    for value in block_in:
+                        data_in.next = value & 0xFFF
+                        yield clock.posedge
+                        write_addr.next = write_addr + 1
+                    valid_data.next = False
+                    yield clock.posedge
+
+                yield toggle_signal(start_block, clock)
+                cycles = 0
+                while not ready:
+                    output_model[int(addr)] = int(data_out)
+                    cycles += 1
+                    yield clock.posedge
+                assert cycles >= 80 - 2
+
+            outputs = bytes(bytearray(output_model[i]
+                                      for i in range(len(output_model))))
+            assert outputs == output_ref
+            assert num_enc_bytes == len(output_ref) + 2
+
+            raise StopSimulation
+
+        return tbstim, inst, inst_clock
+
+    run_testbench(bench_backend_tlm)
+
+
 def test_backend_conversion():
     """
     We will test the functionality of entropy coder in this block
@@ -287,7 +491,7 @@ def test_backend_conversion():
 
     # clock and reset signals
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # declaration of input signal
     data_in = Signal(intbv(0)[width_data:])
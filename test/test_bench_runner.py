@@ -0,0 +1,64 @@
+"""This module tests the parallel testbench runner"""
+
+import os
+
+from myhdl import block, instance, Signal, StopSimulation, modbv
+
+from jpegenc.testing import run_benches, format_results
+from jpegenc.testing import clock_driver
+
+
+def bench_counter(count, expected):
+    """A counter which must reach expected after count cycles"""
+    clock = Signal(bool(0))
+    value = Signal(modbv(0)[8:])
+
+    @block
+    def bench_counter():
+        inst_clock = clock_driver(clock)
+
+        @instance
+        def tbstim():
+            for _ in range(count):
+                yield clock.posedge
+                value.next = value + 1
+            yield clock.negedge
+            assert value == expected
+            raise StopSimulation
+
+        return tbstim, inst_clock
+
+    return bench_counter
+
+
+def test_run_benches(tmpdir):
+    """The benches run in their own directories and fail independently"""
+    entries = [(bench_counter, dict(count=count, expected=count))
+               for count in (3, 10, 20)]
+    entries.append((bench_counter, dict(count=5, expected=4)))
+    directory = str(tmpdir)
+    results = run_benches(entries, workers=2, directory=directory,
+                          trace=True)
+
+    assert [result.passed for result in results] == [True]*3 + [False]
+    # the first rising edge of the clock is at time 0, the benches stop
+    # at the falling edge after count rising edges
+    assert [result.sim_time for result in results] == [25, 95, 195, 45]
+    assert [result.cycles for result in results] == [3, 10, 20, 5]
+    assert 'AssertionError' in results[-1].error
+    assert len(set(result.directory for result in results)) == 4
+    for result in results:
+        assert os.path.dirname(result.directory) == directory
+        assert os.listdir(os.path.join(result.directory, 'vcd'))
+        assert result.params['count'] in (3, 10, 20, 5)
+
+    table = format_results(results)
+    assert '3 passed, 1 failed, 38 cycles' in table
+    assert results[-1].name in table.splitlines()[4]
+
+    # the runs in this process give the same results
+    cwd = os.getcwd()
+    serial = run_benches(entries, workers=1, directory=directory)
+    assert os.getcwd() == cwd
+    assert [(result.passed, result.cycles) for result in serial] == \
+        [(result.passed, result.cycles) for result in results]
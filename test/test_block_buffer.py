@@ -11,7 +11,7 @@ from jpegenc.testing import run_testbench
 def test_block_buffer():
 
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=1, async=False)
+    reset = ResetSignal(0, active=1, isasync=False)
     pxl = PixelStream()
     bmem = ImageBlock(pxl, )
 
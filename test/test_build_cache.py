@@ -0,0 +1,69 @@
+"""This module tests the build cache of the reference design cosimulation"""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from support import build_verilog, BuildError
+
+
+FAKE_COMPILER = """#!{python}
+import sys
+args = sys.argv[1:]
+if args == ['-V']:
+    print('Icarus Verilog version 10.1 (fake)')
+    sys.exit(0)
+with open('{calls}', 'a') as calls:
+    calls.write(' '.join(args) + '\\n')
+output = args[args.index('-o') + 1]
+sources = [arg for arg in args if arg.endswith('.v')]
+if any('error' in open(fn).read() for fn in sources):
+    print('syntax error')
+    sys.exit(2)
+with open(output, 'w') as compiled:
+    compiled.write(' '.join(args))
+"""
+
+
+def test_build_verilog(tmpdir):
+    """Unchanged builds are copied from the cache"""
+    compiler = str(tmpdir.join('iverilog'))
+    calls = str(tmpdir.join('calls'))
+    with open(compiler, 'w') as script:
+        script.write(FAKE_COMPILER.format(python=sys.executable, calls=calls))
+    os.chmod(compiler, os.stat(compiler).st_mode | stat.S_IEXEC)
+
+    source = tmpdir.join('top.v')
+    source.write('module top; endmodule\n')
+    target = str(tmpdir.join('top'))
+    cache_dir = str(tmpdir.join('cache'))
+
+    def build(defines=()):
+        return build_verilog(target, [str(source) + '   '], defines,
+                             cache_dir=cache_dir, compiler=compiler)
+
+    def num_calls():
+        with open(calls) as calls_file:
+            return len(calls_file.readlines())
+
+    assert not build()[0]
+    assert build()[0] and num_calls() == 1
+    assert os.path.isfile(target)
+
+    # the defines and the contents of the files are in the hash
+    assert not build(['VTRACE'])[0]
+    assert '-D VTRACE' in open(target).read()
+    assert build()[0] and num_calls() == 2
+    source.write('module top; wire a; endmodule\n')
+    assert not build()[0] and num_calls() == 3
+
+    # a failed build raises and is not cached
+    source.write('module top; error endmodule\n')
+    with pytest.raises(BuildError) as excinfo:
+        build()
+    assert 'syntax error' in str(excinfo.value)
+    with pytest.raises(BuildError):
+        build()
+    assert num_calls() == 5
@@ -31,7 +31,7 @@ def test_bytestuffer():
 
     # clock and reset signals
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # input, output and control interfaces
     bs_in_stream = BSInputDataStream(width_data)
@@ -110,7 +110,7 @@ def test_block_conversion():
 
     # clock and reset signals
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # input, output and control interfaces
     bs_in_stream = BSInputDataStream(width_data)
@@ -81,7 +81,7 @@ def test_dct_1d():
     samples, fract_bits, out_prec, N = 10, 14, 10, 9
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     inputs = input_1d_1st_stage()
     outputs = output_interface(out_prec, N)
@@ -133,7 +133,7 @@ def test_dct_1d_conversion():
     samples, fract_bits, out_prec, N = 10, 14, 10, 8
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     inputs = input_1d_1st_stage()
     outputs = output_interface(out_prec, N)
@@ -97,7 +97,7 @@ def test_dct_2d():
     samples, fract_bits, output_bits, stage_1_prec, N = 5, 14, 10, 10, 8
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     inputs = input_interface()
     outputs = outputs_2d(output_bits, N)
@@ -139,6 +139,83 @@ def test_dct_2d():
     run_testbench(bench_dct_2d)
 
 
+def test_dct_2d_transformation_blocks():
+    """Batched 2D-DCT Software Reference Test
+
+    The batched software reference must give the same outputs as the
+    per-block software reference
+    """
+    samples, N = 100, 8
+    dct_obj = dct_2d_transformation(N)
+    blocks = np.random.randint(0, 256, size=(samples, N, N))
+
+    outputs = dct_obj.dct_2d_transformation_blocks(blocks)
+    assert outputs.shape == (samples, N, N)
+    for block, output in zip(blocks, outputs):
+        assert output.tolist() == dct_obj.dct_2d_transformation(block)
+
+    outputs_32 = dct_obj.dct_2d_transformation_blocks(blocks, np.float32)
+    assert np.abs(outputs_32 - outputs).max() <= 1
+
+
+def test_dct_2d_fixed_point():
+    """2D-DCT Bit-exact Software Model Test
+
+    The outputs of the 2d-dct module must be identical to the outputs
+    of the fixed point software model for different precisions
+    """
+
+    samples, N = 3, 8
+
+    for fract_bits, output_bits, stage_1_prec in ((14, 10, 10),
+                                                  (10, 12, 12),
+                                                  (8, 9, 9),
+                                                  (14, 10, 12),
+                                                  (12, 11, 9)):
+        clock = Signal(bool(0))
+        reset = ResetSignal(1, active=True, isasync=True)
+
+        inputs = input_interface()
+        outputs = outputs_2d(output_bits, N)
+
+        blocks = np.random.randint(0, 256, size=(samples, N, N))
+        blocks[0] = np.random.choice([0, 255], size=(N, N))
+        expected_outputs = dct_2d_transformation(N).dct_2d_fixed_point(
+            blocks, fract_bits, stage_1_prec, output_bits)
+        actual_outputs = []
+
+        @myhdl.block
+        def bench_dct_2d():
+            tdut = dct_2d(inputs, outputs, clock, reset, fract_bits,
+                          stage_1_prec, output_bits, N)
+            tbclock = clock_driver(clock)
+
+            @instance
+            def tbstim():
+                yield pulse_reset(reset, clock)
+                inputs.data_valid.next = True
+
+                for pixel in blocks.flatten():
+                    inputs.data_in.next = int(pixel)
+                    yield clock.posedge
+
+            @instance
+            def monitor():
+                while len(actual_outputs) != samples:
+                    yield clock.posedge
+                    yield delay(1)
+                    if outputs.data_valid:
+                        actual_outputs.append([int(out_sig) for out_sig
+                                               in outputs.out_sigs])
+                raise StopSimulation
+
+            return tdut, tbclock, tbstim, monitor
+
+        run_testbench(bench_dct_2d)
+        assert expected_outputs.reshape(samples, N**2).tolist() == \
+            actual_outputs
+
+
 @pytest.mark.skipif(not simsok, reason="missing installed simulator")
 def test_dct_2d_conversion():
     """Convertible 2D-DCT Test
@@ -149,7 +226,7 @@ def test_dct_2d_conversion():
     samples, fract_bits, output_bits, stage_1_prec, N = 5, 14, 10, 10, 8
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     inputs = input_interface()
     outputs = outputs_2d(output_bits, N)
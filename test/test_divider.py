@@ -18,7 +18,7 @@ def test_divider():
 
     # clock and reset signals
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     width_dividend = 5
     width_divisor = 8
@@ -91,7 +91,7 @@ def test_block_conversion():
     """Test bench used for conversion purpose"""
 
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     dividend = Signal(intbv(0)[12:].signed())
     divisor = Signal(intbv(0)[8:])
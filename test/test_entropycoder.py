@@ -30,7 +30,7 @@ def test_entropycoder():
 
     # clock and reset signals
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # declaration of input signal
     data_in = Signal(intbv(0)[width_data:].signed())
@@ -85,7 +85,7 @@ def test_block_conversion():
 
     # clock and reset signal declaration
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # input and output signal declarations
     data_in = Signal(intbv(0)[width_data:].signed())
@@ -14,6 +14,7 @@ from myhdl.conversion import verify
 
 from jpegenc.subblocks.common import outputs_frontend_new, inputs_frontend_new, assign_array
 from jpegenc.subblocks.frontend import frontend_top_level_v2, frontend_transform
+from jpegenc.subblocks.frontend import frontend_transform_blocks, image_to_blocks
 
 from jpegenc.testing import sim_available, run_testbench
 from jpegenc.testing import clock_driver, reset_on_start, pulse_reset
@@ -101,7 +102,7 @@ def test_frontend():
     samples, N = 2, 8
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     inputs = inputs_frontend_new()
     outputs = outputs_frontend_new()
@@ -159,6 +160,34 @@ def test_frontend():
 
     run_testbench(bench_frontend)
 
+def test_frontend_transform_blocks():
+    """Vectorized frontend software reference test
+
+    The vectorized frontend must give exactly the same outputs as the
+    per-block software reference
+    """
+    samples, N = 50, 8
+    blocks = np.random.randint(0, 256, size=(samples, N, N, 3))
+    # a few pixel values which lie on the rounding boundaries
+    blocks[:10] = np.random.choice([0, 1, 2, 127, 128, 255],
+                                   size=(10, N, N, 3))
+
+    outputs = frontend_transform_blocks(blocks)
+    assert outputs.shape == (samples, 3, N**2)
+    for block, output in zip(blocks, outputs):
+        expected = frontend_transform(block[..., 0].tolist(),
+                                      block[..., 1].tolist(),
+                                      block[..., 2].tolist())
+        assert output.tolist() == expected
+
+    # a whole image is split in blocks row by row
+    image = np.random.randint(0, 256, size=(2*N, 3*N, 3))
+    outputs = frontend_transform_blocks(image)
+    assert outputs.shape == (6, 3, N**2)
+    assert np.array_equal(image_to_blocks(image)[4], image[N:, N:2*N])
+    assert np.array_equal(
+        outputs[4], frontend_transform_blocks(image[N:, N:2*N][None])[0])
+
 @pytest.mark.skipif(not simsok, reason="missing installed simulator")
 def test_frontend_conversion():
     """Convertible Frontend Part of the JPEG Encoder Test
@@ -169,7 +198,7 @@ def test_frontend_conversion():
     samples, N = 2, 8
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     inputs = inputs_frontend_new()
     outputs = outputs_frontend_new()
@@ -91,7 +91,7 @@ def test_huffman():
 
     # clock and reset signals
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=1, async=True)
+    reset = ResetSignal(0, active=1, isasync=True)
 
     # width of the runlength
     width_runlength = 4
@@ -197,7 +197,7 @@ def test_block_conversion():
 
     # clock and reset signals
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=1, async=True)
+    reset = ResetSignal(0, active=1, isasync=True)
 
     # width of the runlength
     width_runlength = 4
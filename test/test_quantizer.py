@@ -76,7 +76,7 @@ def test_quantizer():
 
     # declare clock and reset
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # width of the input data
     width_data = 12
@@ -145,7 +145,7 @@ def test_quant_conversion():
 
     # clock, reset signals declared
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # width of the input data
     width_data = 12
@@ -73,7 +73,7 @@ def test_quantizer_core():
 
     # clock and reset signals declared here
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # width of the input data
     width_data = 12
@@ -144,7 +144,7 @@ def test_block_conversion():
     """Test bench used for conversion purpose"""
 
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=True, async=True)
+    reset = ResetSignal(0, active=True, isasync=True)
 
     # width of the input data
     width_data = 12
@@ -23,13 +23,14 @@ def test_jpegenc(args=None):
     args = set_default_args(args)
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=1, async=True)
+    reset = ResetSignal(1, active=1, isasync=True)
 
     jpgv1 = JPEGEncV1(clock, reset, args=args)
     jpgv2 = JPEGEncV2(clock, reset, args=args)
 
     # prepare the cosimulation
     tbdut = prep_cosim(clock, reset, jpgv1, jpgv2, args=args)   
+    sim_start_time = datetime.datetime.now()
     
     # save the bitstreams here
     v1_bic, v2_bic = [None], [None]
@@ -97,8 +98,8 @@ def test_jpegenc(args=None):
                 dump_bitstreams(v1_bic[0], v2_bic[0], args)
 
             end_time = datetime.datetime.now()
-            dt = end_time - args.start_time
-            print("end simulation %s" % (dt,))
+            dt = end_time - sim_start_time
+            print("end simulation %s, build %.3f s" % (dt, args.build_time,))
             raise StopSimulation
             
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
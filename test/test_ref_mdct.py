@@ -9,7 +9,7 @@ from myhdl import (Signal, ResetSignal, intbv, always, delay, instance,
                    StopSimulation)
 
 from jpegenc.testing import skip_ref_test
-from support import get_cli_args
+from support import get_cli_args, build_verilog
 
 
 class DataBus(object):
@@ -30,8 +30,9 @@ def prep_cosim(clock, reset, datai, datao, args=None):
     for ff in filelist:
         assert os.path.isfile(ff), "%s" % (ff,)
 
-    cmd = "iverilog -g2001 -o mdct %s" % (" ".join(filelist))
-    os.system(cmd)
+    cached, seconds = build_verilog('mdct', filelist)
+    print("compiling mdct ... %s in %.3f s" %
+          ("cached" if cached else "built", seconds,))
 
     cmd = "vvp -m ./myhdl.vpi -lxt2 mdct"
     gcosim = myhdl.Cosimulation(cmd, 
@@ -51,7 +52,7 @@ def test_mdct(args=None):
     """
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=1, async=True)
+    reset = ResetSignal(1, active=1, isasync=True)
     
     datai = DataBus(w=8)
     datao = DataBus(w=12)
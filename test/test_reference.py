@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""This module tests the MyHDL-free software references"""
+
+import subprocess
+import sys
+
+import jpegenc.reference
+from jpegenc.subblocks.color_converters import ColorSpace
+from jpegenc.subblocks.dct.dct_2d import dct_2d_transformation
+from jpegenc.subblocks.zig_zag import zig_zag_scan
+from jpegenc.subblocks.frontend import frontend_transform
+from jpegenc.subblocks.backend.backend_soft import backend_ref
+
+
+def test_reference_imports():
+    """The software references and the software encoder must not
+    import MyHDL or the hardware blocks"""
+    code = ("import sys, jpegenc.reference, jpegenc.soft; "
+            "print(sorted(name for name in ('myhdl', 'rhea', "
+            "'jpegenc.subblocks') if name in sys.modules))")
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode().strip() == '[]'
+
+
+def test_reference_names():
+    """The hardware packages must use the same references"""
+    assert jpegenc.reference.ColorSpace is ColorSpace
+    assert jpegenc.reference.dct_2d_transformation is dct_2d_transformation
+    assert jpegenc.reference.zig_zag_scan is zig_zag_scan
+    assert jpegenc.reference.frontend_transform is frontend_transform
+    assert jpegenc.reference.backend_ref is backend_ref
+
+
+def test_subblocks_names():
+    """The hardware blocks must not be shadowed by the subpackages with
+    the same name when the subpackages are imported first"""
+    code = ("import types, jpegenc.subblocks.zig_zag, "
+            "jpegenc.subblocks.quantizer.quantizer; "
+            "from jpegenc.subblocks import zig_zag, quantizer; "
+            "from jpegenc.subblocks.zig_zag import zig_zag as block; "
+            "print(zig_zag is block, not any(isinstance(value, "
+            "types.ModuleType) for value in (zig_zag, quantizer)))")
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode().strip() == 'True True'
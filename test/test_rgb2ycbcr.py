@@ -3,6 +3,7 @@
 
 from random import randrange
 
+import numpy as np
 import pytest
 import myhdl
 from myhdl import (StopSimulation, block, Signal, ResetSignal, intbv,
@@ -84,7 +85,7 @@ def test_color_translation():
     rgb, ycbcr = RGB(pixel_bits), YCbCr(pixel_bits)
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     in_out_data = InputsAndOutputs(samples)
     in_out_data.initialize()
@@ -124,6 +125,36 @@ def test_color_translation():
     run_testbench(bench_color_trans)
 
 
+def test_color_translation_array():
+    """
+    In the current test are tested the outputs of the array
+    color space conversion with the outputs of the per-pixel
+    python color space conversion function
+    """
+    frame = np.random.randint(0, 256, size=(16, 24, 3)).astype(np.uint8)
+    # pixels which lie exactly on a rounding boundary
+    frame[0, :4] = [[0, 0, 1], [1, 1, 0], [0, 0, 255], [255, 255, 0]]
+
+    ycbcr = ColorSpace.get_jfif_ycbcr_array(frame)
+    assert ycbcr.shape == frame.shape
+    for pixel, out in zip(frame.reshape(-1, 3), ycbcr.reshape(-1, 3)):
+        expected = ColorSpace(*pixel.tolist()).get_jfif_ycbcr()[:, 0]
+        assert out.tolist() == expected.tolist()
+
+    # write in a caller supplied array
+    out = np.zeros(frame.shape, dtype=np.int16)
+    result = ColorSpace.get_jfif_ycbcr_array(frame, out=out)
+    assert result is out
+    assert np.array_equal(out, ycbcr)
+    # in chunks of a scratch buffer, the last chunk is partial
+    out[:] = 0
+    ColorSpace.get_jfif_ycbcr_array(frame, out=out, chunk_size=100)
+    assert np.array_equal(out, ycbcr)
+    with pytest.raises(ValueError):
+        ColorSpace.get_jfif_ycbcr_array(
+            frame, out=np.zeros((16, 48, 3), dtype=np.int16)[:, ::2])
+
+
 @pytest.mark.skipif(not simsok, reason="missing installed simulator")
 def test_block_conversion():
     """
@@ -137,7 +168,7 @@ def test_block_conversion():
     rgb, ycbcr = RGB(pixel_bits), YCbCr(pixel_bits)
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     in_out_data = InputsAndOutputs(samples)
     in_out_data.initialize()
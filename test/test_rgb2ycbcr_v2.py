@@ -83,7 +83,7 @@ def test_color_translation_v2():
     rgb, ycbcr = RGB(pixel_bits), YCbCr_v2(pixel_bits)
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     in_out_data = InputsAndOutputs(samples)
     in_out_data.initialize()
@@ -141,7 +141,7 @@ def test_color_translation_conversion_v2():
     rgb, ycbcr = RGB(pixel_bits), YCbCr_v2(pixel_bits)
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     in_out_data = InputsAndOutputs(samples)
     in_out_data.initialize()
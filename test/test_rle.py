@@ -74,7 +74,7 @@ def test_rle():
 
         # clock and reset signals
         clock = Signal(bool(0))
-        reset = ResetSignal(0, active=1, async=True)
+        reset = ResetSignal(0, active=1, isasync=True)
 
         # color component class
         component = Component()
@@ -215,7 +215,7 @@ def test_rle_conversion():
 
         # clock and reset signals
         clock = Signal(bool(0))
-        reset = ResetSignal(0, active=1, async=True)
+        reset = ResetSignal(0, active=1, isasync=True)
 
         # width of input data
         width_data = 12
@@ -96,7 +96,7 @@ def test_rle_core():
 
     # instantiation of clock and reset
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=1, async=True)
+    reset = ResetSignal(0, active=1, isasync=True)
 
     # instantiation of component select block
     component = Component()
@@ -223,7 +223,7 @@ def test_rle_conversion():
 
     # clock and reset instantiation
     clock = Signal(bool(0))
-    reset = ResetSignal(0, active=1, async=True)
+    reset = ResetSignal(0, active=1, isasync=True)
 
     # width of the input data
     width_data = 12
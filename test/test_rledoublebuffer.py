@@ -24,7 +24,7 @@ def test_doublebuffer():
 
         # instantiation of clock and reset
         clock = Signal(bool(0))
-        reset = ResetSignal(0, active=1, async=True)
+        reset = ResetSignal(0, active=1, isasync=True)
 
         # buffer selection port instantiation
         buffer_sel = Signal(bool(0))
@@ -174,7 +174,7 @@ def test_doublebuffer_conversion():
         """test bench for conversion"""
 
         clock = Signal(bool(0))
-        reset = ResetSignal(0, active=1, async=True)
+        reset = ResetSignal(0, active=1, isasync=True)
 
         buffer_sel = Signal(bool(0))
 
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""This module tests the command line interface of the software
+encoder"""
+
+import io
+import os
+
+import numpy as np
+from PIL import Image
+
+from jpegenc.soft import JPEGEncoder
+from jpegenc.soft.cli import main, find_images, encode_files, report
+
+test_images = os.path.join(os.path.dirname(__file__), 'test_images', 'color')
+
+
+def test_find_images():
+    """Directories and glob patterns must give the image files"""
+    filenames = find_images([test_images])
+    assert filenames and all(name.endswith('.png') for name in filenames)
+    assert find_images([os.path.join(test_images, 'small*.png')]) == [
+        name for name in filenames if 'small' in os.path.basename(name)]
+
+
+def test_encode_files(tmpdir):
+    """The files of the process pool must be the files of encode"""
+    filenames = find_images([os.path.join(test_images, 'small*.png')])[:2]
+    encoder = JPEGEncoder(quality=75)
+    results, seconds = encode_files(filenames, encoder, jobs=2,
+                                    output_dir=str(tmpdir))
+    for filename, result in zip(filenames, results):
+        image = np.asarray(Image.open(filename).convert('RGB'))
+        data = encoder.encode(image)
+        name = os.path.splitext(os.path.basename(filename))[0] + '.jpg'
+        assert tmpdir.join(name).read_binary() == data
+        assert result[:3] == (image.shape[1], image.shape[0], len(data))
+        assert sum(result[4].values()) <= result[3]
+
+    stream = io.StringIO()
+    report(filenames, results, seconds, stream)
+    output = stream.getvalue()
+    assert 'megapixels/s' in output and 'bpp' in output
+    for stage in ('color', 'dct', 'quantization', 'rle', 'huffman',
+                  'stuffing'):
+        assert stage in output
+
+
+def test_main(tmpdir, capsys):
+    """The jpegenc command"""
+    filename = os.path.join(test_images, 'small3.png')
+    assert main(['--quality', '90', '--output-dir', str(tmpdir),
+                 filename]) == 0
+    assert 'megapixels/s' in capsys.readouterr()[0]
+    assert tmpdir.join('small3.jpg').check()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""This module tests the software JPEG encoder"""
+
+import io
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from jpegenc.soft import JPEGEncoder, encode, encode_stream, quant_tables
+from jpegenc.soft import VLCTable, amplitude_tables, encoder_from_config
+from jpegenc.subblocks.frontend import frontend_transform_blocks
+from jpegenc.subblocks.backend.backend_soft import divider, entropy_encode
+
+test_image = os.path.join(os.path.dirname(__file__), 'test_images', 'color',
+                          'small1.png')
+
+
+def decode(data):
+    """Decode a JFIF file with PIL"""
+    return np.asarray(Image.open(io.BytesIO(data)).convert('RGB'))
+
+
+def psnr(image, decoded):
+    """Peak signal to noise ratio of the decoded image"""
+    mse = np.mean((image.astype(float) - decoded) ** 2)
+    return 10 * np.log10(255.0 ** 2 / mse)
+
+
+def test_transform():
+    """The quantized blocks of the 4:4:4 encoder must be the outputs
+    of the frontend and the divider software references"""
+    image = np.random.randint(0, 256, size=(16, 24, 3)).astype(np.uint8)
+    components = JPEGEncoder().transform(image)
+    expected = frontend_transform_blocks(image)
+    for index in range(3):
+        blocks = components[index].reshape(-1, 64)
+        for block, front_block in zip(blocks, expected[:, index]):
+            assert block.tolist() == divider(front_block.tolist(), 2 * index)
+
+
+@pytest.mark.parametrize('subsampling', ['4:4:4', '4:2:2', '4:2:0'])
+def test_encode(subsampling):
+    """The encoded images must be decodable"""
+    image = np.asarray(Image.open(test_image).convert('RGB'))
+    for quality in (50, 90):
+        data = encode(Image.open(test_image), quality, subsampling)
+        assert data[:2] == b'\xff\xd8' and data[-2:] == b'\xff\xd9'
+        decoded = decode(data)
+        assert decoded.shape == image.shape
+        assert psnr(image, decoded) > 25
+
+    # sizes which are not multiples of the MCU size
+    image = np.random.randint(0, 256, size=(13, 21, 3)).astype(np.uint8)
+    decoded = decode(encode(image, subsampling=subsampling,
+                            fixed_point=True))
+    assert decoded.shape == image.shape
+
+
+def test_quant_tables():
+    """Quality 50 uses the tables of the quantizer ROM"""
+    tables = quant_tables(50)
+    assert tables.shape == (2, 64)
+    assert tables[0, :3].tolist() == [16, 11, 10]
+    assert (quant_tables(100) == 1).all()
+    assert quant_tables(1).max() == 255
+    with pytest.raises(ValueError):
+        quant_tables(0)
+    with pytest.raises(ValueError):
+        JPEGEncoder(subsampling='4:1:1')
+
+
+def test_encode_parallel():
+    """The parallel encoder must give the same output as the serial"""
+    image = np.asarray(Image.open(test_image).convert('RGB'))
+    for subsampling, restart_interval in (('4:4:4', 5), ('4:2:0', 3)):
+        encoder = JPEGEncoder(subsampling=subsampling,
+                              restart_interval=restart_interval)
+        data = encoder.encode(image)
+        assert data.count(b'\xff\xdd') == 1
+        assert encoder.encode(image, workers=2) == data
+        assert psnr(image, decode(data)) > 25
+
+    # without restart intervals the image is encoded in this process
+    assert JPEGEncoder().encode(image, workers=2) == encode(image)
+
+    # the processes build their encoders from the config
+    encoder = JPEGEncoder(90, '4:2:2', restart_interval=7)
+    assert encoder_from_config(encoder.config).encode(image) == \
+        encoder.encode(image, workers=2)
+
+
+def test_encode_stream():
+    """The streaming encoder must give the same output as encode"""
+    image = np.random.randint(0, 256, size=(37, 29, 3)).astype(np.uint8)
+    for subsampling, restart_interval in (('4:4:4', 0), ('4:2:0', 2),
+                                          ('4:2:2', 3)):
+        encoder = JPEGEncoder(subsampling=subsampling,
+                              restart_interval=restart_interval)
+        chunks = list(encoder.encode_stream(iter(image), 29, 37))
+        assert len(chunks) == 2 + -(-37 // encoder.mcu_size[0])
+        assert b''.join(chunks) == encoder.encode(image)
+
+    scanlines = [row.tobytes() for row in image]
+    assert b''.join(encode_stream(scanlines, 29, 37)) == encode(image)
+    with pytest.raises(ValueError):
+        b''.join(encode_stream(scanlines[:-1], 29, 37))
+
+
+def test_vlc_tables():
+    """The lookup tables must give the codes of the huffman tables and
+    the amplitudes of entropy_encode"""
+    sizes, amplitude_bits = amplitude_tables()
+    for coeff in (-2047, -1024, -3, -1, 0, 1, 2, 255, 2047):
+        amplitude, size = entropy_encode(coeff)
+        assert sizes[coeff + 2047] == size
+        assert amplitude_bits[coeff + 2047] == amplitude & ((1 << size) - 1)
+
+    table = JPEGEncoder().huffman_tables[1]
+    vlc_table = VLCTable(table)
+    bits, nbits = vlc_table.packed(2, -5)
+    assert nbits == table.size[0x23] + 3
+    assert bits == (table.code[0x23] << 3) | 0b010
+    assert vlc_table.rom() == (tuple(table.size), tuple(table.code))
+
+
+def test_block_cache():
+    """The cached encoder must give the same output as the encoder
+    without cache"""
+    image = np.full((40, 67, 3), 240, dtype=np.uint8)
+    glyph = np.random.randint(0, 256, size=(8, 8, 3)).astype(np.uint8)
+    for col in range(0, 64, 8):
+        image[16:24, col:col + 8] = glyph
+    image[32:] = np.random.randint(0, 256, size=(8, 67, 3))
+    for subsampling, restart_interval in (('4:4:4', 0), ('4:2:0', 2)):
+        data = JPEGEncoder(subsampling=subsampling,
+                           restart_interval=restart_interval).encode(image)
+        encoder = JPEGEncoder(subsampling=subsampling,
+                              restart_interval=restart_interval,
+                              cache_size=4)
+        assert encoder.encode(image) == data
+        assert encoder.encode(image) == data
+        assert b''.join(encoder.encode_stream(iter(image), 67, 40)) == data
+        cache = encoder.block_cache
+        assert len(cache) == 4
+        assert cache.hits and cache.misses > 4
+
+    encoder = JPEGEncoder(cache_size=100)
+    encoder.encode(image)
+    # the distinct MCUs are looked up once, the flat and the glyph MCUs
+    # are coded once
+    assert encoder.block_cache.misses == 2 + 9 + 1
+    assert encoder.block_cache.hits == 0
+    encoder.encode(image)
+    assert encoder.block_cache.misses == 12
+    assert encoder.block_cache.hits == 12
+
+    def not_coded(*args):
+        raise AssertionError("a cached MCU was coded again")
+
+    # on a hit only the DC differences are coded, the packed AC codes
+    # are reused
+    data = JPEGEncoder().encode(image)
+    encoder.transform = encoder.symbols = not_coded
+    assert encoder.encode(image) == data
+    assert encoder.block_cache.hits == 24
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""This module tests the Motion-JPEG software encoder"""
+
+import struct
+
+import numpy as np
+
+from jpegenc.soft import (JPEGEncoder, read_raw_frames, write_mjpeg,
+                          write_avi)
+
+
+def raw_file(tmpdir, frames):
+    """Write the frames in a raw RGB24 file"""
+    filename = str(tmpdir.join('frames.rgb'))
+    frames.tofile(filename)
+    return filename
+
+
+def test_mjpeg(tmpdir):
+    """The stream must be the concatenation of the encoded frames"""
+    frames = np.random.randint(0, 256, size=(3, 16, 24, 3)).astype(np.uint8)
+    raw_frames = read_raw_frames(raw_file(tmpdir, frames), 24, 16)
+    assert isinstance(raw_frames, np.memmap)
+    assert np.array_equal(raw_frames, frames)
+
+    encoder = JPEGEncoder()
+    filename = str(tmpdir.join('frames.mjpeg'))
+    timings = write_mjpeg(raw_frames, filename, encoder)
+    assert len(timings) == 3
+    with open(filename, 'rb') as mjpeg_file:
+        data = mjpeg_file.read()
+    assert data == b''.join(encoder.encode(frame) for frame in frames)
+
+
+def test_avi(tmpdir):
+    """The AVI file must index each encoded frame"""
+    frames = np.random.randint(0, 256, size=(2, 16, 8, 3)).astype(np.uint8)
+    raw_frames = read_raw_frames(raw_file(tmpdir, frames), 8, 16)
+    encoder = JPEGEncoder()
+    filename = str(tmpdir.join('frames.avi'))
+    assert len(write_avi(raw_frames, filename, 30, encoder)) == 2
+    with open(filename, 'rb') as avi_file:
+        data = avi_file.read()
+
+    assert data[:4] == b'RIFF' and data[8:12] == b'AVI '
+    assert struct.unpack('<I', data[4:8])[0] == len(data) - 8
+    # the frames, width and height of the main header
+    assert struct.unpack('<I', data[48:52])[0] == 2
+    assert struct.unpack('<II', data[64:72]) == (8, 16)
+
+    movi = data.index(b'movi')
+    idx1 = data.index(b'idx1')
+    entries = data[idx1 + 8:]
+    assert len(entries) == 2 * 16
+    for i, frame in enumerate(frames):
+        fourcc, flags, offset, size = struct.unpack(
+            '<4sIII', entries[16 * i:16 * (i + 1)])
+        assert fourcc == b'00dc'
+        start = movi + offset + 8
+        assert data[start:start + size] == encoder.encode(frame)
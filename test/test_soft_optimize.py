@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""This module tests the optimal huffman tables"""
+
+import io
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from jpegenc.soft import (JPEGEncoder, SymbolStatistics, VLCTable, encode,
+                          optimal_huffman_table, optimize_huffman_tables,
+                          write_huffman_csv)
+from jpegenc.reference.tables import get_table
+from jpegenc.subblocks.backend.backend_soft import table_huff_gen, runlength
+
+test_image = os.path.join(os.path.dirname(__file__), 'test_images', 'color',
+                          'small1.png')
+
+
+def decode(data):
+    """Decode a JFIF file with PIL"""
+    return np.asarray(Image.open(io.BytesIO(data)).convert('RGB'))
+
+
+def test_optimal_huffman_table():
+    """The code lengths are limited to 16 bits and the codes are a
+    prefix code without the all 1s code"""
+    table = optimal_huffman_table([2**i for i in range(40)])
+    assert max(table.size) == 16
+    assert sum(table.bits) == 40
+    kraft = sum(2.0**-table.size[symbol] for symbol in table.huffval)
+    assert kraft < 1
+
+    table = optimal_huffman_table([5])
+    assert table.huffval == (0,) and table.size[0] == 1
+    assert table.code[0] == 0
+    assert optimal_huffman_table({0: 5}).bits == table.bits
+
+
+def test_empty_huffman_table():
+    """A table without symbols has no codes and the lookup of a
+    symbol without a code raises"""
+    for frequencies in ([0] * 256, {}):
+        table = optimal_huffman_table(frequencies)
+        assert table.bits == (0,) * 16 and table.huffval == ()
+        with pytest.raises(ValueError):
+            table.lookup(0)
+
+    table = optimal_huffman_table({3: 10, 0xf0: 1})
+    assert table.lookup(3) == (0, 1)
+    with pytest.raises(ValueError):
+        table.lookup(4)
+    with pytest.raises(ValueError):
+        VLCTable(table).packed(0, 100)
+
+
+def test_missing_symbols():
+    """The tables of a flat image cannot encode a random image"""
+    flat = np.full((16, 16, 3), 128, dtype=np.uint8)
+    tables = optimize_huffman_tables([flat])
+    image = np.random.randint(0, 256, size=(16, 16, 3)).astype(np.uint8)
+    encoder = JPEGEncoder(huffman_tables=tables)
+    assert decode(encoder.encode(flat)).shape == flat.shape
+    with pytest.raises(ValueError):
+        encoder.encode(image)
+
+
+def test_optimize_huffman_tables(tmpdir):
+    """The optimal tables give smaller files of the same image"""
+    image = Image.open(test_image)
+    for subsampling in ('4:4:4', '4:2:0'):
+        encoder = JPEGEncoder(subsampling=subsampling, restart_interval=4)
+        tables = optimize_huffman_tables([image], encoder)
+        data = encode(image, subsampling=subsampling, restart_interval=4)
+        optimized = JPEGEncoder(subsampling=subsampling, restart_interval=4,
+                                huffman_tables=tables).encode(image)
+        assert len(optimized) < len(data)
+        assert np.array_equal(decode(optimized), decode(data))
+
+    # the csv files are read by the ROM table builders
+    for table, base, rows in ((tables[0], 10, 16), (tables[1], 2, 256)):
+        csvfile = str(tmpdir.join('table_{}.csv'.format(base)))
+        write_huffman_csv(table, csvfile, base, rows)
+        rom_size, rom_code = table_huff_gen(csvfile, base)
+        assert list(rom_size) == table.size[:rows]
+        assert list(rom_code) == table.code[:rows]
+
+    # by default the csv files have the rows of the ROMs of the class
+    for table, base, table_class, rom in ((tables[0], 10, 0, 'dc_rom'),
+                                          (tables[1], 2, 1, 'ac_rom')):
+        csvfile = str(tmpdir.join('{}.csv'.format(rom)))
+        write_huffman_csv(table, csvfile, base, table_class=table_class)
+        rom_size = table_huff_gen(csvfile, base)[0]
+        assert len(rom_size) == len(get_table(rom)[0])
+
+
+def test_add_runlength():
+    """The symbols of the runlength reference are counted"""
+    block = [5] + [0] * 20 + [3, -1] + [0] * 41
+    output, accumulator = runlength(block, 0, 0, 0, 0)[:2]
+    statistics = SymbolStatistics()
+    statistics.add_runlength(output, accumulator, 0)
+    assert statistics.frequencies[0][3] == 1
+    assert statistics.frequencies[1][0xf0] == 1
+    assert statistics.frequencies[1][0x01] == 1
+    assert statistics.frequencies[1][0x00] == 1
+    assert sum(statistics.frequencies[2]) == 0
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""This module tests the asyncio encoding service"""
+
+import asyncio
+import io
+import json
+import os
+
+import numpy as np
+from PIL import Image
+
+from jpegenc.soft import JPEGEncoder
+from jpegenc.soft.server import (EncoderServer, request, REQUEST, RAW_RGB,
+                                 PNG, STATS, JPEG, ERROR)
+
+test_image = os.path.join(os.path.dirname(__file__), 'test_images', 'color',
+                          'small3.png')
+
+
+def test_server():
+    """The responses must be the outputs of the encoder"""
+    encoder = JPEGEncoder(quality=75)
+    images = [np.random.randint(0, 256, size=(9 + i, 17, 3)).astype(np.uint8)
+              for i in range(6)]
+    with open(test_image, 'rb') as png_file:
+        png = png_file.read()
+
+    async def client(port, image):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        response = await request(reader, writer, RAW_RGB, image.tobytes(),
+                                 image.shape[1], image.shape[0])
+        writer.close()
+        return response
+
+    async def run():
+        server = EncoderServer(encoder, workers=1, max_queue=2, batch_size=3,
+                               chunk_size=100)
+        tcp_server = await server.start()
+        port = tcp_server.sockets[0].getsockname()[1]
+        responses = await asyncio.gather(*[client(port, image)
+                                           for image in images])
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        png_response = await request(reader, writer, PNG, png)
+        error_response = await request(reader, writer, RAW_RGB, b'123', 2, 2)
+        stats_response = await request(reader, writer, STATS)
+
+        # a client which closes the connection in the middle of a request
+        _, aborted = await asyncio.open_connection('127.0.0.1', port)
+        aborted.write(REQUEST.pack(RAW_RGB, 4, 4, 48) + b'\0' * 10)
+        aborted.close()
+        assert (await request(reader, writer, RAW_RGB, images[0].tobytes(),
+                              17, 9)) == responses[0]
+        # a request which is encoded while the server is closed
+        _, pending = await asyncio.open_connection('127.0.0.1', port)
+        pending.write(REQUEST.pack(RAW_RGB, 17, 9, 17 * 9 * 3) +
+                      images[0].tobytes())
+        await pending.drain()
+        await asyncio.sleep(0.01)
+        # the open connections and the batches are closed with the server
+        await server.close()
+        stats = server.stats()
+        assert stats['connections'] == 0 and stats['in_flight'] == 0
+        # all_tasks and current_task of Python 3.7
+        all_tasks = (getattr(asyncio, 'all_tasks', None) or
+                     asyncio.Task.all_tasks)
+        current_task = (getattr(asyncio, 'current_task', None) or
+                        asyncio.Task.current_task)
+        assert [task for task in all_tasks() if not task.done()] == [
+            current_task()]
+        writer.close()
+        pending.close()
+        return responses, png_response, error_response, stats_response
+
+    loop = asyncio.new_event_loop()
+    try:
+        responses, png_response, error_response, stats_response = \
+            loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+    for image, response in zip(images, responses):
+        assert response == (JPEG, encoder.encode(image))
+    assert png_response == (JPEG, encoder.encode(Image.open(test_image)))
+    assert error_response[0] == ERROR
+    status, data = stats_response
+    stats = json.loads(data.decode())
+    assert status == STATS
+    assert stats['requests'] == 8 and stats['errors'] == 1
+    assert 1 < stats['batches'] < 7
+    assert stats['latency_ms']['p50'] <= stats['latency_ms']['p99']
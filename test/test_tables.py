@@ -0,0 +1,59 @@
+"""This module tests the cached ROM tables"""
+
+import os
+import pkgutil
+
+import pytest
+from myhdl import Signal, intbv
+
+from jpegenc.reference import tables
+from jpegenc.subblocks.common import get_table, get_table_array
+from jpegenc.subblocks.huffman.ac_rom import ac_rom
+from jpegenc.subblocks.backend.backend_soft import table_huff_gen
+
+
+def test_tables():
+    """The cached tables must match the tables built from the csv files"""
+    huffman_dir = os.path.join(os.path.dirname(__file__), '..', 'jpegenc',
+                               'subblocks', 'huffman')
+    for name, base in (('ac_rom', 2), ('ac_cr_rom', 2), ('dc_rom', 10),
+                       ('dc_cr_rom', 2)):
+        csvfile = os.path.join(huffman_dir, name + '.csv')
+        assert get_table(name) == table_huff_gen(csvfile, base)
+        assert get_table(name) is get_table(name)
+
+    quant_tables = get_table('quant_tables')
+    assert quant_tables[:3] == (16, 11, 10)
+    reciprocals = get_table('reciprocals')
+    assert len(reciprocals) == 256
+    assert reciprocals[1] == 65535 and reciprocals[2] == 32768
+
+    table_array = get_table_array('quant_tables')
+    assert table_array.tolist() == list(quant_tables)
+    with pytest.raises(ValueError):
+        table_array[0] = 1
+    with pytest.raises(KeyError):
+        get_table('unknown')
+
+
+def test_table_resources(tmpdir, monkeypatch):
+    """The ROMs must be read once from the package from any directory"""
+    monkeypatch.chdir(tmpdir)
+    for cache in ('_csv_resources', '_tables', '_table_arrays'):
+        monkeypatch.setattr(tables, cache, {})
+    resources = []
+
+    def get_data(package, resource):
+        resources.append((package, resource))
+        return get_data.original(package, resource)
+    get_data.original = pkgutil.get_data
+    monkeypatch.setattr(pkgutil, 'get_data', get_data)
+
+    clock = Signal(bool(0))
+    for _ in range(3):
+        ac_rom(clock, Signal(intbv(0)[4:]), Signal(intbv(0)[4:]),
+               Signal(intbv(0)[5:]), Signal(intbv(0)[16:]))
+    assert resources == [('jpegenc', 'subblocks/huffman/ac_rom.csv')]
+    assert get_table('quant_tables')[:3] == (16, 11, 10)
+    with pytest.raises(IOError):
+        tables.read_csv_resource('subblocks/huffman/missing.csv')
@@ -0,0 +1,116 @@
+"""This module tests the selective tracing of run_testbench"""
+
+import os
+
+import pytest
+from myhdl import (block, instance, always_seq, Signal, ResetSignal,
+                   StopSimulation, intbv, modbv)
+
+from jpegenc.testing import run_testbench, TraceConfig, hierarchy_signals
+from jpegenc.testing import clock_driver, pulse_reset
+
+
+@block
+def counter(clock, reset, count, valid):
+    """count the cycles, valid is high in the cycles 8 to 11"""
+
+    @always_seq(clock.posedge, reset=reset)
+    def beh():
+        count.next = count + 1
+        valid.next = 7 <= count < 11
+
+    return beh
+
+
+def make_bench():
+    clock = Signal(bool(0))
+    reset = ResetSignal(0, active=True, isasync=True)
+    counts = [Signal(modbv(0)[8:]) for _ in range(2)]
+    valids = [Signal(bool(0)) for _ in range(2)]
+    sums = [Signal(intbv(0, min=-8, max=8)) for _ in range(2)]
+
+    @block
+    def bench_trace():
+        insts = [counter(clock, reset, count, valid)
+                 for count, valid in zip(counts, valids)]
+        inst_clock = clock_driver(clock)
+
+        @instance
+        def tbstim():
+            yield pulse_reset(reset, clock)
+            for _ in range(20):
+                sums[0].next = -3
+                yield clock.posedge
+            raise StopSimulation
+
+        return insts, inst_clock, tbstim
+
+    return bench_trace
+
+
+def read_vcd(tmpdir):
+    """the variables and the times of the VCD file"""
+    vcd_dir = os.path.join(str(tmpdir), 'vcd')
+    with open(os.path.join(vcd_dir, os.listdir(vcd_dir)[0])) as vcdfile:
+        lines = vcdfile.read().splitlines()
+    variables = [line.split()[4] for line in lines if line.startswith('$var')]
+    times = [int(line[1:]) for line in lines if line.startswith('#')]
+    return variables, times, lines
+
+
+def test_hierarchy_signals():
+    """The hierarchical names of the signals and of the lists"""
+    names = list(hierarchy_signals(make_bench()()))
+    assert 'bench_trace.counter0.count' in names
+    assert 'bench_trace.counter1.valid' in names
+    assert 'bench_trace.sums[1]' in names
+
+
+def test_trace_selection(tmpdir):
+    """Only the selected signals are traced in the window"""
+    trace = TraceConfig(['*.counter1.*', '*.sums*'], start=100, stop=200)
+    run_testbench(make_bench(), trace=trace, directory=str(tmpdir))
+    variables, times, lines = read_vcd(tmpdir)
+    assert sorted(variables) == ['clock', 'count', 'reset', 'sums[0]',
+                                 'sums[1]', 'valid']
+    assert times[0] == 100 and max(times) < 200
+    # signed values are written in two's complement
+    codes = dict((line.split()[4], line.split()[3]) for line in lines
+                 if line.startswith('$var'))
+    assert 'b1101 ' + codes['sums[0]'] in lines
+
+
+def test_trace_trigger(tmpdir):
+    """The values are traced while the trigger is active"""
+    trace = TraceConfig('*.counter0.count',
+                        trigger='bench_trace.counter0.valid')
+    run_testbench(make_bench(), trace=trace, directory=str(tmpdir))
+    variables, times, lines = read_vcd(tmpdir)
+    assert variables == ['count']
+    counts = [int(line[1:].split()[0], 2) for line in lines
+              if line.startswith('b')]
+    assert counts == [8, 9, 10, 11]
+    assert times == list(range(times[0], times[0] + 40, 10))
+
+    with pytest.raises(ValueError):
+        run_testbench(make_bench(), trace=TraceConfig('*.nothing'),
+                      directory=str(tmpdir))
+    with pytest.raises(ValueError):
+        run_testbench(make_bench(), trace=TraceConfig(scope='bench_trace.x'),
+                      directory=str(tmpdir))
+    with pytest.raises(ValueError):
+        TraceConfig(start=10, stop=5)
+
+
+def test_trace_scope(tmpdir):
+    """The names and the trigger are relative to the scope"""
+    trace = TraceConfig('count', trigger='valid',
+                        scope='bench_trace.counter1')
+    run_testbench(make_bench(), trace=trace, directory=str(tmpdir))
+    variables, times, lines = read_vcd(tmpdir)
+    assert variables == ['count']
+    scopes = [line.split()[2] for line in lines if line.startswith('$scope')]
+    assert scopes == ['bench_trace', 'counter1']
+    counts = [int(line[1:].split()[0], 2) for line in lines
+              if line.startswith('b')]
+    assert counts == [8, 9, 10, 11]
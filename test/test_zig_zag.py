@@ -11,6 +11,7 @@ from myhdl.conversion import verify
 
 from jpegenc.subblocks.common import outputs_2d, assign_array
 from jpegenc.subblocks.zig_zag import zig_zag_scan, zig_zag
+from jpegenc.subblocks.zig_zag import zig_zag_blocks, inverse_zig_zag_blocks
 from jpegenc.testing import sim_available, run_testbench
 from jpegenc.testing import clock_driver, reset_on_start, pulse_reset
 
@@ -82,7 +83,7 @@ def test_zig_zag():
     samples, output_bits, N = 5, 10, 8
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     inputs = outputs_2d(output_bits, N)
     outputs = outputs_2d(output_bits, N)
@@ -123,6 +124,22 @@ def test_zig_zag():
     run_testbench(bench_zig_zag)
 
 
+def test_zig_zag_blocks():
+    """Batched zig-zag software reference test
+
+    The batched zig-zag must give the same outputs as the per-block
+    software reference and the inverse must restore the blocks
+    """
+    samples = 20
+    for N in (4, 8):
+        zig_zag_obj = zig_zag_scan(N)
+        blocks = np.random.randint(-512, 512, size=(samples, N**2))
+        outputs = zig_zag_blocks(blocks, N)
+        for block, output in zip(blocks, outputs):
+            assert output.tolist() == zig_zag_obj.zig_zag(block.tolist())
+        assert np.array_equal(inverse_zig_zag_blocks(outputs, N), blocks)
+
+
 @pytest.mark.skipif(not simsok, reason="missing installed simulator")
 def test_zig_zag_conversion():
     """Convertible Zig Zag Module Test
@@ -133,7 +150,7 @@ def test_zig_zag_conversion():
     samples, output_bits, N = 5, 10, 8
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     inputs = outputs_2d(output_bits, N)
     outputs = outputs_2d(output_bits, N)
@@ -144,7 +161,7 @@ def test_zig_zag_conversion():
     inputs_rom, expected_outputs_rom = in_out_data.get_rom_tables()
 
     clock = Signal(bool(0))
-    reset = ResetSignal(1, active=True, async=True)
+    reset = ResetSignal(1, active=True, isasync=True)
 
     @block
     def bench_zig_zag():